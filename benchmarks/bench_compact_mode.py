@@ -0,0 +1,142 @@
+"""Benchmark: entity count, setup time and memory in default vs compact mode.
+
+Runs every platform's ``async_setup_entry`` for a simulated fleet and
+evaluates the state of each entity that Home Assistant would add. Entities
+disabled by default are only registered; like Home Assistant, the benchmark
+drops them, so the memory held covers the added entities only.
+
+    python benchmarks/bench_compact_mode.py --vehicles 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_value_extraction import sample_status  # noqa: E402
+from homeassistant.util.unit_system import METRIC_SYSTEM  # noqa: E402
+
+from custom_components.zeekr_ev import (  # noqa: E402
+    binary_sensor,
+    button,
+    climate,
+    cover,
+    device_tracker,
+    lock,
+    number,
+    select,
+    sensor,
+    switch,
+)
+from custom_components.zeekr_ev.const import DOMAIN  # noqa: E402
+from custom_components.zeekr_ev.optimistic import OptimisticOverlay  # noqa: E402
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot  # noqa: E402
+from custom_components.zeekr_ev.watchdog import ZeekrWatchdog  # noqa: E402
+
+PLATFORMS = (binary_sensor, button, climate, cover, device_tracker, lock, number, select, sensor, switch)
+ENTRY_ID = "bench"
+
+
+class FleetCoordinator:
+    """The parts of ZeekrCoordinator the platforms read during setup."""
+
+    def __init__(self, vehicles: int, compact_mode: bool) -> None:
+        statuses = {f"VIN{i:014d}": sample_status(i) for i in range(vehicles)}
+        self.data = {vin: VehicleSnapshot.from_status(raw) for vin, raw in statuses.items()}
+        self.vehicles = {vin: SimpleNamespace(vin=vin, data={}) for vin in statuses}
+        self.compact_mode = compact_mode
+        self.overlay = OptimisticOverlay()
+        self.generation = 1
+        self.value_cache_hits = 0
+        self.value_cache_misses = 0
+        self.last_update_success = True
+        self.latest_poll_time = None
+        self.client = None
+        self.seat_duration = self.ac_duration = self.steering_wheel_duration = 15
+        self.request_stats = SimpleNamespace(
+            api_requests_today=0, api_invokes_today=0, api_requests_total=0, api_invokes_total=0
+        )
+        self.watchdog = ZeekrWatchdog()
+
+    def get_vehicle_by_vin(self, vin: str):
+        return self.vehicles.get(vin)
+
+    def supports(self, vin: str, capability: str | None) -> bool:
+        # The sample status reports every optional feature
+        return True
+
+    def get_snapshot(self, vin: str) -> VehicleSnapshot | None:
+        return self.overlay.apply(vin, self.data.get(vin))
+
+
+async def set_up(coordinator: FleetCoordinator) -> tuple[list, int]:
+    """Set up every platform; return the added entities and the registered count.
+
+    Like Home Assistant, only enabled entities are kept: disabled ones are
+    registered and then dropped.
+    """
+    hass = SimpleNamespace(
+        data={DOMAIN: {ENTRY_ID: coordinator}},
+        config=SimpleNamespace(units=METRIC_SYSTEM),
+    )
+    entry = SimpleNamespace(entry_id=ENTRY_ID, data={}, async_on_unload=lambda func: None)
+    added: list = []
+    registered = 0
+
+    def async_add_entities(new_entities) -> None:
+        nonlocal registered
+        for entity in new_entities:
+            registered += 1
+            if entity.entity_registry_enabled_default:
+                entity.hass = hass
+                added.append(entity)
+
+    for platform in PLATFORMS:
+        await platform.async_setup_entry(hass, entry, async_add_entities)
+    return added, registered
+
+
+def run(vehicles: int, compact_mode: bool) -> None:
+    coordinator = FleetCoordinator(vehicles, compact_mode)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    entities, registered = asyncio.run(set_up(coordinator))
+    setup = time.perf_counter() - start
+    start = time.perf_counter()
+    states = [(e.state, e.extra_state_attributes) for e in entities]
+    evaluate = time.perf_counter() - start
+    del states
+    gc.collect()
+    # The added entities and their cached values
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    label = "compact" if compact_mode else "default"
+    print(
+        f"  {label:<8} {registered:10d} {len(entities):8d} {setup * 1000:10.1f} "
+        f"{evaluate * 1000:10.1f} {held / 1024:10.0f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{args.vehicles} vehicles")
+    print(f"  {'mode':<8} {'registered':>10} {'added':>8} {'setup ms':>10} {'state ms':>10} {'KiB held':>10}")
+    for compact_mode in (False, True):
+        run(args.vehicles, compact_mode)
+
+
+if __name__ == "__main__":
+    main()
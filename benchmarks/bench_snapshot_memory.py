@@ -0,0 +1,60 @@
+"""Micro-benchmark: memory held per vehicle by raw responses vs snapshots.
+
+Measures what the coordinator keeps between updates for a fleet, with and
+without raw retention, and the cost of serializing each form.
+
+    python benchmarks/bench_snapshot_memory.py --vehicles 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_value_extraction import sample_status  # noqa: E402
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot  # noqa: E402
+
+
+def _allocated(build):
+    """Return the object built by `build` and the bytes it still holds."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    vins = [f"VIN{i:014d}" for i in range(args.vehicles)]
+    raw, raw_bytes = _allocated(lambda: {vin: sample_status(i) for i, vin in enumerate(vins)})
+    snapshots, snapshot_bytes = _allocated(
+        lambda: {vin: VehicleSnapshot.from_status(data) for vin, data in raw.items()}
+    )
+
+    print(f"{args.vehicles} vehicles, memory kept between updates")
+    print(f"  {'raw responses':<24} {raw_bytes / args.vehicles:10.0f} bytes per vehicle")
+    print(f"  {'snapshots':<24} {snapshot_bytes / args.vehicles:10.0f} bytes per vehicle")
+
+    for label, func in (
+        ("raw json.dumps", lambda: json.dumps(raw)),
+        ("snapshot json.dumps", lambda: json.dumps({vin: s.as_dict() for vin, s in snapshots.items()})),
+    ):
+        best = min(timeit.repeat(func, number=args.repeat, repeat=5)) / args.repeat
+        print(f"  {label:<24} {best * 1000:10.3f} ms per fleet")
+
+
+if __name__ == "__main__":
+    main()
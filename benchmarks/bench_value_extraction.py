@@ -0,0 +1,183 @@
+"""Micro-benchmark: entity value extraction across a fleet of vehicles.
+
+Compares the old per-VIN lambda closures that walk the raw API dict with the
+shared entity descriptions reading a parsed VehicleSnapshot. The snapshot
+numbers include parsing every vehicle once, as the coordinator does per
+update.
+
+``--reads`` is how often each entity reads its value per update. Home
+Assistant's state calculation reads it once per write; the filtered sensors
+read it once more to decide whether to write. Walking the raw dict is paid
+on every read, parsing once per update, so the snapshot path is slower at a
+single read and breaks even at about two.
+
+    python benchmarks/bench_value_extraction.py --vehicles 100 --reads 2
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.zeekr_ev.binary_sensor import (  # noqa: E402
+    BINARY_SENSOR_DESCRIPTIONS,
+)
+from custom_components.zeekr_ev.lock import LOCK_DESCRIPTIONS  # noqa: E402
+from custom_components.zeekr_ev.sensor import (  # noqa: E402
+    CHARGING_SENSOR_DESCRIPTIONS,
+    SENSOR_DESCRIPTIONS,
+)
+from custom_components.zeekr_ev.snapshot import POSITIONS, VehicleSnapshot  # noqa: E402
+from custom_components.zeekr_ev.switch import SWITCH_DESCRIPTIONS  # noqa: E402
+
+DESCRIPTIONS = (
+    *SENSOR_DESCRIPTIONS,
+    *CHARGING_SENSOR_DESCRIPTIONS,
+    *BINARY_SENSOR_DESCRIPTIONS,
+    *LOCK_DESCRIPTIONS.values(),
+    *SWITCH_DESCRIPTIONS.values(),
+)
+
+
+def sample_status(index: int) -> dict:
+    """A realistic get_status response, values as strings like the API."""
+    return {
+        "basicVehicleStatus": {
+            "position": {"latitude": f"{52 + index / 1000}", "longitude": "13.4"}
+        },
+        "additionalVehicleStatus": {
+            "electricVehicleStatus": {
+                "chargeLevel": str(50 + index % 50),
+                "distanceToEmptyOnBatteryOnly": "312",
+                "chargerState": "1",
+                "statusOfChargerConnection": "1",
+                "chargeLidDcAcStatus": "2",
+            },
+            "maintenanceStatus": {
+                "odometer": "12345.6",
+                **{f"tyreStatus{tire}": "250.0" for tire in POSITIONS},
+                **{f"tyreTemp{tire}": "21" for tire in POSITIONS},
+                **{f"tyrePreWarning{tire}": "0" for tire in POSITIONS},
+                **{f"tyreTempWarning{tire}": "0" for tire in POSITIONS},
+            },
+            "drivingSafetyStatus": {
+                "centralLockingStatus": "1",
+                **{f"doorLockStatus{door}": "1" for door in POSITIONS},
+                **{f"doorOpenStatus{door}": "0" for door in POSITIONS},
+                "trunkLockStatus": "1",
+                "trunkOpenStatus": "0",
+                "engineHoodOpenStatus": "0",
+                "electricParkBrakeStatus": "1",
+            },
+            "climateStatus": {
+                "interiorTemp": "21.5",
+                "preClimateActive": "false",
+                "defrost": "0",
+                "steerWhlHeatingSts": "2",
+            },
+            "remoteControlState": {"vstdModeState": "0"},
+        },
+        "chargingStatus": {
+            "chargeVoltage": "398.0",
+            "chargeCurrent": "16.0",
+            "chargePower": "6.4",
+            "chargeSpeed": "40",
+        },
+        "chargingLimit": {"soc": "800"},
+    }
+
+
+def _flag(value, on="1"):
+    return None if value is None else str(value) == on
+
+
+def legacy_value_fns() -> list:
+    """The closures the platforms used to build, one set per vehicle."""
+    fns = [
+        lambda d: d.get("additionalVehicleStatus", {}).get("electricVehicleStatus", {}).get("chargeLevel"),
+        lambda d: d.get("additionalVehicleStatus", {}).get("electricVehicleStatus", {}).get("distanceToEmptyOnBatteryOnly"),
+        lambda d: d.get("additionalVehicleStatus", {}).get("maintenanceStatus", {}).get("odometer"),
+        lambda d: d.get("additionalVehicleStatus", {}).get("climateStatus", {}).get("interiorTemp"),
+        lambda d: d.get("chargingStatus", {}).get("chargeVoltage"),
+        lambda d: d.get("chargingStatus", {}).get("chargeCurrent"),
+        lambda d: d.get("chargingStatus", {}).get("chargePower"),
+        lambda d: d.get("chargingStatus", {}).get("chargeSpeed"),
+        lambda d: int(d.get("additionalVehicleStatus", {}).get("electricVehicleStatus", {}).get("chargerState", "0")),
+        lambda d: int(d.get("additionalVehicleStatus", {}).get("electricVehicleStatus", {}).get("statusOfChargerConnection")),
+    ]
+    for tire in POSITIONS:
+        fns += [
+            lambda d, t=tire: d.get("additionalVehicleStatus", {}).get("maintenanceStatus", {}).get(f"tyreStatus{t}"),
+            lambda d, t=tire: d.get("additionalVehicleStatus", {}).get("maintenanceStatus", {}).get(f"tyreTemp{t}"),
+            lambda d, t=tire: _flag(d.get("additionalVehicleStatus", {}).get("maintenanceStatus", {}).get(f"tyrePreWarning{t}"), "1"),
+            lambda d, t=tire: _flag(d.get("additionalVehicleStatus", {}).get("maintenanceStatus", {}).get(f"tyreTempWarning{t}"), "1"),
+            lambda d, t=tire: _flag(d.get("additionalVehicleStatus", {}).get("drivingSafetyStatus", {}).get(f"doorOpenStatus{t}")),
+            lambda d, t=tire: _flag(d.get("additionalVehicleStatus", {}).get("drivingSafetyStatus", {}).get(f"doorLockStatus{t}")),
+        ]
+    for field in ("centralLockingStatus", "trunkLockStatus", "electricParkBrakeStatus", "trunkOpenStatus", "engineHoodOpenStatus"):
+        fns.append(
+            lambda d, f=field: _flag(d.get("additionalVehicleStatus", {}).get("drivingSafetyStatus", {}).get(f))
+        )
+    for group, key in (("climateStatus", "defrost"), ("climateStatus", "steerWhlHeatingSts"), ("remoteControlState", "vstdModeState")):
+        fns.append(
+            lambda d, g=group, k=key: _flag(d.get("additionalVehicleStatus", {}).get(g, {}).get(k))
+        )
+    return fns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vehicles", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--reads", type=int, default=1, help="value reads per entity per update")
+    args = parser.parse_args()
+
+    raw = {f"VIN{i:014d}": sample_status(i) for i in range(args.vehicles)}
+    # The old platforms created a fresh closure per entity per vehicle
+    legacy = {vin: legacy_value_fns() for vin in raw}
+
+    reads = range(args.reads)
+
+    def run_legacy() -> None:
+        for vin, fns in legacy.items():
+            data = raw[vin]
+            for fn in fns:
+                for _ in reads:
+                    fn(data)
+
+    def run_descriptions() -> None:
+        snapshots = {vin: VehicleSnapshot.from_status(data) for vin, data in raw.items()}
+        for snapshot in snapshots.values():
+            for description in DESCRIPTIONS:
+                for _ in reads:
+                    description.value_fn(snapshot)
+
+    snapshots = {vin: VehicleSnapshot.from_status(data) for vin, data in raw.items()}
+
+    def run_reads_only() -> None:
+        for snapshot in snapshots.values():
+            for description in DESCRIPTIONS:
+                for _ in reads:
+                    description.value_fn(snapshot)
+
+    per_vehicle = len(legacy_value_fns())
+    print(
+        f"{args.vehicles} vehicles, {per_vehicle} legacy closures and "
+        f"{len(DESCRIPTIONS)} descriptions per vehicle, {args.reads} read(s) each, "
+        f"best of 5 x {args.repeat}"
+    )
+    for label, func in (
+        ("legacy closures on raw dicts", run_legacy),
+        ("parse + description reads", run_descriptions),
+        ("description reads only", run_reads_only),
+    ):
+        best = min(timeit.repeat(func, number=args.repeat, repeat=5)) / args.repeat
+        print(f"  {label:<30} {best * 1000:8.3f} ms per update")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,16 @@ For more details about this integration, please refer to
 https://github.com/Fryyyyy/zeekr_homeassistant
 """
 
+import asyncio
 import logging
 import importlib
+from functools import partial
+from typing import Any, Mapping
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -23,15 +27,39 @@ from .const import (
     CONF_VIN_KEY,
     CONF_COUNTRY_CODE,
     CONF_USE_LOCAL_API,
+    CONF_METRICS_ENDPOINT,
+    CONF_COMPACT_MODE,
+    CONF_API_TIMEOUT,
+    DEFAULT_API_TIMEOUT,
     DOMAIN,
     PLATFORMS,
     STARTUP_MESSAGE,
 )
-from .coordinator import ZeekrCoordinator
+from .accounts import async_get_account, async_release_account
+from .capabilities import async_remove_capabilities
+from .coordinator import ZeekrCoordinator, is_auth_error
+from .metrics import async_register_metrics_view
 from .request_stats import ZeekrRequestStats
+from .services import async_setup_services
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Options that need a new login or a different set of entities; all other
+# options are applied to the running coordinator
+RELOAD_OPTIONS = (
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_COUNTRY_CODE,
+    CONF_HMAC_ACCESS_KEY,
+    CONF_HMAC_SECRET_KEY,
+    CONF_PASSWORD_PUBLIC_KEY,
+    CONF_PROD_SECRET,
+    CONF_VIN_KEY,
+    CONF_VIN_IV,
+    CONF_USE_LOCAL_API,
+    CONF_COMPACT_MODE,
+)
+
 
 def get_zeekr_client_class(use_local: bool = False):
     """Dynamically import ZeekrClient from local or installed package."""
@@ -61,6 +89,7 @@ def get_zeekr_client_class(use_local: bool = False):
 
 async def async_setup(hass: HomeAssistant, config: ConfigType):
     """Set up this integration using YAML is not supported."""
+    await async_setup_services(hass)
     return True
 
 
@@ -95,50 +124,70 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         _LOGGER.error("Failed to import zeekr_ev_api: %s", ex)
         raise ConfigEntryNotReady from ex
 
-    # Try to reuse client from config flow to avoid duplicate login
-    client = hass.data.get(DOMAIN, {}).pop("_temp_client", None)
-
-    if client is None or not client.logged_in:
-        client = ZeekrClient(
-            username=username,
-            password=password,
-            country_code=country_code,
-            hmac_access_key=hmac_access_key,
-            hmac_secret_key=hmac_secret_key,
-            password_public_key=password_public_key,
-            prod_secret=prod_secret,
-            vin_key=vin_key,
-            vin_iv=vin_iv,
-            logger=_LOGGER,
-        )
-        try:
-            # Count the login request
-            stats = ZeekrRequestStats(hass)
-            await stats.async_load()
-            await stats.async_inc_request()
-            await hass.async_add_executor_job(client.login)
-        except Exception as ex:
-            _LOGGER.error("Could not log in to Zeekr API: %s", ex)
-            raise ConfigEntryNotReady from ex
-
-    coordinator = ZeekrCoordinator(hass, client=client, entry=entry)
-    await coordinator.async_init_stats()
-    await coordinator.async_config_entry_first_refresh()
+    # Entries of the same account share its client, and their coordinators
+    # follow the data of the first one
+    account = async_get_account(hass, entry.data)
+    async with account.lock:
+        # Reuse the account's client or the one from the config flow to
+        # avoid duplicate logins
+        temp_client = hass.data[DOMAIN].pop("_temp_client", None)
+        client = account.client or temp_client
+
+        if client is None or not client.logged_in:
+            client = ZeekrClient(
+                username=username,
+                password=password,
+                country_code=country_code,
+                hmac_access_key=hmac_access_key,
+                hmac_secret_key=hmac_secret_key,
+                password_public_key=password_public_key,
+                prod_secret=prod_secret,
+                vin_key=vin_key,
+                vin_iv=vin_iv,
+                logger=_LOGGER,
+            )
+            try:
+                # Count the login request
+                stats = ZeekrRequestStats(hass)
+                await stats.async_load()
+                await stats.async_inc_request()
+                # Logins get twice the API timeout, as in the coordinator
+                async with asyncio.timeout(
+                    2 * entry.data.get(CONF_API_TIMEOUT, DEFAULT_API_TIMEOUT)
+                ):
+                    await hass.async_add_executor_job(client.login)
+            except Exception as ex:
+                if is_auth_error(ex):
+                    raise ConfigEntryAuthFailed(f"Zeekr login failed: {ex}") from ex
+                _LOGGER.error("Could not log in to Zeekr API: %s", ex)
+                raise ConfigEntryNotReady from ex
+        account.client = client
+
+        coordinator = ZeekrCoordinator(hass, client=client, entry=entry)
+        await coordinator.async_init_stats()
+        entry.async_on_unload(coordinator.async_setup_fetch_plan())
+        entry.async_on_unload(coordinator.scheduler.async_register(entry.entry_id))
+        account.async_add(entry.entry_id, coordinator)
+        entry.async_on_unload(partial(async_release_account, hass, entry.entry_id))
+        await coordinator.async_config_entry_first_refresh()
 
     if coordinator.vehicles:
         _LOGGER.info(
             "Found %d vehicle(s): %s",
             len(coordinator.vehicles),
-            ", ".join(v.vin for v in coordinator.vehicles),
+            ", ".join(coordinator.vehicles),
         )
     else:
         _LOGGER.warning("No vehicles found in account")
 
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    if entry.data.get(CONF_METRICS_ENDPOINT, False):
+        async_register_metrics_view(hass)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     return True
 
 
@@ -153,7 +202,35 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unloaded
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete data stored for a removed entry."""
+    await async_remove_capabilities(hass, entry.entry_id)
+
+
+async def async_remove_config_entry_device(
+    hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
+) -> bool:
+    """Allow removing a vehicle device once the account no longer has it."""
+    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    vins = set(coordinator.data or {}) if coordinator else set()
+    return not any(
+        domain == DOMAIN and ident in vins for domain, ident in device.identifiers
+    )
+
+
+def needs_reload(old: Mapping[str, Any], new: Mapping[str, Any]) -> bool:
+    """Return whether changed entry data needs the entry to be reloaded."""
+    # Missing options and their empty defaults are the same
+    return any((old.get(key) or None) != (new.get(key) or None) for key in RELOAD_OPTIONS)
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options, reloading the entry only when it has to."""
+    coordinator: ZeekrCoordinator | None = hass.data[DOMAIN].get(entry.entry_id)
+    if coordinator is None or needs_reload(coordinator.entry_data, entry.data):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    coordinator.async_apply_options(entry.data)
+    if entry.data.get(CONF_METRICS_ENDPOINT, False):
+        async_register_metrics_view(hass)
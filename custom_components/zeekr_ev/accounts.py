@@ -0,0 +1,97 @@
+"""Zeekr accounts shared by several config entries.
+
+Per-site setups add the same account more than once. Every entry used to
+log in with its own client and poll the same vehicles. Entries of the same
+account (username and region) now share one logged-in client, and only the
+coordinator of the first entry polls; the coordinators of the other entries
+follow its data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Mapping
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CONF_COUNTRY_CODE, CONF_USERNAME, DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import ZeekrCoordinator
+
+DATA_ACCOUNTS = "_accounts"
+
+
+def account_key(data: Mapping[str, Any]) -> tuple[str, str]:
+    """Return the account of a config entry's data."""
+    return (
+        str(data.get(CONF_USERNAME) or "").casefold(),
+        data.get(CONF_COUNTRY_CODE) or "",
+    )
+
+
+class ZeekrAccount:
+    """The shared client and the coordinators of an account's entries."""
+
+    def __init__(self) -> None:
+        # Held while an entry logs in and fetches its first data, so entries
+        # set up at the same time find the client and the data of the first
+        self.lock = asyncio.Lock()
+        self.client: Any = None
+        # entry_id -> coordinator, in setup order; the first one polls
+        self.coordinators: dict[str, ZeekrCoordinator] = {}
+
+    @property
+    def feed(self) -> ZeekrCoordinator | None:
+        """Return the coordinator that polls for the account."""
+        return next(iter(self.coordinators.values()), None)
+
+    @callback
+    def async_add(self, entry_id: str, coordinator: ZeekrCoordinator) -> None:
+        """Add an entry's coordinator, following the polling one if any."""
+        feed = self.feed
+        self.coordinators[entry_id] = coordinator
+        if feed is not None:
+            coordinator.async_follow(feed)
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Remove an entry's coordinator; the next one takes over polling."""
+        previous_feed = self.feed
+        coordinator = self.coordinators.pop(entry_id, None)
+        if coordinator is None:
+            return
+        coordinator.async_follow(None)
+        feed = self.feed
+        if coordinator is not previous_feed or feed is None:
+            return
+        feed.async_follow(None)
+        for follower in list(self.coordinators.values())[1:]:
+            follower.async_follow(feed)
+        feed.hass.async_create_task(feed.async_request_refresh())
+
+
+@callback
+def async_get_account(hass: HomeAssistant, data: Mapping[str, Any]) -> ZeekrAccount:
+    """Return the account of a config entry's data, creating it if needed."""
+    accounts: dict[tuple[str, str], ZeekrAccount] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_ACCOUNTS, {})
+    return accounts.setdefault(account_key(data), ZeekrAccount())
+
+
+@callback
+def async_release_account(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove an entry from its account, dropping the account after the last one.
+
+    The account is looked up by entry, as the entry's data may already hold
+    new credentials.
+    """
+    accounts: dict[tuple[str, str], ZeekrAccount] = hass.data.get(DOMAIN, {}).get(
+        DATA_ACCOUNTS, {}
+    )
+    for key, account in list(accounts.items()):
+        if entry_id in account.coordinators:
+            account.async_remove(entry_id)
+            if not account.coordinators:
+                del accounts[key]
@@ -2,56 +2,123 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from operator import attrgetter
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import (
+    ZeekrEntityDescription,
+    ZeekrVehicleEntity,
+    async_setup_vehicle_entities,
+    attributes_getter,
+    vehicle_descriptions,
+)
+from .snapshot import POSITIONS, VehicleSnapshot
+
+
+@dataclass(frozen=True, kw_only=True)
+class ZeekrBinarySensorEntityDescription(
+    ZeekrEntityDescription, BinarySensorEntityDescription
+):
+    """Describes a Zeekr vehicle binary sensor."""
+
+
+# Door open sensors from drivingSafetyStatus: key -> label
+DOOR_FIELDS = {
+    "door_open_driver": "Driver door open",
+    "door_open_passenger": "Passenger door open",
+    "door_open_driver_rear": "Driver rear door open",
+    "door_open_passenger_rear": "Passenger rear door open",
+    "trunk_open": "Trunk open",
+    "hood_open": "Hood open",
+}
+
+BINARY_SENSOR_DESCRIPTIONS: tuple[ZeekrBinarySensorEntityDescription, ...] = (
+    ZeekrBinarySensorEntityDescription(
+        key="charging_status",
+        name="Charging Status",
+        value_fn=attrgetter("charger_active"),
+        device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
+    ),
+    ZeekrBinarySensorEntityDescription(
+        key="plugged_in",
+        name="Plugged In",
+        value_fn=attrgetter("plugged_in"),
+        device_class=BinarySensorDeviceClass.PLUG,
+    ),
+    *(
+        ZeekrBinarySensorEntityDescription(
+            key=key,
+            name=label,
+            value_fn=attrgetter(key),
+            device_class=BinarySensorDeviceClass.DOOR,
+            grouped=True,
+        )
+        for key, label in DOOR_FIELDS.items()
+    ),
+    # Tire Pre-Warning & Temp Warning
+    *(
+        description
+        for tire, suffix in POSITIONS.items()
+        for description in (
+            ZeekrBinarySensorEntityDescription(
+                key=f"tire_pre_warning_{tire.lower()}",
+                name=f"Tire Pre-Warning {tire}",
+                value_fn=attrgetter(f"tyre_pre_warning_{suffix}"),
+                device_class=BinarySensorDeviceClass.PROBLEM,
+                grouped=True,
+            ),
+            ZeekrBinarySensorEntityDescription(
+                key=f"tire_temp_warning_{tire.lower()}",
+                name=f"Tire Temp Warning {tire}",
+                value_fn=attrgetter(f"tyre_temp_warning_{suffix}"),
+                device_class=BinarySensorDeviceClass.PROBLEM,
+                grouped=True,
+            ),
+        )
+    ),
+)
+
 
+_doors_open = attrgetter(*DOOR_FIELDS)
 
-class ZeekrBinarySensor(CoordinatorEntity, BinarySensorEntity):
+
+def _any_door_open(snapshot: VehicleSnapshot) -> bool | None:
+    states = [state for state in _doors_open(snapshot) if state is not None]
+    return any(states) if states else None
+
+
+# Grouped entities only added in compact mode
+COMPACT_BINARY_SENSOR_DESCRIPTIONS: tuple[ZeekrBinarySensorEntityDescription, ...] = (
+    ZeekrBinarySensorEntityDescription(
+        key="doors",
+        name="Doors",
+        value_fn=_any_door_open,
+        attributes_fn=attributes_getter({key: key for key in DOOR_FIELDS}),
+        device_class=BinarySensorDeviceClass.DOOR,
+    ),
+)
+
+
+class ZeekrBinarySensor(ZeekrVehicleEntity, BinarySensorEntity):
     """Zeekr Binary Sensor class."""
 
-    def __init__(
-        self,
-        coordinator: ZeekrCoordinator,
-        vin: str,
-        key: str,
-        name: str,
-        value_fn,
-        device_class: BinarySensorDeviceClass | None = None,
-    ) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self.vin = vin
-        self.key = key
-        self._attr_name = f"Zeekr {vin[-4:] if vin else ''} {name}"
-        self._attr_unique_id = f"{vin}_{key}"
-        self._value_fn = value_fn
-        self._attr_device_class = device_class
+    entity_description: ZeekrBinarySensorEntityDescription
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        data = self.coordinator.data.get(self.vin, {})
-        if not data:
-            return None
-        return self._value_fn(data)
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self.vin)},
-            "name": f"Zeekr {self.vin}",
-            "manufacturer": "Zeekr",
-        }
+        return self._snapshot_value()
 
 
 async def async_setup_entry(
@@ -61,118 +128,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary sensor platform."""
     coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
+    descriptions = vehicle_descriptions(coordinator, BINARY_SENSOR_DESCRIPTIONS)
+    if coordinator.compact_mode:
+        descriptions.extend(COMPACT_BINARY_SENSOR_DESCRIPTIONS)
 
-    entities = []
-    for vin in coordinator.data:
-        # Charging Status
-        entities.append(
-            ZeekrBinarySensor(
-                coordinator,
-                vin,
-                "charging_status",
-                "Charging Status",
-                lambda d: int(
-                    d.get("additionalVehicleStatus", {})
-                    .get("electricVehicleStatus", {})
-                    .get("chargerState", "0")
-                ),
-                BinarySensorDeviceClass.BATTERY_CHARGING,
-            )
-        )
-        # Plugged In Status
-        entities.append(
-            ZeekrBinarySensor(
-                coordinator,
-                vin,
-                "plugged_in",
-                "Plugged In",
-                lambda d: int(
-                    d.get("additionalVehicleStatus", {})
-                    .get("electricVehicleStatus", {})
-                    .get("statusOfChargerConnection")
-                ),
-                BinarySensorDeviceClass.PLUG,
-            )
-        )
-
-        # Door open sensors from drivingSafetyStatus
-        door_fields = {
-            "door_open_driver": ("doorOpenStatusDriver", "Driver door open"),
-            "door_open_passenger": ("doorOpenStatusPassenger", "Passenger door open"),
-            "door_open_driver_rear": (
-                "doorOpenStatusDriverRear",
-                "Driver rear door open",
-            ),
-            "door_open_passenger_rear": (
-                "doorOpenStatusPassengerRear",
-                "Passenger rear door open",
-            ),
-            "trunk_open": ("trunkOpenStatus", "Trunk open"),
-            "hood_open": ("engineHoodOpenStatus", "Hood open"),
-        }
-
-        for key, (field_name, label) in door_fields.items():
-            entities.append(
-                ZeekrBinarySensor(
-                    coordinator,
-                    vin,
-                    key,
-                    label,
-                    lambda d, f=field_name: (
-                        None
-                        if (
-                            v := d.get("additionalVehicleStatus", {})
-                            .get("drivingSafetyStatus", {})
-                            .get(f)
-                        )
-                        is None
-                        else str(v) == "1"
-                    ),
-                    BinarySensorDeviceClass.DOOR,
-                )
-            )
-
-        # Tire Pre-Warning & Temp Warning
-        for tire in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            # Pre-Warning
-            entities.append(
-                ZeekrBinarySensor(
-                    coordinator,
-                    vin,
-                    f"tire_pre_warning_{tire.lower()}",
-                    f"Tire Pre-Warning {tire}",
-                    lambda d, t=tire: (
-                        None
-                        if (
-                            v := d.get("additionalVehicleStatus", {})
-                            .get("maintenanceStatus", {})
-                            .get(f"tyrePreWarning{t}")
-                        )
-                        is None
-                        else str(v) != "0"
-                    ),
-                    BinarySensorDeviceClass.PROBLEM,
-                )
-            )
-            # Temp Warning
-            entities.append(
-                ZeekrBinarySensor(
-                    coordinator,
-                    vin,
-                    f"tire_temp_warning_{tire.lower()}",
-                    f"Tire Temp Warning {tire}",
-                    lambda d, t=tire: (
-                        None
-                        if (
-                            v := d.get("additionalVehicleStatus", {})
-                            .get("maintenanceStatus", {})
-                            .get(f"tyreTempWarning{t}")
-                        )
-                        is None
-                        else str(v) != "0"
-                    ),
-                    BinarySensorDeviceClass.PROBLEM,
-                )
-            )
-
-    async_add_entities(entities)
+    async_setup_vehicle_entities(
+        hass,
+        entry,
+        async_add_entities,
+        lambda vin: (
+            ZeekrBinarySensor(coordinator, vin, description) for description in descriptions
+        ),
+    )
@@ -13,7 +13,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
-from .entity import ZeekrEntity
+from .tracing import traced_command
+from .entity import ZeekrEntity, async_setup_vehicle_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,12 +27,15 @@ async def async_setup_entry(
     """Set up Zeekr button entities."""
     coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[ButtonEntity] = []
-    for vehicle in coordinator.vehicles:
-        entities.append(ZeekrForceUpdateButton(coordinator, vehicle.vin))
-        entities.append(ZeekrFlashBlinkersButton(coordinator, vehicle.vin))
-
-    async_add_entities(entities)
+    async_setup_vehicle_entities(
+        hass,
+        entry,
+        async_add_entities,
+        lambda vin: (
+            ZeekrForceUpdateButton(coordinator, vin),
+            ZeekrFlashBlinkersButton(coordinator, vin),
+        ),
+    )
 
 
 class ZeekrFlashBlinkersButton(ZeekrEntity, ButtonEntity):
@@ -45,6 +49,7 @@ class ZeekrFlashBlinkersButton(ZeekrEntity, ButtonEntity):
         self._attr_name = "Flash Blinkers"
         self._attr_unique_id = f"{vin}_flash_blinkers"
 
+    @traced_command
     async def async_press(self) -> None:
         """Handle the button press."""
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
@@ -62,9 +67,8 @@ class ZeekrFlashBlinkersButton(ZeekrEntity, ButtonEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_remote_control(
+            vehicle, command, service_id, setting
         )
         _LOGGER.info("Flash blinkers requested for vehicle %s", self.vin)
 
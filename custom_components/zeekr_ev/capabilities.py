@@ -0,0 +1,196 @@
+"""Per-vehicle capability profile.
+
+Zeekr models differ in what they report: some have no sunshade, no rear seat
+heating or no sentry mode, and not every account can read the charging
+limit. The profile learns from the first status responses which optional
+data a vehicle reports, persists that, and lets users override it. The
+coordinator skips endpoints and the platforms mark entities unavailable for
+capabilities a vehicle does not have. A capability learned missing is probed
+again after a restart and every REPROBE_INTERVAL, so a failed endpoint or an
+account that gains access does not rule it out for good.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Collection
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CAPABILITY_CHARGING_LIMIT,
+    CAPABILITY_CHARGING_STATUS,
+    CAPABILITY_REAR_SEAT_HEAT,
+    CAPABILITY_SEAT_VENTILATION,
+    CAPABILITY_SENTRY_MODE,
+    CAPABILITY_SUNSHADE,
+)
+
+STORAGE_KEY = "zeekr_ev_capabilities_{}"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10  # seconds
+
+# Responses without a probed capability before the vehicle is assumed to lack it
+PROBE_POLLS = 3
+# Seconds before a capability learned missing is probed again
+REPROBE_INTERVAL = 24 * 60 * 60
+
+
+def _has(group: str, *keys: str) -> Callable[[dict[str, Any]], bool]:
+    """Detect any of `keys` in an additionalVehicleStatus group."""
+
+    def _detect(data: dict[str, Any]) -> bool:
+        values = (data.get("additionalVehicleStatus") or {}).get(group) or {}
+        return any(values.get(key) is not None for key in keys)
+
+    return _detect
+
+
+@dataclass(frozen=True)
+class Capability:
+    """Optional vehicle data, detected in a merged status response.
+
+    A `probe` capability is assumed present until PROBE_POLLS responses lack
+    it. Other capabilities only show up now and then (charging data is only
+    there while a charger is connected), so they count once they are seen.
+    """
+
+    detect: Callable[[dict[str, Any]], bool]
+    probe: bool = True
+
+
+CAPABILITIES: dict[str, Capability] = {
+    CAPABILITY_CHARGING_STATUS: Capability(
+        lambda data: bool(data.get("chargingStatus")), probe=False
+    ),
+    CAPABILITY_CHARGING_LIMIT: Capability(lambda data: bool(data.get("chargingLimit"))),
+    CAPABILITY_SENTRY_MODE: Capability(_has("remoteControlState", "vstdModeState")),
+    CAPABILITY_SUNSHADE: Capability(_has("climateStatus", "curtainOpenStatus", "curtainPos")),
+    CAPABILITY_REAR_SEAT_HEAT: Capability(_has("climateStatus", "rlHeatingSts", "rrHeatingSts")),
+    CAPABILITY_SEAT_VENTILATION: Capability(_has("climateStatus", "drvVentSts", "passVentSts")),
+}
+
+
+class ZeekrCapabilities:
+    """Learned capabilities and user overrides of every vehicle of an entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id))
+        # vin -> capability -> supported
+        self.learned: dict[str, dict[str, bool]] = {}
+        self.overrides: dict[str, dict[str, bool]] = {}
+        # Responses that lacked a probed capability, not persisted
+        self._misses: dict[str, dict[str, int]] = {}
+        # Monotonic time a capability learned missing is probed again, not
+        # persisted so a restart probes it right away
+        self._reprobe_at: dict[str, dict[str, float]] = {}
+
+    async def async_load(self) -> None:
+        """Load the learned capabilities and overrides."""
+        data = await self._store.async_load() or {}
+        for vin, profile in data.get("vehicles", {}).items():
+            self.learned[vin] = dict(profile.get("learned", {}))
+            self.overrides[vin] = dict(profile.get("overrides", {}))
+
+    def supported(self, vin: str, capability: str) -> bool:
+        """Return whether a vehicle has a capability, overrides first."""
+        if (override := self.overrides.get(vin, {}).get(capability)) is not None:
+            return override
+        if (learned := self.learned.get(vin, {}).get(capability)) is not None:
+            return learned
+        return CAPABILITIES[capability].probe
+
+    def supported_set(self, vin: str) -> set[str]:
+        return {name for name in CAPABILITIES if self.supported(vin, name)}
+
+    def probes(self, vin: str, capability: str) -> bool:
+        """Return whether to request the data of a capability.
+
+        Supported capabilities are always requested, and one learned missing
+        once it is due to be probed again. Overrides are never probed.
+        """
+        if self.supported(vin, capability):
+            return True
+        if capability in self.overrides.get(vin, {}):
+            return False
+        reprobe_at = self._reprobe_at.get(vin, {}).get(capability)
+        return reprobe_at is None or time.monotonic() >= reprobe_at
+
+    @callback
+    def async_learn(
+        self, vin: str, data: dict[str, Any], unprobed: Collection[str] = ()
+    ) -> None:
+        """Learn from a merged status response of a vehicle.
+
+        `unprobed` capabilities were not requested for this response, or
+        their request failed, so their absence says nothing. A capability
+        learned missing comes back as soon as a response has it.
+        """
+        learned = self.learned.setdefault(vin, {})
+        misses = self._misses.setdefault(vin, {})
+        reprobe_at = self._reprobe_at.setdefault(vin, {})
+        changed = False
+        for name, capability in CAPABILITIES.items():
+            if learned.get(name) or name in unprobed:
+                continue
+            if capability.detect(data):
+                learned[name] = changed = True
+                misses.pop(name, None)
+                reprobe_at.pop(name, None)
+            elif learned.get(name) is False:
+                reprobe_at[name] = time.monotonic() + REPROBE_INTERVAL
+            elif capability.probe:
+                misses[name] = misses.get(name, 0) + 1
+                if misses[name] >= PROBE_POLLS:
+                    learned[name] = False
+                    changed = True
+                    reprobe_at[name] = time.monotonic() + REPROBE_INTERVAL
+        if changed:
+            self._async_schedule_save()
+
+    @callback
+    def async_set_override(self, vin: str, capability: str, supported: bool | None) -> None:
+        """Force a capability on or off for a vehicle, or clear the override."""
+        overrides = self.overrides.setdefault(vin, {})
+        if supported is None:
+            overrides.pop(capability, None)
+        else:
+            overrides[capability] = supported
+        self._async_schedule_save()
+
+    @callback
+    def async_forget(self, vin: str) -> None:
+        """Drop what was learned about a vehicle, keeping its overrides."""
+        self.learned.pop(vin, None)
+        self._misses.pop(vin, None)
+        self._reprobe_at.pop(vin, None)
+        self._async_schedule_save()
+
+    def as_dict(self, vin: str) -> dict[str, Any]:
+        return {
+            "supported": sorted(self.supported_set(vin)),
+            "learned": self.learned.get(vin, {}),
+            "overrides": self.overrides.get(vin, {}),
+        }
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "vehicles": {
+                vin: {
+                    "learned": self.learned.get(vin, {}),
+                    "overrides": self.overrides.get(vin, {}),
+                }
+                for vin in self.learned.keys() | self.overrides.keys()
+            }
+        }
+
+
+async def async_remove_capabilities(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the stored capabilities of a removed config entry."""
+    await Store(hass, STORAGE_VERSION, STORAGE_KEY.format(entry_id)).async_remove()
@@ -18,6 +18,8 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import ZeekrSetpointEntity, async_setup_vehicle_entities
+from .tracing import get_tracer, traced, traced_command
 
 
 async def async_setup_entry(
@@ -27,15 +29,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up the climate platform."""
     coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities: list[ZeekrClimate] = []
+    async_setup_vehicle_entities(
+        hass, entry, async_add_entities, lambda vin: (ZeekrClimate(coordinator, vin),)
+    )
 
-    for vin in coordinator.data:
-        entities.append(ZeekrClimate(coordinator, vin))
 
-    async_add_entities(entities)
-
-
-class ZeekrClimate(CoordinatorEntity, ClimateEntity):
+class ZeekrClimate(ZeekrSetpointEntity, CoordinatorEntity, ClimateEntity):
     """Zeekr Climate class."""
 
     _attr_has_entity_name = True
@@ -54,16 +53,10 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get("interiorTemp")
-            )
-            return float(val) if val is not None else None
-        except (ValueError, TypeError, AttributeError):
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is None:
             return None
+        return snapshot.interior_temp
 
     @property
     def target_temperature(self) -> float | None:
@@ -73,22 +66,16 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode:
         """Return hvac operation ie. heat, cool mode."""
-        try:
-            status = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-            )
-            # preClimateActive is likely a boolean or "true"/"false" string
-            active = status.get("preClimateActive")
-            if str(active).lower() in ("true", "1"):
-                return HVACMode.HEAT_COOL
-            return HVACMode.OFF
-        except (ValueError, TypeError, AttributeError):
-            return HVACMode.OFF
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is not None and snapshot.climate_active:
+            return HVACMode.HEAT_COOL
+        return HVACMode.OFF
 
+    @traced_command
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
+        # The command carries the current target temperature anyway
+        self.async_cancel_setpoint()
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
         if not vehicle:
             return
@@ -128,9 +115,8 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
             }
 
         if setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
+            await self.coordinator.async_remote_control(
+                vehicle, command, service_id, setting
             )
 
             # Optimistic update
@@ -139,34 +125,35 @@ class ZeekrClimate(CoordinatorEntity, ClimateEntity):
 
             # delayed refresh
             async def delayed_refresh():
-                await asyncio.sleep(10)
-                await self.coordinator.async_request_refresh()
+                with get_tracer(self.coordinator).start_as_current_span(
+                    "zeekr.delayed_refresh", attributes={"vin": self.vin}
+                ):
+                    await asyncio.sleep(10)
+                    await self.coordinator.async_request_refresh()
             self.hass.async_create_task(delayed_refresh())
 
+    @traced("zeekr.optimistic_write")
     def _update_local_state_optimistically(self, hvac_mode: HVACMode) -> None:
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
-            return
-
-        climate_status = (
-            data.setdefault("additionalVehicleStatus", {})
-            .setdefault("climateStatus", {})
+        """Show the requested state until a poll confirms it."""
+        self.coordinator.async_set_optimistic(
+            self.vin, climate_active=hvac_mode == HVACMode.HEAT_COOL
         )
 
-        if hvac_mode == HVACMode.HEAT_COOL:
-            climate_status["preClimateActive"] = "1"
-        else:
-            climate_status["preClimateActive"] = "0"
-
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temp := kwargs.get("temperature")) is None:
             return
 
         self._target_temperature = temp
+        self.async_write_ha_state()
+
+        # If currently running, update the temp by sending the command again,
+        # once the target stops changing
+        if self.hvac_mode == HVACMode.HEAT_COOL:
+            self.async_schedule_setpoint(self._async_send_temperature)
 
-        # If currently running, update the temp by sending the command again
+    async def _async_send_temperature(self) -> None:
+        """Send the final target temperature, unless AC was turned off meanwhile."""
         if self.hvac_mode == HVACMode.HEAT_COOL:
             await self.async_set_hvac_mode(HVACMode.HEAT_COOL)
 
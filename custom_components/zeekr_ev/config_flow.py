@@ -2,7 +2,7 @@
 
 import logging
 import importlib
-from typing import Dict
+from typing import Any, Dict, Mapping
 
 import voluptuous as vol
 
@@ -22,10 +22,23 @@ from .const import (
     CONF_VIN_KEY,
     CONF_COUNTRY_CODE,
     CONF_USE_LOCAL_API,
+    CONF_DEBUG_WATCHDOG,
+    CONF_METRICS_ENDPOINT,
+    CONF_TRACING,
+    CONF_RAW_RETENTION,
+    CONF_COMPACT_MODE,
+    CONF_SKIP_UNCHANGED_CHARGING,
+    CONF_API_TIMEOUT,
+    CONF_COMMAND_TIMEOUT,
+    CONF_WATCHDOG_ENTITY_THRESHOLD,
+    CONF_WATCHDOG_EXECUTOR_THRESHOLD,
+    DEFAULT_API_TIMEOUT,
+    DEFAULT_COMMAND_TIMEOUT,
     DEFAULT_POLLING_INTERVAL,
     DOMAIN,
     COUNTRY_CODE_MAPPING,
 )
+from .watchdog import DEFAULT_ENTITY_THRESHOLD, DEFAULT_EXECUTOR_THRESHOLD
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +78,7 @@ class ZeekrEVAPIFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:
         """Initialize."""
         self._errors: Dict[str, str] = {}
         self._temp_client = None
+        self._reauth_entry: config_entries.ConfigEntry | None = None
 
     async def async_step_user(self, user_input=None):
         """Handle a flow initialized by the user."""
@@ -97,6 +111,66 @@ class ZeekrEVAPIFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):  # type:
 
         return await self._show_config_form(user_input)
 
+    async def async_step_reauth(self, entry_data: Mapping[str, Any]):
+        """Handle a rejected login of an existing entry."""
+        self._reauth_entry = self.hass.config_entries.async_get_entry(
+            self.context["entry_id"]
+        )
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(self, user_input=None):
+        """Ask for the new password and log in with it.
+
+        A running entry keeps its client, entities and data: the client logs
+        in again with the new password and polling resumes. An entry that
+        failed to set up is set up again.
+        """
+        self._errors = {}
+        entry = self._reauth_entry
+
+        if user_input is not None:
+            password = user_input[CONF_PASSWORD]
+            data = {**entry.data, CONF_PASSWORD: password}
+            coordinator = self.hass.data.get(DOMAIN, {}).get(entry.entry_id)
+            if coordinator is not None:
+                if await coordinator.async_reauthenticate(password):
+                    self.hass.config_entries.async_update_entry(entry, data=data)
+                    return self.async_abort(reason="reauth_successful")
+            elif await self._test_credentials(
+                data[CONF_USERNAME],
+                password,
+                data.get(CONF_COUNTRY_CODE, ""),
+                data.get(CONF_HMAC_ACCESS_KEY, ""),
+                data.get(CONF_HMAC_SECRET_KEY, ""),
+                data.get(CONF_PASSWORD_PUBLIC_KEY, ""),
+                data.get(CONF_PROD_SECRET, ""),
+                data.get(CONF_VIN_KEY, ""),
+                data.get(CONF_VIN_IV, ""),
+                data.get(CONF_USE_LOCAL_API, False),
+            ):
+                self.hass.data.setdefault(DOMAIN, {})["_temp_client"] = (
+                    self._temp_client
+                )
+                return self.async_update_reload_and_abort(
+                    entry, data=data, reason="reauth_successful"
+                )
+            self._errors["base"] = "auth"
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_PASSWORD): selector.TextSelector(
+                        selector.TextSelectorConfig(
+                            type=selector.TextSelectorType.PASSWORD
+                        )
+                    ),
+                }
+            ),
+            description_placeholders={"username": entry.data.get(CONF_USERNAME, "")},
+            errors=self._errors,
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -260,18 +334,10 @@ class ZeekrEVAPIOptionsFlowHandler(config_entries.OptionsFlow):
                 if not valid:
                     errors["base"] = "auth"
                 else:
-                    # Update config entry data with new values
-                    self.hass.config_entries.async_update_entry(
-                        self._config_entry, data=user_input
-                    )
-                    await self.hass.config_entries.async_reload(self._config_entry.entry_id)
+                    await self._async_update_entry(user_input)
                     return self.async_abort(reason="reconfigure_successful")
             else:
-                # Update config entry data with new values
-                self.hass.config_entries.async_update_entry(
-                    self._config_entry, data=user_input
-                )
-                await self.hass.config_entries.async_reload(self._config_entry.entry_id)
+                await self._async_update_entry(user_input)
                 return self.async_abort(reason="reconfigure_successful")
 
         # Merge existing data
@@ -336,11 +402,61 @@ class ZeekrEVAPIOptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_USE_LOCAL_API,
                         default=data.get(CONF_USE_LOCAL_API, False),
                     ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_DEBUG_WATCHDOG,
+                        default=data.get(CONF_DEBUG_WATCHDOG, False),
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_WATCHDOG_EXECUTOR_THRESHOLD,
+                        default=data.get(CONF_WATCHDOG_EXECUTOR_THRESHOLD, DEFAULT_EXECUTOR_THRESHOLD),
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_WATCHDOG_ENTITY_THRESHOLD,
+                        default=data.get(CONF_WATCHDOG_ENTITY_THRESHOLD, DEFAULT_ENTITY_THRESHOLD),
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_METRICS_ENDPOINT,
+                        default=data.get(CONF_METRICS_ENDPOINT, False),
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_TRACING,
+                        default=data.get(CONF_TRACING, False),
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_RAW_RETENTION,
+                        default=data.get(CONF_RAW_RETENTION, False),
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_COMPACT_MODE,
+                        default=data.get(CONF_COMPACT_MODE, False),
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_SKIP_UNCHANGED_CHARGING,
+                        default=data.get(CONF_SKIP_UNCHANGED_CHARGING, False),
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_API_TIMEOUT,
+                        default=data.get(CONF_API_TIMEOUT, DEFAULT_API_TIMEOUT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_COMMAND_TIMEOUT,
+                        default=data.get(CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1)),
                 }
             ),
             errors=errors,
         )
 
+    async def _async_update_entry(self, data: dict) -> None:
+        """Save the new entry data.
+
+        The update listener of a loaded entry applies it, reloading only for
+        new credentials; an entry that failed to set up is retried with it.
+        """
+        self.hass.config_entries.async_update_entry(self._config_entry, data=data)
+        if self._config_entry.state is not config_entries.ConfigEntryState.LOADED:
+            await self.hass.config_entries.async_reload(self._config_entry.entry_id)
+
     async def _test_credentials(
         self,
         username,
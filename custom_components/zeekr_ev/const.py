@@ -41,10 +41,35 @@ CONF_VIN_KEY = "vin_key"
 CONF_VIN_IV = "vin_iv"
 CONF_POLLING_INTERVAL = "polling_interval"
 CONF_USE_LOCAL_API = "use_local_api"
+CONF_DEBUG_WATCHDOG = "debug_watchdog"
+CONF_WATCHDOG_EXECUTOR_THRESHOLD = "watchdog_executor_threshold"
+CONF_WATCHDOG_ENTITY_THRESHOLD = "watchdog_entity_threshold"
+CONF_METRICS_ENDPOINT = "metrics_endpoint"
+CONF_TRACING = "tracing"
+CONF_RAW_RETENTION = "raw_retention"
+CONF_COMPACT_MODE = "compact_mode"
+CONF_SKIP_UNCHANGED_CHARGING = "skip_unchanged_charging"
+CONF_API_TIMEOUT = "api_timeout"
+CONF_COMMAND_TIMEOUT = "command_timeout"
+
+# Dispatcher signals, formatted with the config entry id
+SIGNAL_NEW_VEHICLE = f"{DOMAIN}_new_vehicle_{{}}"
+SIGNAL_CAPABILITIES_CHANGED = f"{DOMAIN}_capabilities_changed_{{}}"
+
+# Optional vehicle data, see capabilities.py
+CAPABILITY_CHARGING_STATUS = "charging_status"
+CAPABILITY_CHARGING_LIMIT = "charging_limit"
+CAPABILITY_SENTRY_MODE = "sentry_mode"
+CAPABILITY_SUNSHADE = "sunshade"
+CAPABILITY_REAR_SEAT_HEAT = "rear_seat_heat"
+CAPABILITY_SEAT_VENTILATION = "seat_ventilation"
 
 # Defaults
 DEFAULT_NAME = DOMAIN
 DEFAULT_POLLING_INTERVAL = 5  # minutes
+VEHICLE_LIST_INTERVAL = 6 * 60 * 60  # seconds between vehicle list refreshes
+DEFAULT_API_TIMEOUT = 30.0  # seconds per status call, twice that for a login
+DEFAULT_COMMAND_TIMEOUT = 60.0  # seconds per remote control command
 
 # Country code to (country_name, region) mapping
 COUNTRY_CODE_MAPPING = {
@@ -2,19 +2,69 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import timedelta, datetime
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Optional
+import time
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
 
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import homeassistant.helpers.event as event
 
 
-from .const import CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL, DOMAIN
+from .accounts import account_key
+from .capabilities import ZeekrCapabilities
+from .const import (
+    CAPABILITY_CHARGING_LIMIT,
+    CAPABILITY_SENTRY_MODE,
+    CONF_API_TIMEOUT,
+    CONF_COMMAND_TIMEOUT,
+    CONF_COMPACT_MODE,
+    CONF_DEBUG_WATCHDOG,
+    CONF_PASSWORD,
+    CONF_POLLING_INTERVAL,
+    CONF_RAW_RETENTION,
+    CONF_SKIP_UNCHANGED_CHARGING,
+    CONF_TRACING,
+    CONF_WATCHDOG_ENTITY_THRESHOLD,
+    CONF_WATCHDOG_EXECUTOR_THRESHOLD,
+    DEFAULT_API_TIMEOUT,
+    DEFAULT_COMMAND_TIMEOUT,
+    DEFAULT_POLLING_INTERVAL,
+    DOMAIN,
+    SIGNAL_CAPABILITIES_CHANGED,
+    SIGNAL_NEW_VEHICLE,
+    VEHICLE_LIST_INTERVAL,
+)
+from .fetch_plan import ENDPOINT_CAPABILITIES, FetchPlan
+from .optimistic import OptimisticOverlay
+from .profiler import TARGET_COMMAND, TARGET_UPDATE, ProfileSession, ZeekrProfiler
 from .request_stats import ZeekrRequestStats
+from .scheduler import (
+    COMMAND_CONFIRM_WINDOW,
+    LANE_COMMAND,
+    LANE_POLL,
+    LANE_REFRESH,
+    SlotLease,
+    async_get_scheduler,
+)
+from .snapshot import VehicleSnapshot, charging_fields, status_update_time
+from .tracing import (
+    NOOP_TRACER,
+    STATUS_ERROR,
+    NoOpTracer,
+    TRACE_FILE,
+    JsonlSpanExporter,
+    ZeekrTracer,
+)
+from .watchdog import DEFAULT_ENTITY_THRESHOLD, DEFAULT_EXECUTOR_THRESHOLD, ZeekrWatchdog
 
 if TYPE_CHECKING:
     # Import for type checking only
@@ -26,9 +76,40 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+def vehicle_model(vehicle: Vehicle) -> str:
+    """Device model shown for a vehicle, from its vehicle list entry."""
+    data = getattr(vehicle, "data", None) or {}
+    plate_no = data.get("plateNo")
+    display_os_version = data.get("displayOSVersion")
+    if display_os_version:
+        return f"{plate_no} (OS Version {display_os_version})"
+    return plate_no or "Zeekr EV"
+
+
+def is_auth_error(err: BaseException) -> bool:
+    """Return whether `err` is an authentication error of the Zeekr client.
+
+    The client comes from either the installed or the local zeekr_ev_api
+    package, so the exception class is matched by name.
+    """
+    return any(cls.__name__ == "AuthException" for cls in type(err).__mro__)
+
+
+def _tracer(hass: HomeAssistant, data: Mapping[str, Any]) -> NoOpTracer | ZeekrTracer:
+    if data.get(CONF_TRACING, False):
+        return ZeekrTracer(JsonlSpanExporter(hass, hass.config.path(TRACE_FILE)))
+    return NOOP_TRACER
+
+
 class ZeekrCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Zeekr data."""
 
+    # None while following another coordinator, which polls for this one
+    update_interval: timedelta | None
+    # Set from the source while following one
+    last_update_success: bool
+    last_exception: Exception | None
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -38,19 +119,81 @@ class ZeekrCoordinator(DataUpdateCoordinator):
         """Initialize."""
         self.client = client
         self.entry = entry
-        self.vehicles: list[Vehicle] = []
+        # Entry data the coordinator runs with, to tell which options changed
+        self.entry_data: dict[str, Any] = dict(entry.data)
+        # Poll slots and API call limits shared with the other entries
+        self.scheduler = async_get_scheduler(hass)
+        self.account = account_key(entry.data)
+        # Monotonic time of each VIN's last command, and whether the next
+        # update was requested rather than scheduled
+        self.commanded_at: dict[str, float] = {}
+        self._refresh_requested = False
+        # VIN -> vehicle, refreshed every VEHICLE_LIST_INTERVAL or on demand
+        self.vehicles: dict[str, Vehicle] = {}
+        self._vehicle_list_fetched: float | None = None
         # Shared settings for command durations
         self.seat_duration = 15
         self.ac_duration = 15
         self.steering_wheel_duration = 15
         self.request_stats = ZeekrRequestStats(hass)
         self.latest_poll_time: Optional[str] = None  # Track latest poll time
-        polling_interval = entry.data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL)
+        # Wall clock time each VIN's data was last fetched
+        self.vin_updated_at: dict[str, float] = {}
+        # Vehicle-side update time of the last processed status per VIN; a
+        # status with the same time reuses the previous snapshot
+        self.vin_status_time: dict[str, Any] = {}
+        self.unchanged_polls = 0
+        self.skip_unchanged_charging: bool = entry.data.get(
+            CONF_SKIP_UNCHANGED_CHARGING, False
+        )
+        # Deadlines of single API calls and commands, in seconds; a late
+        # result is abandoned and the update goes on without it
+        self.api_timeout: float = entry.data.get(CONF_API_TIMEOUT, DEFAULT_API_TIMEOUT)
+        self.command_timeout: float = entry.data.get(
+            CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT
+        )
+        # Entities only read the parsed snapshots; the raw API responses are
+        # dropped after parsing unless raw retention is enabled for debugging
+        self.raw_retention: bool = entry.data.get(CONF_RAW_RETENTION, False)
+        # Grouped entities instead of per-tire/door/seat/window ones
+        self.compact_mode: bool = entry.data.get(CONF_COMPACT_MODE, False)
+        self.raw_data: dict[str, dict[str, Any]] = {}
+        # Optimistic values of recent commands, laid over the fetched data
+        self.overlay = OptimisticOverlay()
+        self._unsub_overlay_expiry: Callable[[], None] | None = None
+        # Bumped whenever entities may see new values; entities cache their
+        # computed value per generation so repeated property reads are cheap
+        self.generation = 0
+        self.value_cache_hits = 0
+        self.value_cache_misses = 0
+        # Learned and overridden optional features of each vehicle
+        self._capability_profile = ZeekrCapabilities(hass, entry.entry_id)
+        self.capability_profile = self._capability_profile
+        # Coordinator of another entry of the same account whose data this
+        # one mirrors instead of polling
+        self.source: ZeekrCoordinator | None = None
+        self._unsub_source: Callable[[], None] | None = None
+        # Optional endpoints skipped because all their entities are disabled
+        self.fetch_plan = FetchPlan()
+        # Vehicles and capabilities the platforms already have entities for
+        self.known_vins: set[str] = set()
+        self.capabilities: dict[str, set[str]] = {}
+        self.profiler = ZeekrProfiler(hass)
+        self._profile_session: ProfileSession | None = None
+        self.watchdog = ZeekrWatchdog(
+            entry.data.get(CONF_DEBUG_WATCHDOG, False),
+            entry.data.get(CONF_WATCHDOG_EXECUTOR_THRESHOLD, DEFAULT_EXECUTOR_THRESHOLD),
+            entry.data.get(CONF_WATCHDOG_ENTITY_THRESHOLD, DEFAULT_ENTITY_THRESHOLD),
+        )
+        self.tracer = _tracer(hass, entry.data)
+        # Configured time between polls, None while following; update_interval
+        # is set per poll to reach this entry's slot of the shared schedule
+        self.polling_interval: timedelta | None = self._polling_interval()
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=polling_interval),
+            update_interval=self.polling_interval,
         )
 
         # Schedule daily reset at midnight
@@ -65,76 +208,636 @@ class ZeekrCoordinator(DataUpdateCoordinator):
         )
 
     async def async_init_stats(self):
-        """Initialize stats (load from storage)."""
+        """Initialize stats and capabilities (load from storage)."""
         await self.request_stats.async_load()
+        await self.capability_profile.async_load()
+
+    @callback
+    def async_apply_options(self, data: Mapping[str, Any]) -> None:
+        """Apply changed options of the config entry without reloading it."""
+        self.entry_data = dict(data)
+        if self.source is None and self.polling_interval != (
+            polling_interval := self._polling_interval()
+        ):
+            self.polling_interval = polling_interval
+            self._async_time_next_poll()
+            if self._listeners:
+                # The pending refresh still runs at the old interval; polling
+                # now times the next ones at the new one
+                self.hass.async_create_task(self.async_request_refresh())
+        self.skip_unchanged_charging = data.get(CONF_SKIP_UNCHANGED_CHARGING, False)
+        self.api_timeout = data.get(CONF_API_TIMEOUT, DEFAULT_API_TIMEOUT)
+        self.command_timeout = data.get(CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT)
+        self.raw_retention = data.get(CONF_RAW_RETENTION, False)
+        if not self.raw_retention:
+            self.raw_data = {}
+        self.watchdog.enabled = data.get(CONF_DEBUG_WATCHDOG, False)
+        self.watchdog.executor_threshold = data.get(
+            CONF_WATCHDOG_EXECUTOR_THRESHOLD, DEFAULT_EXECUTOR_THRESHOLD
+        )
+        self.watchdog.entity_threshold = (
+            data.get(CONF_WATCHDOG_ENTITY_THRESHOLD, DEFAULT_ENTITY_THRESHOLD) / 1000
+        )
+        # Keep a running tracer and its exporter
+        if data.get(CONF_TRACING, False) == (self.tracer is NOOP_TRACER):
+            self.tracer = _tracer(self.hass, data)
+        self.generation += 1
+        self.async_update_listeners()
+
+    def _polling_interval(self) -> timedelta:
+        return timedelta(
+            minutes=self.entry_data.get(CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL)
+        )
+
+    @callback
+    def async_follow(self, source: ZeekrCoordinator | None) -> None:
+        """Mirror the data of another coordinator of the same account.
+
+        A following coordinator does not poll; its refresh requests go to the
+        source. Following None polls again.
+        """
+        if self._unsub_source is not None:
+            self._unsub_source()
+            self._unsub_source = None
+        if self.source is not None:
+            self.source.fetch_plan.followers.discard(self.fetch_plan)
+        self.source = source
+        if source is None:
+            self.capability_profile = self._capability_profile
+            # The refresh that schedules the next polls is requested by the
+            # account when this coordinator takes over polling
+            self.polling_interval = self._polling_interval()
+            self._async_time_next_poll()
+            return
+        # A refresh still pending only mirrors the source
+        self.polling_interval = self.update_interval = None
+        self.capability_profile = source.capability_profile
+        # The source polls for this entry's entities too
+        source.fetch_plan.followers.add(self.fetch_plan)
+        self._unsub_source = source.async_add_listener(self._handle_source_update)
+        if source.data is not None:
+            self._handle_source_update()
+
+    @callback
+    def _async_time_next_poll(self) -> None:
+        """Set update_interval to reach this entry's slot of the shared schedule."""
+        if self.polling_interval is None:
+            return
+        now = self.hass.loop.time()
+        next_poll = self.scheduler.next_poll(
+            self.entry.entry_id, self.polling_interval.total_seconds(), now
+        )
+        self.update_interval = timedelta(seconds=next_poll - now)
+
+    @callback
+    def _handle_source_update(self) -> None:
+        source = self.source
+        if source is None:
+            return
+        self.vehicles = source.vehicles
+        if not source.last_update_success:
+            self.last_update_success = False
+            self.last_exception = source.last_exception
+            self.async_update_listeners()
+            return
+        self.latest_poll_time = source.latest_poll_time
+        self.overlay.reconcile(source.data or {})
+        self.async_set_updated_data(source.data)
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh, of the source when following one."""
+        if self.source is not None:
+            await self.source.async_request_refresh()
+            return
+        self._refresh_requested = True
+        await super().async_request_refresh()
+
+    def _vehicle_lane(self, vin: str, requested: bool) -> int:
+        """Return the lane of a vehicle's calls in this update."""
+        commanded_at = self.commanded_at.get(vin)
+        if (
+            commanded_at is not None
+            and time.monotonic() - commanded_at < COMMAND_CONFIRM_WINDOW
+        ):
+            return LANE_COMMAND
+        return LANE_REFRESH if requested else LANE_POLL
+
+    async def async_reauthenticate(self, password: str) -> bool:
+        """Log the running client in again with a new password.
+
+        The vehicles keep using the same client, so entities, snapshots and
+        stats stay as they are. On failure the old password is kept and False
+        is returned.
+        """
+        client = self.client
+        previous = client.password
+        client.password = password
+        try:
+            await self._async_call_api("login", client.login, True, lane=LANE_COMMAND)
+        except Exception as err:
+            _LOGGER.warning("Could not log in to Zeekr API with the new password: %s", err)
+            client.password = previous
+            return False
+        self.entry_data[CONF_PASSWORD] = password
+        # Polling stops after an authentication failure
+        await self.async_request_refresh()
+        return True
 
     async def _handle_daily_reset(self, now):
         await self.request_stats.async_reset_today()
 
     def get_vehicle_by_vin(self, vin: str) -> Vehicle | None:
         """Get a vehicle by VIN."""
-        for vehicle in self.vehicles:
-            if vehicle.vin == vin:
-                return vehicle
-        return None
+        return self.vehicles.get(vin)
 
-    async def _async_update_data(self) -> dict[str, dict]:
-        """Fetch data from API endpoint."""
+    async def async_refresh_vehicles(self) -> None:
+        """Fetch the vehicle list again with the next update, and run it now."""
+        if self.source is not None:
+            await self.source.async_refresh_vehicles()
+            return
+        self._vehicle_list_fetched = None
+        await self.async_refresh()
+
+    def _vehicle_list_due(self) -> bool:
+        return (
+            self._vehicle_list_fetched is None
+            or time.monotonic() - self._vehicle_list_fetched >= VEHICLE_LIST_INTERVAL
+        )
+
+    async def _async_update_vehicle_list(self, lane: int = LANE_POLL) -> None:
+        """Fetch the vehicle list and diff it against the known vehicles.
+
+        New vehicles are polled from this update on and vanished ones are
+        dropped; the announcement after the update adds or removes their
+        devices. Device metadata of the remaining vehicles is updated in place.
+        A failed or empty refresh keeps the current list.
+        """
         try:
-            # Refresh vehicle list if empty (first run)
-            if not self.vehicles:
-                await self.request_stats.async_inc_request()
-                self.vehicles = await self.hass.async_add_executor_job(
-                    self.client.get_vehicle_list
+            vehicles = await self._async_call_api(
+                "get_vehicle_list", self.client.get_vehicle_list, lane=lane
+            )
+        except Exception as err:
+            if not self.vehicles or is_auth_error(err):
+                raise
+            _LOGGER.warning("Could not refresh the vehicle list: %s", err)
+            return
+        self._vehicle_list_fetched = time.monotonic()
+        if not vehicles and self.vehicles:
+            _LOGGER.warning(
+                "Vehicle list came back empty, keeping %d vehicle(s)", len(self.vehicles)
+            )
+            return
+
+        previous = self.vehicles
+        self.vehicles = {vehicle.vin: vehicle for vehicle in vehicles}
+        if added := self.vehicles.keys() - previous.keys():
+            _LOGGER.info("Found new vehicle(s): %s", ", ".join(sorted(added)))
+        for vin in self.vehicles.keys() & previous.keys():
+            model = vehicle_model(self.vehicles[vin])
+            if model != vehicle_model(previous[vin]):
+                self._async_update_device_model(vin, model)
+
+    @callback
+    def _async_update_device_model(self, vin: str, model: str) -> None:
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, vin)})
+        if device is not None:
+            device_registry.async_update_device(device.id, model=model)
+
+    def supports(self, vin: str, capability: str | None) -> bool:
+        """Return whether a vehicle has a capability; None is always supported."""
+        return capability is None or self.capability_profile.supported(vin, capability)
+
+    @callback
+    def async_set_capability(self, vin: str, capability: str, supported: bool | None) -> None:
+        """Override a capability of a vehicle and add or update its entities."""
+        self.capability_profile.async_set_override(vin, capability, supported)
+        self.async_update_listeners()
+
+    @callback
+    def async_setup_fetch_plan(self) -> Callable[[], None]:
+        """Build the fetch plan and rebuild it on entity registry changes."""
+        self._async_rebuild_fetch_plan()
+
+        @callback
+        def _async_registry_updated(event: Event) -> None:
+            if event.data["action"] == "update" and "disabled_by" not in event.data.get(
+                "changes", {}
+            ):
+                return
+            self._async_rebuild_fetch_plan()
+
+        return self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, _async_registry_updated
+        )
+
+    @callback
+    def _async_rebuild_fetch_plan(self) -> None:
+        entity_registry = er.async_get(self.hass)
+        self.fetch_plan.rebuild(
+            er.async_entries_for_config_entry(entity_registry, self.entry.entry_id)
+        )
+
+    def _fetches(self, vin: str, endpoint: str) -> bool:
+        """Return whether to fetch an optional endpoint for a vehicle."""
+        if not self.capability_profile.probes(vin, ENDPOINT_CAPABILITIES[endpoint]):
+            return False
+        return self.fetch_plan.fetches(vin, endpoint)
+
+    def get_snapshot(self, vin: str) -> VehicleSnapshot | None:
+        """Return the vehicle's snapshot with pending optimistic values applied."""
+        return self.overlay.apply(vin, (self.data or {}).get(vin))
+
+    @callback
+    def async_set_optimistic(self, vin: str, **fields: Any) -> None:
+        """Show `fields` for a vehicle until a poll confirms them or they expire."""
+        self.overlay.set(vin, fields)
+        self.generation += 1
+        if self._unsub_overlay_expiry:
+            self._unsub_overlay_expiry()
+        # Write the fetched state back once the last optimistic value expires
+        self._unsub_overlay_expiry = event.async_call_later(
+            self.hass, self.overlay.ttl, self._handle_overlay_expiry
+        )
+
+    @callback
+    def async_clear_optimistic(self, vin: str, *fields: str) -> None:
+        """Show the fetched values of `fields` again, as after a failed command."""
+        self.overlay.discard(vin, fields)
+        self.async_update_listeners()
+
+    @callback
+    def _handle_overlay_expiry(self, _now: datetime) -> None:
+        self._unsub_overlay_expiry = None
+        self.overlay.reconcile(self.data or {})
+        self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners, timing each one when the watchdog is enabled."""
+        self.generation += 1
+        self._async_announce_changes()
+        if not self.watchdog.enabled:
+            super().async_update_listeners()
+            return
+        for update_callback, _ in list(self._listeners.values()):
+            start = time.perf_counter()
+            update_callback()
+            self.watchdog.record_entity_update(
+                update_callback, time.perf_counter() - start
+            )
+
+    @callback
+    def _async_announce_changes(self) -> None:
+        """Signal new vehicles and capability changes, and drop vanished vehicles.
+
+        Runs once the new data is set, so platforms adding entities for a
+        signal can read it. Vehicles and capabilities known at the first
+        refresh are set up by the platforms directly.
+        """
+        data: dict[str, VehicleSnapshot] = self.data or {}
+        entry_id = self.entry.entry_id
+        for vin in data:
+            supported = self.capability_profile.supported_set(vin)
+            changed = supported != self.capabilities.get(vin, supported)
+            self.capabilities[vin] = supported
+            if vin not in self.known_vins:
+                self.known_vins.add(vin)
+                async_dispatcher_send(self.hass, SIGNAL_NEW_VEHICLE.format(entry_id), vin)
+            elif changed:
+                async_dispatcher_send(
+                    self.hass, SIGNAL_CAPABILITIES_CHANGED.format(entry_id), vin
                 )
+        for vin in self.known_vins - data.keys():
+            self._async_remove_vehicle(vin)
+
+    @callback
+    def _async_remove_vehicle(self, vin: str) -> None:
+        """Remove a vehicle's device, and with it its entities."""
+        _LOGGER.info("Vehicle %s is no longer in the account, removing it", vin)
+        self.known_vins.discard(vin)
+        self.capabilities.pop(vin, None)
+        self.capability_profile.async_forget(vin)
+        self.vin_updated_at.pop(vin, None)
+        self.vin_status_time.pop(vin, None)
+        self.commanded_at.pop(vin, None)
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, vin)})
+        if device is not None:
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=self.entry.entry_id
+            )
+
+    async def _async_call_api(
+        self,
+        endpoint: str,
+        func: Callable[..., Any],
+        *args: Any,
+        vin: str | None = None,
+        lane: int = LANE_POLL,
+    ) -> Any:
+        """Run a blocking Zeekr API call in the executor and record its latency.
+
+        Raises TimeoutError once the call's deadline passes. The executor
+        thread cannot be cancelled, so its late result is dropped and the
+        account's slot is held until it ends.
+        """
+        await self.request_stats.async_inc_request()
+        if self._profile_session is not None:
+            func = self._profile_session.wrap(func)
+        with self.tracer.start_as_current_span(
+            f"zeekr.api.{endpoint}", attributes={"vin": vin, "endpoint": endpoint}
+        ):
+            async with self.scheduler.slot(self.account, lane) as lease:
+                start = time.monotonic()
+                deadline = self.api_timeout * (2 if endpoint == "login" else 1)
+                try:
+                    return await self._async_run_job(lease, deadline, func, *args)
+                except TimeoutError as err:
+                    self.request_stats.record_timeout(endpoint)
+                    raise TimeoutError(f"{endpoint} timed out after {deadline:g} s") from err
+                finally:
+                    elapsed = time.monotonic() - start
+                    self.request_stats.record_latency(endpoint, elapsed)
+                    self.watchdog.record_executor_job(endpoint, vin, elapsed)
 
-            data = {}
-            for vehicle in self.vehicles:
-                await self.request_stats.async_inc_request()
-                vehicle_state = await self.hass.async_add_executor_job(
-                    vehicle.get_remote_control_state
+    async def async_remote_control(
+        self, vehicle: Vehicle, command: str, service_id: str, setting: dict
+    ) -> Any:
+        """Send a remote control command to a vehicle."""
+        await self.async_inc_invoke()
+        # The polls of the next minutes confirm the command; those of the
+        # source when following one
+        self.commanded_at[vehicle.vin] = time.monotonic()
+        if self.source is not None:
+            self.source.commanded_at[vehicle.vin] = self.commanded_at[vehicle.vin]
+        func = vehicle.do_remote_control
+        session = self.profiler.start(TARGET_COMMAND, f"{service_id}_{command}")
+        if session is not None:
+            func = session.wrap(func)
+        with self.tracer.start_as_current_span(
+            "zeekr.remote_control",
+            attributes={"vin": vehicle.vin, "service_id": service_id, "command": command},
+        ) as span:
+            try:
+                async with self.scheduler.slot(self.account, LANE_COMMAND) as lease:
+                    start = time.monotonic()
+                    try:
+                        result = await self._async_run_job(
+                            lease, self.command_timeout, func, command, service_id, setting
+                        )
+                    except TimeoutError:
+                        span.set_attribute("outcome", STATUS_ERROR)
+                        self.request_stats.record_timeout(f"do_remote_control {service_id}")
+                        raise
+                    except Exception:
+                        span.set_attribute("outcome", STATUS_ERROR)
+                        raise
+                    else:
+                        # do_remote_control returns the API's success flag
+                        span.set_attribute("outcome", "accepted" if result else "rejected")
+                        return result
+                    finally:
+                        self.watchdog.record_executor_job(
+                            f"do_remote_control {service_id}", vehicle.vin, time.monotonic() - start
+                        )
+            except TimeoutError as err:
+                # Raised here, so the scheduler saw the timeout
+                raise HomeAssistantError(
+                    f"Zeekr command {service_id} {command} timed out after "
+                    f"{self.command_timeout:g} s"
+                ) from err
+            finally:
+                # Written once the slot is free for the next call
+                if session is not None:
+                    await session.async_finish()
+
+    async def _async_run_job(
+        self, lease: SlotLease, deadline: float, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run `func` in the executor, giving up on it after `deadline` seconds.
+
+        The thread of a job given up on keeps running, so the lease holds the
+        slot until it ends.
+        """
+        job = asyncio.ensure_future(self.hass.async_add_executor_job(func, *args))
+        try:
+            async with asyncio.timeout(deadline):
+                return await asyncio.shield(job)
+        except (TimeoutError, asyncio.CancelledError):
+            lease.hold_until(job)
+            raise
+
+    async def _async_update_data(self) -> dict[str, VehicleSnapshot]:
+        """Fetch data from API endpoint."""
+        if self.source is not None:
+            self.vehicles = self.source.vehicles
+            return self.source.data or {}
+        self._profile_session = self.profiler.start(TARGET_UPDATE, "poll")
+        try:
+            with self.tracer.start_as_current_span("zeekr.update", root=True) as span:
+                data = await self._async_fetch_data()
+                span.set_attribute("vehicle_count", len(data))
+                return data
+        finally:
+            # The refresh schedules the next poll once this returns
+            self._async_time_next_poll()
+            if self._profile_session is not None:
+                session, self._profile_session = self._profile_session, None
+                await session.async_finish()
+
+    async def _async_fetch_data(self) -> dict[str, VehicleSnapshot]:
+        """Fetch the vehicle list and the status of every vehicle."""
+        requested, self._refresh_requested = self._refresh_requested, False
+        try:
+            if self._vehicle_list_due():
+                await self._async_update_vehicle_list(
+                    LANE_REFRESH if requested else LANE_POLL
                 )
+
+            data: dict[str, VehicleSnapshot] = {}
+            raw_data: dict[str, dict[str, Any]] = {}
+            timed_out: TimeoutError | None = None
+            answered = False
+            # Vehicles with a command to confirm go first
+            lanes = {vin: self._vehicle_lane(vin, requested) for vin in self.vehicles}
+            for vin in sorted(self.vehicles, key=lanes.__getitem__):
+                vehicle = self.vehicles[vin]
+                lane = lanes[vin]
+                previous = (self.data or {}).get(vehicle.vin)
                 # get_status returns a dict, no need to wrap if it was a property, but it's a method calling network
-                await self.request_stats.async_inc_request()
-                vehicle_data = await self.hass.async_add_executor_job(
-                    vehicle.get_status
-                )
-                if vehicle_state:
-                    vehicle_data.setdefault("additionalVehicleStatus", {})[
-                        "remoteControlState"
-                    ] = vehicle_state
-                data[vehicle.vin] = vehicle_data
+                try:
+                    vehicle_data = await self._async_call_api(
+                        "get_status",
+                        vehicle.get_status,
+                        vin=vehicle.vin,
+                        lane=lane,
+                    )
+                except TimeoutError as timeout_err:
+                    # The other vehicles still update; this one keeps its data
+                    _LOGGER.warning("Zeekr status of %s: %s", vehicle.vin[-4:], timeout_err)
+                    timed_out = timeout_err
+                    if previous is not None:
+                        data[vehicle.vin] = previous
+                        if vehicle.vin in self.raw_data:
+                            raw_data[vehicle.vin] = self.raw_data[vehicle.vin]
+                    continue
+                answered = True
+                self.vin_updated_at[vehicle.vin] = time.time()
+
+                # The car has not sent anything new since the last poll
+                status_time = status_update_time(vehicle_data)
+                if (
+                    previous is not None
+                    and status_time is not None
+                    and status_time == self.vin_status_time.get(vehicle.vin)
+                ):
+                    data[vehicle.vin] = await self._async_unchanged_snapshot(
+                        vehicle, previous, lane
+                    )
+                    if vehicle.vin in self.raw_data:
+                        raw_data[vehicle.vin] = self.raw_data[vehicle.vin]
+                    continue
+
+                # Capabilities whose endpoint is left out this time
+                unprobed = {
+                    capability
+                    for endpoint, capability in ENDPOINT_CAPABILITIES.items()
+                    if not self._fetches(vehicle.vin, endpoint)
+                }
+                await self._async_fetch_optional(vehicle, vehicle_data, unprobed, lane)
 
                 # Fetch charging status if vehicle is currently charging
                 if vehicle_data.get("additionalVehicleStatus", {}).get("electricVehicleStatus", {}).get("chargerState"):
                     try:
-                        await self.request_stats.async_inc_request()
-                        charging_status = await self.hass.async_add_executor_job(
-                            vehicle.get_charging_status
+                        charging_status = await self._async_call_api(
+                            "get_charging_status",
+                            vehicle.get_charging_status,
+                            vin=vehicle.vin,
+                            lane=lane,
                         )
                         if charging_status:
                             vehicle_data.setdefault("chargingStatus", {}).update(charging_status)
                     except Exception as charge_err:
                         _LOGGER.debug("Error fetching charging status for %s: %s", vehicle.vin, charge_err)
 
-                # Fetch charging limit
-                try:
-                    await self.request_stats.async_inc_request()
-                    charging_limit = await self.hass.async_add_executor_job(
-                        vehicle.get_charging_limit
-                    )
-                    if charging_limit:
-                        vehicle_data["chargingLimit"] = charging_limit
-                except Exception as limit_err:
-                    _LOGGER.debug("Error fetching charging limit for %s: %s", vehicle.vin, limit_err)
+                self.capability_profile.async_learn(vehicle.vin, vehicle_data, unprobed)
+                data[vehicle.vin] = VehicleSnapshot.from_status(vehicle_data)
+                self.vin_status_time[vehicle.vin] = status_time
+                if self.raw_retention:
+                    raw_data[vehicle.vin] = vehicle_data
+
+            # Partial data is fine, but an update without any answer failed
+            if timed_out is not None and not answered:
+                raise timed_out
+            self.raw_data = raw_data
+            self.overlay.reconcile(data)
 
             # Update latest poll time on every automatic poll
             self.latest_poll_time = datetime.now().isoformat()
 
         except Exception as err:
+            if is_auth_error(err):
+                raise ConfigEntryAuthFailed(f"Zeekr login is no longer valid: {err}") from err
             raise UpdateFailed(f"Error communicating with API: {err}") from err
         else:
             return data
 
+    async def _async_fetch_optional(
+        self,
+        vehicle: Vehicle,
+        vehicle_data: dict[str, Any],
+        unprobed: set[str],
+        lane: int,
+    ) -> None:
+        """Merge the remote control state and charging limit into `vehicle_data`.
+
+        Endpoints of capabilities in `unprobed` are left out, and those whose
+        request fails are added to it.
+        """
+        # Only sentry mode is read from the remote control state
+        if CAPABILITY_SENTRY_MODE not in unprobed:
+            try:
+                vehicle_state = await self._async_call_api(
+                    "get_remote_control_state",
+                    vehicle.get_remote_control_state,
+                    vin=vehicle.vin,
+                    lane=lane,
+                )
+            except Exception as state_err:
+                if is_auth_error(state_err):
+                    raise
+                _LOGGER.debug("Remote control state of %s: %s", vehicle.vin, state_err)
+                vehicle_state = None
+                # A failed request says nothing about the capability
+                unprobed.add(CAPABILITY_SENTRY_MODE)
+            if vehicle_state:
+                vehicle_data.setdefault("additionalVehicleStatus", {})[
+                    "remoteControlState"
+                ] = vehicle_state
+
+        # Fetch charging limit
+        if CAPABILITY_CHARGING_LIMIT not in unprobed:
+            try:
+                charging_limit = await self._async_call_api(
+                    "get_charging_limit",
+                    vehicle.get_charging_limit,
+                    vin=vehicle.vin,
+                    lane=lane,
+                )
+                if charging_limit:
+                    vehicle_data["chargingLimit"] = charging_limit
+            except Exception as limit_err:
+                _LOGGER.debug("Error fetching charging limit for %s: %s", vehicle.vin, limit_err)
+                unprobed.add(CAPABILITY_CHARGING_LIMIT)
+
+    async def _async_unchanged_snapshot(
+        self, vehicle: Vehicle, previous: VehicleSnapshot, lane: int
+    ) -> VehicleSnapshot:
+        """Reuse the previous snapshot of a vehicle whose status did not change.
+
+        The remote control state and charging limit do not move the status
+        update time, so they are fetched again as usual; a new value updates
+        only its own field. While charging, the charging status is fetched
+        again too, unless skipping it is enabled. Unchanged values keep the
+        very same snapshot, so the entities of the vehicle skip their state
+        writes.
+        """
+        self.unchanged_polls += 1
+        vin = vehicle.vin
+        # Capabilities ruled out are only probed again on a changed status
+        unprobed = {
+            capability
+            for endpoint, capability in ENDPOINT_CAPABILITIES.items()
+            if not self.supports(vin, capability)
+            or not self.fetch_plan.fetches(vin, endpoint)
+        }
+        optional: dict[str, Any] = {}
+        await self._async_fetch_optional(vehicle, optional, unprobed, lane)
+        fetched = VehicleSnapshot.from_status(optional)
+        fields: dict[str, Any] = {}
+        if CAPABILITY_SENTRY_MODE not in unprobed:
+            fields["sentry_mode"] = fetched.sentry_mode
+        if CAPABILITY_CHARGING_LIMIT not in unprobed:
+            fields["charging_limit"] = fetched.charging_limit
+
+        if not self.skip_unchanged_charging and previous.charger_active:
+            try:
+                charging_status = await self._async_call_api(
+                    "get_charging_status",
+                    vehicle.get_charging_status,
+                    vin=vin,
+                    lane=lane,
+                )
+            except Exception as charge_err:
+                _LOGGER.debug("Error fetching charging status for %s: %s", vin, charge_err)
+            else:
+                if charging_status:
+                    fields.update(charging_fields(charging_status))
+
+        if all(getattr(previous, name) == value for name, value in fields.items()):
+            return previous
+        return replace(previous, **fields)
+
     async def async_inc_invoke(self):
         await self.request_stats.async_inc_invoke()
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable
 
 from homeassistant.components.cover import (
     CoverDeviceClass,
     CoverEntity,
+    CoverEntityDescription,
     CoverEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -14,8 +17,46 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CAPABILITY_SUNSHADE, DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import (
+    ZeekrEntityDescription,
+    ZeekrVehicleEntity,
+    async_setup_vehicle_entities,
+    attributes_getter,
+    vehicle_descriptions,
+)
+from .snapshot import POSITIONS, VehicleSnapshot
+from .tracing import traced, traced_command
+
+
+@dataclass(frozen=True, kw_only=True)
+class ZeekrWindowEntityDescription(ZeekrEntityDescription, CoverEntityDescription):
+    """Describes a read-only window; `value_fn` returns whether it is closed."""
+
+    position_fn: Callable[[VehicleSnapshot], int | None]
+    device_class: CoverDeviceClass | None = CoverDeviceClass.WINDOW
+
+
+WINDOW_DESCRIPTIONS: tuple[ZeekrWindowEntityDescription, ...] = tuple(
+    ZeekrWindowEntityDescription(
+        key=f"window_{win.lower()}",
+        name=f"Window {win}",
+        value_fn=attrgetter(f"window_closed_{suffix}"),
+        position_fn=attrgetter(f"window_position_{suffix}"),
+        grouped=True,
+    )
+    for win, suffix in POSITIONS.items()
+)
+
+# All four windows at once, for the combined entity
+_windows_closed = attrgetter(*(f"window_closed_{suffix}" for suffix in POSITIONS.values()))
+_window_positions = attrgetter(
+    *(f"window_position_{suffix}" for suffix in POSITIONS.values())
+)
+_window_attributes = attributes_getter(
+    {f"position_{suffix}": f"window_position_{suffix}" for suffix in POSITIONS.values()}
+)
 
 
 async def async_setup_entry(
@@ -25,17 +66,20 @@ async def async_setup_entry(
 ) -> None:
     """Set up the cover platform."""
     coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities: list[CoverEntity] = []
+    # The combined Windows entity covers these in compact mode
+    window_descriptions = vehicle_descriptions(coordinator, WINDOW_DESCRIPTIONS)
 
-    for vin in coordinator.data:
-        entities.append(ZeekrSunshade(coordinator, vin))
+    def _vehicle_entities(vin: str) -> list[CoverEntity]:
+        entities: list[CoverEntity] = []
+        if coordinator.supports(vin, CAPABILITY_SUNSHADE):
+            entities.append(ZeekrSunshade(coordinator, vin))
         entities.append(ZeekrWindows(coordinator, vin))
-
         # Add individual read-only windows
-        for win in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            entities.append(ZeekrWindow(coordinator, vin, win, f"Window {win}"))
+        for description in window_descriptions:
+            entities.append(ZeekrWindow(coordinator, vin, description))
+        return entities
 
-    async_add_entities(entities)
+    async_setup_vehicle_entities(hass, entry, async_add_entities, _vehicle_entities)
 
 
 class ZeekrSunshade(CoordinatorEntity, CoverEntity):
@@ -51,23 +95,18 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
         self._attr_name = f"Zeekr {vin[-4:] if vin else ''} Sunshade"
         self._attr_unique_id = f"{vin}_sunshade"
 
+    @property
+    def available(self) -> bool:
+        """Return whether the coordinator is up and the vehicle has a sunshade."""
+        return super().available and self.coordinator.supports(self.vin, CAPABILITY_SUNSHADE)
+
     @property
     def is_closed(self) -> bool | None:
         """Return if the cover is closed or not."""
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get("curtainOpenStatus")
-            )
-            if val is None:
-                return None
-            # User: "2" (open), "1" (closed)
-            # is_closed expects True if closed
-            return str(val) == "1"
-        except (ValueError, TypeError, AttributeError):
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is None:
             return None
+        return snapshot.sunshade_closed
 
     @property
     def current_cover_position(self) -> int | None:
@@ -75,17 +114,12 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
 
         0 is closed, 100 is open.
         """
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get("curtainPos")
-            )
-            return int(val) if val is not None else None
-        except (ValueError, TypeError, AttributeError):
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is None:
             return None
+        return snapshot.sunshade_position
 
+    @traced_command
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
@@ -103,14 +137,14 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_remote_control(
+            vehicle, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=True)
         self.async_write_ha_state()
         await self.coordinator.async_request_refresh()
 
+    @traced_command
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close cover."""
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
@@ -128,32 +162,22 @@ class ZeekrSunshade(CoordinatorEntity, CoverEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_remote_control(
+            vehicle, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=False)
         self.async_write_ha_state()
         await self.coordinator.async_request_refresh()
 
+    @traced("zeekr.optimistic_write")
     def _update_local_state_optimistically(self, is_open: bool) -> None:
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
-            return
-
-        climate_status = (
-            data.setdefault("additionalVehicleStatus", {})
-            .setdefault("climateStatus", {})
+        """Show the requested state until a poll confirms it."""
+        self.coordinator.async_set_optimistic(
+            self.vin,
+            sunshade_closed=not is_open,
+            sunshade_position=100 if is_open else 0,
         )
 
-        if is_open:
-            climate_status["curtainOpenStatus"] = "2"
-            climate_status["curtainPos"] = 100
-        else:
-            climate_status["curtainOpenStatus"] = "1"
-            climate_status["curtainPos"] = 0
-
     @property
     def device_info(self):
         """Return device info."""
@@ -180,20 +204,10 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
     @property
     def is_closed(self) -> bool | None:
         """Return if the windows are closed (all closed)."""
-        data = self.coordinator.data.get(self.vin, {})
-        climate_status = data.get("additionalVehicleStatus", {}).get("climateStatus", {})
-
-        # Check all 4 windows
-        # Status code mapping based on API observations:
-        # "1" = Open (or partially open)
-        # "2" = Closed
-        # "0" = Fully Closed (Position 0%)
-
-        for win in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            status = climate_status.get(f"winStatus{win}")
-            if str(status) != "2":
-                return False
-        return True
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is None:
+            return False
+        return all(closed is True for closed in _windows_closed(snapshot))
 
     @property
     def current_cover_position(self) -> int | None:
@@ -201,25 +215,25 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
 
         0 is closed, 100 is open.
         """
-        data = self.coordinator.data.get(self.vin, {})
-        climate_status = data.get("additionalVehicleStatus", {}).get("climateStatus", {})
-
-        total_pos = 0
-        count = 0
-
-        for win in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            pos = climate_status.get(f"winPos{win}")
-            if pos is not None:
-                try:
-                    total_pos += int(pos)
-                    count += 1
-                except (ValueError, TypeError):
-                    pass
-
-        if count == 0:
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is None:
+            return None
+        positions = [pos for pos in _window_positions(snapshot) if pos is not None]
+        if not positions:
             return None
-        return int(total_pos / count)
+        return int(sum(positions) / len(positions))
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Per-window positions, in place of the window entities in compact mode."""
+        if not self.coordinator.compact_mode:
+            return None
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is None:
+            return None
+        return _window_attributes(snapshot)
+
+    @traced_command
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open all windows."""
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
@@ -237,14 +251,14 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_remote_control(
+            vehicle, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=True)
         self.async_write_ha_state()
         await self.coordinator.async_request_refresh()
 
+    @traced_command
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close all windows."""
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
@@ -262,32 +276,21 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_remote_control(
+            vehicle, command, service_id, setting
         )
         self._update_local_state_optimistically(is_open=False)
         self.async_write_ha_state()
         await self.coordinator.async_request_refresh()
 
+    @traced("zeekr.optimistic_write")
     def _update_local_state_optimistically(self, is_open: bool) -> None:
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
-            return
-
-        climate_status = (
-            data.setdefault("additionalVehicleStatus", {})
-            .setdefault("climateStatus", {})
-        )
-
-        # Update all 4 windows
-        status_val = "1" if is_open else "2"
-        pos_val = 100 if is_open else 0
-
-        for win in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            climate_status[f"winStatus{win}"] = status_val
-            climate_status[f"winPos{win}"] = pos_val
+        """Show the requested state until a poll confirms it."""
+        fields: dict[str, Any] = {}
+        for suffix in POSITIONS.values():
+            fields[f"window_closed_{suffix}"] = not is_open
+            fields[f"window_position_{suffix}"] = 100 if is_open else 0
+        self.coordinator.async_set_optimistic(self.vin, **fields)
 
     @property
     def device_info(self):
@@ -299,50 +302,24 @@ class ZeekrWindows(CoordinatorEntity, CoverEntity):
         }
 
 
-class ZeekrWindow(CoordinatorEntity, CoverEntity):
+class ZeekrWindow(ZeekrVehicleEntity, CoverEntity):
     """Zeekr Window (Read-Only) class."""
 
-    _attr_device_class = CoverDeviceClass.WINDOW
+    entity_description: ZeekrWindowEntityDescription
     _attr_supported_features = CoverEntityFeature(0)
 
-    def __init__(self, coordinator: ZeekrCoordinator, vin: str, win_key: str, win_name: str) -> None:
-        """Initialize the cover entity."""
-        super().__init__(coordinator)
-        self.vin = vin
-        self.win_key = win_key
-        self._attr_name = f"Zeekr {vin[-4:] if vin else ''} {win_name}"
-        self._attr_unique_id = f"{vin}_window_{win_key.lower()}"
-
     @property
     def is_closed(self) -> bool | None:
         """Return if the window is closed."""
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get(f"winStatus{self.win_key}")
-            )
-            if val is None:
-                return None
-            # "2" is Closed, "1" is Open
-            return str(val) == "2"
-        except (ValueError, TypeError, AttributeError):
-            return None
+        return self._snapshot_value()
 
     @property
     def current_cover_position(self) -> int | None:
         """Return current position of cover."""
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get(f"winPos{self.win_key}")
-            )
-            return int(val) if val is not None else None
-        except (ValueError, TypeError, AttributeError):
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is None:
             return None
+        return self.entity_description.position_fn(snapshot)
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover (Not supported)."""
@@ -351,12 +328,3 @@ class ZeekrWindow(CoordinatorEntity, CoverEntity):
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close cover (Not supported)."""
         pass
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self.vin)},
-            "name": f"Zeekr {self.vin}",
-            "manufacturer": "Zeekr",
-        }
@@ -11,6 +11,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import async_setup_vehicle_entities
 
 
 async def async_setup_entry(
@@ -21,11 +22,9 @@ async def async_setup_entry(
     """Set up the device tracker platform."""
     coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for vin in coordinator.data:
-        entities.append(ZeekrDeviceTracker(coordinator, vin))
-
-    async_add_entities(entities)
+    async_setup_vehicle_entities(
+        hass, entry, async_add_entities, lambda vin: (ZeekrDeviceTracker(coordinator, vin),)
+    )
 
 
 class ZeekrDeviceTracker(CoordinatorEntity, TrackerEntity):
@@ -46,24 +45,18 @@ class ZeekrDeviceTracker(CoordinatorEntity, TrackerEntity):
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the device."""
-        data = self.coordinator.data.get(self.vin, {})
-        try:
-            val = data.get("basicVehicleStatus", {}).get("position", {}).get("latitude")
-            return float(val) if val else None
-        except (ValueError, TypeError):
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is None:
             return None
+        return snapshot.latitude
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the device."""
-        data = self.coordinator.data.get(self.vin, {})
-        try:
-            val = (
-                data.get("basicVehicleStatus", {}).get("position", {}).get("longitude")
-            )
-            return float(val) if val else None
-        except (ValueError, TypeError):
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is None:
             return None
+        return snapshot.longitude
 
     @property
     def device_info(self):
@@ -0,0 +1,165 @@
+"""Diagnostics support for Zeekr EV API Integration.
+
+Everything here is assembled from in-memory state only, so downloading
+diagnostics never triggers a request against the Zeekr API.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntry
+
+from .const import (
+    CONF_HMAC_ACCESS_KEY,
+    CONF_HMAC_SECRET_KEY,
+    CONF_PASSWORD,
+    CONF_PASSWORD_PUBLIC_KEY,
+    CONF_PROD_SECRET,
+    CONF_USERNAME,
+    CONF_VIN_IV,
+    CONF_VIN_KEY,
+    DOMAIN,
+)
+from .coordinator import ZeekrCoordinator
+
+TO_REDACT = {
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_HMAC_ACCESS_KEY,
+    CONF_HMAC_SECRET_KEY,
+    CONF_PASSWORD_PUBLIC_KEY,
+    CONF_PROD_SECRET,
+    CONF_VIN_KEY,
+    CONF_VIN_IV,
+    "vin",
+    "plateNo",
+    "latitude",
+    "longitude",
+    "auth_token",
+    "bearer_token",
+}
+
+
+def redact_vin(vin: str) -> str:
+    """Keep only the last four characters of a VIN, like entity names do."""
+    return f"**REDACTED**{vin[-4:]}"
+
+
+def _client_diagnostics(coordinator: ZeekrCoordinator) -> dict[str, Any]:
+    client = coordinator.client
+    return {
+        "logged_in": getattr(client, "logged_in", False),
+        "has_auth_token": bool(getattr(client, "auth_token", None)),
+        "has_bearer_token": bool(getattr(client, "bearer_token", None)),
+        "region_code": getattr(client, "region_code", None),
+        "app_server_host": getattr(client, "app_server_host", None),
+    }
+
+
+def _coordinator_diagnostics(coordinator: ZeekrCoordinator) -> dict[str, Any]:
+    interval = coordinator.polling_interval
+    return {
+        "update_interval": interval.total_seconds() if interval else None,
+        "last_update_success": coordinator.last_update_success,
+        "last_exception": (
+            repr(coordinator.last_exception) if coordinator.last_exception else None
+        ),
+        "latest_poll_time": coordinator.latest_poll_time,
+        "vehicle_count": len(coordinator.vehicles),
+        # Entry whose coordinator polls for this one, when sharing an account
+        "follows_entry": coordinator.source.entry.entry_id if coordinator.source else None,
+        "durations": {
+            "seat": coordinator.seat_duration,
+            "ac": coordinator.ac_duration,
+            "steering_wheel": coordinator.steering_wheel_duration,
+        },
+        "value_cache": _value_cache_diagnostics(coordinator),
+        "unchanged_polls": coordinator.unchanged_polls,
+        "fetch_plan": _fetch_plan_diagnostics(coordinator),
+    }
+
+
+def _value_cache_diagnostics(coordinator: ZeekrCoordinator) -> dict[str, Any]:
+    hits = coordinator.value_cache_hits
+    reads = hits + coordinator.value_cache_misses
+    return {
+        "generation": coordinator.generation,
+        "hits": hits,
+        "misses": coordinator.value_cache_misses,
+        "hit_rate": round(hits / reads, 3) if reads else None,
+    }
+
+
+def _fetch_plan_diagnostics(coordinator: ZeekrCoordinator) -> dict[str, Any]:
+    interval = coordinator.polling_interval
+    polls_per_day = 86400 / interval.total_seconds() if interval else 0
+    plan = coordinator.fetch_plan.as_dict(polls_per_day)
+    plan["skipped"] = {redact_vin(vin): endpoints for vin, endpoints in plan["skipped"].items()}
+    return plan
+
+
+def _request_stats_diagnostics(coordinator: ZeekrCoordinator) -> dict[str, Any]:
+    stats = coordinator.request_stats
+    return {
+        "counters": stats.as_dict(),
+        "latency": stats.latency_as_dict(),
+        "timeouts": dict(stats.timeouts),
+    }
+
+
+def _vehicle_diagnostics(coordinator: ZeekrCoordinator, vin: str) -> dict[str, Any]:
+    vehicle = coordinator.get_vehicle_by_vin(vin)
+    snapshot = (coordinator.data or {}).get(vin)
+    diagnostics = {
+        "vehicle": async_redact_data(dict(getattr(vehicle, "data", None) or {}), TO_REDACT),
+        "snapshot": async_redact_data(snapshot.as_dict() if snapshot else {}, TO_REDACT),
+        "optimistic": async_redact_data(coordinator.overlay.pending(vin), TO_REDACT),
+        "capabilities": coordinator.capability_profile.as_dict(vin),
+    }
+    # The raw API response is only kept when raw retention is enabled
+    if vin in coordinator.raw_data:
+        diagnostics["data"] = async_redact_data(coordinator.raw_data[vin], TO_REDACT)
+    return diagnostics
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "client": _client_diagnostics(coordinator),
+        "coordinator": _coordinator_diagnostics(coordinator),
+        "request_stats": _request_stats_diagnostics(coordinator),
+        "watchdog": coordinator.watchdog.as_dict(),
+        "scheduler": coordinator.scheduler.as_dict(),
+        "vehicles": {
+            redact_vin(vin): _vehicle_diagnostics(coordinator, vin)
+            for vin in (coordinator.data or {})
+        },
+    }
+
+
+async def async_get_device_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry, device: DeviceEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a single vehicle device."""
+    coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
+    vin = next(
+        (ident for domain, ident in device.identifiers if domain == DOMAIN), None
+    )
+
+    diagnostics: dict[str, Any] = {
+        "client": _client_diagnostics(coordinator),
+        "coordinator": _coordinator_diagnostics(coordinator),
+        "request_stats": _request_stats_diagnostics(coordinator),
+    }
+    if vin and vin in (coordinator.data or {}):
+        diagnostics["vehicle"] = _vehicle_diagnostics(coordinator, vin)
+    return diagnostics
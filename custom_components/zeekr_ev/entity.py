@@ -2,19 +2,36 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, replace
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import ZeekrCoordinator
+from .const import DOMAIN, SIGNAL_CAPABILITIES_CHANGED, SIGNAL_NEW_VEHICLE
+from .coordinator import ZeekrCoordinator, vehicle_model
+from .snapshot import VehicleSnapshot
 
 import logging
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds without a new setpoint before the last one is sent
+SETPOINT_DELAY = 2.0
+
 
 class ZeekrEntity(CoordinatorEntity[ZeekrCoordinator]):
     """Base entity for Zeekr."""
 
+    # Capability the entity needs, it is unavailable while the vehicle lacks it
+    _capability: str | None = None
+
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize."""
         super().__init__(coordinator)
@@ -23,12 +40,279 @@ class ZeekrEntity(CoordinatorEntity[ZeekrCoordinator]):
         self.vin = vin
         vehicle = coordinator.get_vehicle_by_vin(vin)
         if vehicle:
-            plate_no = getattr(vehicle, "data", {}).get("plateNo")
-            display_os_version = getattr(vehicle, "data", {}).get("displayOSVersion")
-
             self._attr_device_info = DeviceInfo(
                 identifiers={(DOMAIN, vin)},
                 name=vehicle.vin,
                 manufacturer="Zeekr",
-                model=f"{plate_no} (OS Version {display_os_version})" if display_os_version else plate_no or "Zeekr EV",
+                model=vehicle_model(vehicle),
             )
+
+    @property
+    def available(self) -> bool:
+        """Return whether the coordinator is up and the vehicle has the capability."""
+        return super().available and self.coordinator.supports(self.vin, self._capability)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ZeekrEntityDescription(EntityDescription):
+    """Describes a per-vehicle entity whose state comes from the VehicleSnapshot.
+
+    `value_fn` is built once when the description table is defined (usually an
+    ``operator.attrgetter``) and shared by the entities of every vehicle.
+    Descriptions marked `grouped` are summarized by a grouped entity in
+    compact mode and are disabled by default there. Descriptions with a
+    `capability` are only set up for vehicles that have it, and their
+    entities are unavailable while it is ruled out later.
+    """
+
+    value_fn: Callable[[VehicleSnapshot], Any]
+    attributes_fn: Callable[[VehicleSnapshot], dict[str, Any]] | None = None
+    grouped: bool = False
+    capability: str | None = None
+
+
+_DescriptionT = TypeVar("_DescriptionT", bound=ZeekrEntityDescription)
+
+
+def attributes_getter(fields: dict[str, str]) -> Callable[[VehicleSnapshot], dict[str, Any]]:
+    """Build an `attributes_fn` mapping attribute names to snapshot fields."""
+    names = tuple(fields)
+    getter = attrgetter(*fields.values())
+
+    def _attributes(snapshot: VehicleSnapshot) -> dict[str, Any]:
+        return dict(zip(names, getter(snapshot)))
+
+    return _attributes
+
+
+def vehicle_descriptions(
+    coordinator: ZeekrCoordinator, descriptions: Iterable[_DescriptionT]
+) -> list[_DescriptionT]:
+    """Return the descriptions to set up, disabling grouped ones in compact mode."""
+    if not coordinator.compact_mode:
+        return list(descriptions)
+    # A field of the HA base class, which type checkers do not see on
+    # `_DescriptionT`
+    disabled: dict[str, Any] = {"entity_registry_enabled_default": False}
+    return [
+        replace(description, **disabled)
+        if description.grouped
+        else description
+        for description in descriptions
+    ]
+
+
+@callback
+def async_setup_vehicle_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    entities_fn: Callable[[str], Iterable[Entity]],
+    entities: Iterable[Entity] = (),
+) -> None:
+    """Add `entities` and the entities of every vehicle, now and when found later.
+
+    `entities_fn` returns the entities a vehicle should have; when its
+    capabilities change, new ones are added. Entities it no longer returns
+    are kept, with their registry entries, and show up as unavailable.
+    """
+    coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
+    # vin -> unique ids of the entities added for that vehicle; only the ids,
+    # so entities Home Assistant does not add (disabled ones) can be freed
+    added: dict[str, set[str | None]] = {}
+
+    def _vehicle_entities(vin: str) -> list[Entity]:
+        vehicle_entities = list(entities_fn(vin))
+        added[vin] = {entity.unique_id for entity in vehicle_entities}
+        return vehicle_entities
+
+    async_add_entities(
+        [*entities, *(entity for vin in coordinator.data or {} for entity in _vehicle_entities(vin))]
+    )
+
+    @callback
+    def _async_add_vehicle(vin: str) -> None:
+        async_add_entities(_vehicle_entities(vin))
+
+    @callback
+    def _async_capabilities_changed(vin: str) -> None:
+        current = added.setdefault(vin, set())
+        if new := [entity for entity in entities_fn(vin) if entity.unique_id not in current]:
+            current.update(entity.unique_id for entity in new)
+            async_add_entities(new)
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_NEW_VEHICLE.format(entry.entry_id), _async_add_vehicle
+        )
+    )
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_CAPABILITIES_CHANGED.format(entry.entry_id),
+            _async_capabilities_changed,
+        )
+    )
+
+
+class ZeekrSetpointEntity(Entity):
+    """Entity that sends only the last of quickly changed setpoints.
+
+    Dragging a slider sends a new value every step, and every value used to
+    be a remote control invoke. Each change restarts SETPOINT_DELAY; once it
+    passes, the last scheduled send runs. Entities show the new value right
+    away, optimistically; the optimistic fields are cleared again when the
+    send fails.
+    """
+
+    coordinator: ZeekrCoordinator
+    vin: str
+    _setpoint_send: Callable[[], Awaitable[Any]] | None = None
+    _setpoint_fields: tuple[str, ...] = ()
+    _setpoint_cancel: Callable[[], None] | None = None
+
+    @callback
+    def async_schedule_setpoint(
+        self, send: Callable[[], Awaitable[Any]], *optimistic: str
+    ) -> None:
+        """Send a setpoint once no newer one follows within SETPOINT_DELAY.
+
+        `optimistic` names the snapshot fields shown optimistically for it.
+        """
+        self._setpoint_send = send
+        self._setpoint_fields = optimistic
+        if self._setpoint_cancel is not None:
+            self._setpoint_cancel()
+        self._setpoint_cancel = async_call_later(
+            self.hass, SETPOINT_DELAY, self._async_setpoint_delay_passed
+        )
+
+    async def _async_setpoint_delay_passed(self, _now: Any) -> None:
+        self._setpoint_cancel = None
+        await self.async_flush_setpoint()
+
+    async def async_flush_setpoint(self) -> None:
+        """Send the pending setpoint now, if any."""
+        if self._setpoint_cancel is not None:
+            self._setpoint_cancel()
+            self._setpoint_cancel = None
+        send, self._setpoint_send = self._setpoint_send, None
+        if send is None:
+            return
+        # A newer setpoint may be scheduled while this one is sent
+        fields = self._setpoint_fields
+        try:
+            await send()
+        except Exception as err:
+            # Nobody awaits the send, so the error is only logged
+            _LOGGER.error("Could not send the setpoint of %s: %s", self.entity_id, err)
+            if fields:
+                self.coordinator.async_clear_optimistic(self.vin, *fields)
+
+    @callback
+    def async_cancel_setpoint(self) -> None:
+        """Drop the pending setpoint."""
+        if self._setpoint_cancel is not None:
+            self._setpoint_cancel()
+            self._setpoint_cancel = None
+        self._setpoint_send = None
+        self._setpoint_fields = ()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Still send a pending setpoint when the entity goes away."""
+        await super().async_will_remove_from_hass()
+        if self._setpoint_send is not None:
+            self.hass.async_create_task(self.async_flush_setpoint())
+
+
+class ZeekrVehicleEntity(CoordinatorEntity[ZeekrCoordinator]):
+    """Per-vehicle entity driven by a ZeekrEntityDescription."""
+
+    entity_description: ZeekrEntityDescription
+
+    def __init__(
+        self,
+        coordinator: ZeekrCoordinator,
+        vin: str,
+        description: ZeekrEntityDescription,
+    ) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self.vin = vin
+        self.entity_description = description
+        if not self.has_entity_name:
+            self._attr_name = f"Zeekr {vin[-4:] if vin else ''} {description.name}"
+        self._attr_unique_id = f"{vin}_{description.key}"
+        self._value: Any = None
+        self._value_generation: int | None = None
+        self._written_snapshot: VehicleSnapshot | None = None
+        self._written_available: bool | None = None
+
+    def _snapshot_value(self) -> Any:
+        """Return the described value, None while the vehicle has no data.
+
+        HA reads state properties several times per state write, so the value
+        is computed once per coordinator generation.
+        """
+        coordinator = self.coordinator
+        if self._value_generation == coordinator.generation:
+            coordinator.value_cache_hits += 1
+            return self._value
+        coordinator.value_cache_misses += 1
+        snapshot = coordinator.get_snapshot(self.vin)
+        value = None if snapshot is None else self.entity_description.value_fn(snapshot)
+        self._value = value
+        self._value_generation = coordinator.generation
+        return value
+
+    def _snapshot_changed(self) -> bool:
+        """Return whether the vehicle's snapshot changed since the last write.
+
+        The coordinator hands back the same snapshot object for a vehicle that
+        sent nothing new, so identity is enough.
+        """
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        available = self.available
+        if (
+            snapshot is not None
+            and snapshot is self._written_snapshot
+            and available == self._written_available
+        ):
+            return False
+        self._written_snapshot = snapshot
+        self._written_available = available
+        return True
+
+    @property
+    def available(self) -> bool:
+        """Return whether the coordinator is up and the vehicle has the capability."""
+        capability = self.entity_description.capability
+        return super().available and (
+            capability is None or self.coordinator.supports(self.vin, capability)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state unless the vehicle's snapshot is unchanged."""
+        if self._snapshot_changed():
+            self.async_write_ha_state()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the described attributes, if any."""
+        attributes_fn = self.entity_description.attributes_fn
+        if attributes_fn is None:
+            return None
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is None:
+            return None
+        return attributes_fn(snapshot)
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return {
+            "identifiers": {(DOMAIN, self.vin)},
+            "name": f"Zeekr {self.vin}",
+            "manufacturer": "Zeekr",
+        }
@@ -0,0 +1,90 @@
+"""Which optional endpoints the coordinator fetches for each vehicle.
+
+Some endpoints only feed a few entities. When the user disables all of them
+in the entity registry, fetching the endpoint is wasted. The plan is built
+from the registry entries of the config entry and rebuilt when entities are
+enabled or disabled. Entries of the same account that follow the polling
+entry add their plans to its plan, so an endpoint is only skipped when the
+entities of every entry reading it are disabled.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from homeassistant.helpers.entity_registry import RegistryEntry
+
+from .const import CAPABILITY_CHARGING_LIMIT, CAPABILITY_SENTRY_MODE
+
+# Endpoint -> unique_id suffixes of the entities reading its data
+ENDPOINT_CONSUMERS: dict[str, tuple[str, ...]] = {
+    "get_charging_limit": ("charging_limit",),
+    "get_remote_control_state": ("sentry_mode",),
+}
+
+# Endpoint -> capability whose data it returns
+ENDPOINT_CAPABILITIES: dict[str, str] = {
+    "get_charging_limit": CAPABILITY_CHARGING_LIMIT,
+    "get_remote_control_state": CAPABILITY_SENTRY_MODE,
+}
+
+
+class FetchPlan:
+    """Endpoints skipped per vehicle because all their entities are disabled."""
+
+    def __init__(self) -> None:
+        # vin -> skipped endpoints
+        self.skipped: dict[str, set[str]] = {}
+        # Plans of the entries following this entry's polls
+        self.followers: set[FetchPlan] = set()
+        # Calls left out since startup
+        self.skipped_calls = 0
+
+    def rebuild(self, entries: Iterable[RegistryEntry]) -> None:
+        """Rebuild the plan from the registry entries of a config entry.
+
+        An endpoint is skipped for a vehicle when it has registered consumers
+        and all of them are disabled; consumers that are not registered yet
+        (a new vehicle) keep it fetched.
+        """
+        # vin -> endpoint -> whether any consumer is enabled
+        enabled: dict[str, dict[str, bool]] = {}
+        for entry in entries:
+            for endpoint, keys in ENDPOINT_CONSUMERS.items():
+                for key in keys:
+                    if not entry.unique_id.endswith(f"_{key}"):
+                        continue
+                    vin = entry.unique_id[: -len(key) - 1]
+                    consumers = enabled.setdefault(vin, {})
+                    consumers[endpoint] = consumers.get(endpoint, False) or (
+                        entry.disabled_by is None
+                    )
+        self.skipped = {
+            vin: skipped
+            for vin, consumers in enabled.items()
+            if (skipped := {endpoint for endpoint, used in consumers.items() if not used})
+        }
+
+    def skips(self, vin: str, endpoint: str) -> bool:
+        """Return whether this plan and all its followers' plans skip an endpoint."""
+        return all(endpoint in plan.skipped.get(vin, ()) for plan in (self, *self.followers))
+
+    def fetches(self, vin: str, endpoint: str) -> bool:
+        """Return whether to fetch an endpoint for a vehicle, counting skips."""
+        if self.skips(vin, endpoint):
+            self.skipped_calls += 1
+            return False
+        return True
+
+    def as_dict(self, polls_per_day: float) -> dict[str, Any]:
+        merged = {
+            vin: vin_skipped
+            for vin, endpoints in self.skipped.items()
+            if (vin_skipped := sorted(endpoint for endpoint in endpoints if self.skips(vin, endpoint)))
+        }
+        skipped = sum(len(endpoints) for endpoints in merged.values())
+        return {
+            "skipped": merged,
+            "skipped_calls": self.skipped_calls,
+            "saved_requests_per_day": round(skipped * polls_per_day),
+        }
@@ -3,21 +3,55 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
-from homeassistant.components.lock import LockEntity
+from homeassistant.components.lock import LockEntity, LockEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import (
+    ZeekrEntityDescription,
+    ZeekrVehicleEntity,
+    async_setup_vehicle_entities,
+)
+from .tracing import get_tracer, traced, traced_command
 
 # Delay before polling after a remote command (seconds)
 COMMAND_POLL_DELAY = 15
 
 
+@dataclass(frozen=True, kw_only=True)
+class ZeekrLockEntityDescription(ZeekrEntityDescription, LockEntityDescription):
+    """Describes a lock-like Zeekr entity; the key is the API field name."""
+
+
+# API field exposed as a lock-like entity -> (Label, VehicleSnapshot attribute)
+LOCK_FIELDS = {
+    "centralLockingStatus": ("Central locking", "central_locked"),
+    "doorLockStatusDriver": ("Driver door lock", "door_locked_driver"),
+    "doorLockStatusPassenger": ("Passenger door lock", "door_locked_passenger"),
+    "doorLockStatusDriverRear": ("Driver rear door lock", "door_locked_driver_rear"),
+    "doorLockStatusPassengerRear": ("Passenger rear door lock", "door_locked_passenger_rear"),
+    "trunkLockStatus": ("Trunk lock", "trunk_locked"),
+    "engineHoodOpenStatus": ("Hood (closed = locked)", "hood_closed"),
+    "electricParkBrakeStatus": ("Electric park brake", "park_brake_on"),
+    # "1" is open (unlocked), "2" is closed (locked)
+    "chargeLidDcAcStatus": ("Charge Lid", "charge_lid_closed"),
+}
+
+LOCK_DESCRIPTIONS: dict[str, ZeekrLockEntityDescription] = {
+    field: ZeekrLockEntityDescription(
+        key=field, name=label, value_fn=attrgetter(snapshot_attr)
+    )
+    for field, (label, snapshot_attr) in LOCK_FIELDS.items()
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -25,85 +59,38 @@ async def async_setup_entry(
 ) -> None:
     """Set up the lock platform."""
     coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities: list[ZeekrLock] = []
-
-    # Fields from drivingSafetyStatus or electricVehicleStatus to expose as lock-like entities
-    # Format: Key -> (Label, Category)
-    lock_fields = {
-        "centralLockingStatus": ("Central locking", "drivingSafetyStatus"),
-        "doorLockStatusDriver": ("Driver door lock", "drivingSafetyStatus"),
-        "doorLockStatusPassenger": ("Passenger door lock", "drivingSafetyStatus"),
-        "doorLockStatusDriverRear": ("Driver rear door lock", "drivingSafetyStatus"),
-        "doorLockStatusPassengerRear": ("Passenger rear door lock", "drivingSafetyStatus"),
-        "trunkLockStatus": ("Trunk lock", "drivingSafetyStatus"),
-        "engineHoodOpenStatus": ("Hood (closed = locked)", "drivingSafetyStatus"),
-        "electricParkBrakeStatus": ("Electric park brake", "drivingSafetyStatus"),
-        "chargeLidDcAcStatus": ("Charge Lid", "electricVehicleStatus"),
-    }
-
-    for vin in coordinator.data:
-        for field, (label, category) in lock_fields.items():
-            entities.append(ZeekrLock(coordinator, vin, field, label, category))
-
-    async_add_entities(entities)
-
-
-class ZeekrLock(CoordinatorEntity, LockEntity):
+    async_setup_vehicle_entities(
+        hass,
+        entry,
+        async_add_entities,
+        lambda vin: (
+            ZeekrLock(coordinator, vin, description)
+            for description in LOCK_DESCRIPTIONS.values()
+        ),
+    )
+
+
+class ZeekrLock(ZeekrVehicleEntity, LockEntity):
     """Zeekr Lock class representing various latch/lock states."""
 
+    entity_description: ZeekrLockEntityDescription
+
     def __init__(
         self,
         coordinator: ZeekrCoordinator,
         vin: str,
-        field: str,
-        label: str,
-        category: str,
+        description: ZeekrLockEntityDescription,
     ) -> None:
         """Initialize the lock entity for a specific field."""
-        super().__init__(coordinator)
-        self.vin = vin
-        self.field = field
-        self.category = category
-        self._attr_name = f"Zeekr {vin[-4:] if vin else ''} {label}"
-        self._attr_unique_id = f"{vin}_{field}"
+        super().__init__(coordinator, vin, description)
+        self.field = description.key
 
     @property
     def is_locked(self) -> bool | None:
         """Return true if lock is locked."""
-        data = self.coordinator.data.get(self.vin, {})
-        try:
-            # category is either "drivingSafetyStatus" or "electricVehicleStatus"
-            # both are under "additionalVehicleStatus"
-            status = data.get("additionalVehicleStatus", {}).get(self.category, {})
-
-            val = status.get(self.field)
-            # None means unknown
-            if val is None:
-                return None
-
-            # Interpret values:
-            if self.field == "chargeLidDcAcStatus":
-                # "1" is open (unlocked), "2" is closed (locked)
-                # If it's not "1", we can assume locked or unknown, but based on "2" is closed:
-                if str(val) == "1":
-                    return False
-                if str(val) == "2":
-                    return True
-                # If unknown value, default to None or handle?
-                # Let's assume strict mapping or fallback. If val is neither, maybe None?
-                # User said "1" is open, "2" is closed.
-                return None
-
-            # Interpret values: many fields use "1" for active/locked, "0" for inactive/open
-            # For *OpenStatus fields, treat "0" (closed) as locked True
-            if self.field.endswith("OpenStatus"):
-                return str(val) != "1"
-
-            # For lock status fields and others, "1" -> locked
-            return str(val) == "1"
-        except (ValueError, TypeError, AttributeError):
-            return None
+        return self._snapshot_value()
 
+    @traced_command
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the car."""
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
@@ -141,9 +128,8 @@ class ZeekrLock(CoordinatorEntity, LockEntity):
             }
 
         if command and service_id and setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
+            await self.coordinator.async_remote_control(
+                vehicle, command, service_id, setting
             )
 
             self._update_local_state_optimistically(locked=True)
@@ -151,10 +137,14 @@ class ZeekrLock(CoordinatorEntity, LockEntity):
 
             # Schedule a delayed refresh to get updated state after car processes command
             async def delayed_refresh():
-                await asyncio.sleep(COMMAND_POLL_DELAY)
-                await self.coordinator.async_request_refresh()
+                with get_tracer(self.coordinator).start_as_current_span(
+                    "zeekr.delayed_refresh", attributes={"vin": self.vin}
+                ):
+                    await asyncio.sleep(COMMAND_POLL_DELAY)
+                    await self.coordinator.async_request_refresh()
             self.hass.async_create_task(delayed_refresh())
 
+    @traced_command
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock the car."""
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
@@ -194,9 +184,8 @@ class ZeekrLock(CoordinatorEntity, LockEntity):
             }
 
         if command and service_id and setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
+            await self.coordinator.async_remote_control(
+                vehicle, command, service_id, setting
             )
 
             self._update_local_state_optimistically(locked=False)
@@ -204,33 +193,17 @@ class ZeekrLock(CoordinatorEntity, LockEntity):
 
             # Schedule a delayed refresh to get updated state after car processes command
             async def delayed_refresh():
-                await asyncio.sleep(COMMAND_POLL_DELAY)
-                await self.coordinator.async_request_refresh()
+                with get_tracer(self.coordinator).start_as_current_span(
+                    "zeekr.delayed_refresh", attributes={"vin": self.vin}
+                ):
+                    await asyncio.sleep(COMMAND_POLL_DELAY)
+                    await self.coordinator.async_request_refresh()
             self.hass.async_create_task(delayed_refresh())
 
+    @traced("zeekr.optimistic_write")
     def _update_local_state_optimistically(self, locked: bool) -> None:
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
-            return
-
-        status = (
-            data.setdefault("additionalVehicleStatus", {})
-            .setdefault(self.category, {})
-        )
-
+        """Show the requested state until a poll confirms it."""
         if self.field == "centralLockingStatus":
-            # Locked="1", Unlocked="0"
-            status[self.field] = "1" if locked else "0"
+            self.coordinator.async_set_optimistic(self.vin, central_locked=locked)
         elif self.field == "chargeLidDcAcStatus":
-            # Locked (Closed)="2", Unlocked (Open)="1"
-            status[self.field] = "2" if locked else "1"
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self.vin)},
-            "name": f"Zeekr {self.vin}",
-            "manufacturer": "Zeekr",
-        }
+            self.coordinator.async_set_optimistic(self.vin, charge_lid_closed=locked)
@@ -0,0 +1,146 @@
+"""OpenMetrics endpoint for Zeekr EV API Integration.
+
+The view is rendered purely from in-memory counters and never touches
+storage or the Zeekr API, so it is safe to scrape frequently.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Iterable
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CONF_METRICS_ENDPOINT, DOMAIN
+from .coordinator import ZeekrCoordinator
+from .diagnostics import redact_vin
+from .request_stats import LATENCY_BUCKETS
+
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+CONTENT_TYPE = "application/openmetrics-text"
+DATA_METRICS_VIEW = "_metrics_view"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def render_metrics(
+    coordinators: Iterable[ZeekrCoordinator], now: float | None = None
+) -> str:
+    """Render integration metrics in the OpenMetrics text format."""
+    now = time.time() if now is None else now
+    coordinators = list(coordinators)
+    lines: list[str] = []
+
+    def family(name: str, kind: str, help_text: str) -> None:
+        lines.append(f"# TYPE {name} {kind}")
+        lines.append(f"# HELP {name} {help_text}")
+
+    def per_entry(sample: str, value_fn: Callable[[ZeekrCoordinator], Any]) -> None:
+        for coordinator in coordinators:
+            lines.append(
+                f"{sample}{_labels(entry=coordinator.entry.entry_id)} {value_fn(coordinator)}"
+            )
+
+    family("zeekr_ev_api_requests", "counter", "Zeekr API requests since first setup.")
+    per_entry("zeekr_ev_api_requests_total", lambda c: c.request_stats.api_requests_total)
+    family("zeekr_ev_api_invokes", "counter", "Zeekr remote control invokes since first setup.")
+    per_entry("zeekr_ev_api_invokes_total", lambda c: c.request_stats.api_invokes_total)
+    family("zeekr_ev_api_requests_today", "gauge", "Zeekr API requests since midnight.")
+    per_entry("zeekr_ev_api_requests_today", lambda c: c.request_stats.api_requests_today)
+    family("zeekr_ev_api_invokes_today", "gauge", "Zeekr remote control invokes since midnight.")
+    per_entry("zeekr_ev_api_invokes_today", lambda c: c.request_stats.api_invokes_today)
+
+    family("zeekr_ev_api_latency_seconds", "histogram", "Zeekr API call latency per endpoint.")
+    for coordinator in coordinators:
+        entry_id = coordinator.entry.entry_id
+        for endpoint, histogram in coordinator.request_stats.latency.items():
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, histogram.buckets):
+                cumulative += count
+                lines.append(
+                    f"zeekr_ev_api_latency_seconds_bucket"
+                    f"{_labels(entry=entry_id, endpoint=endpoint, le=str(bound))} {cumulative}"
+                )
+            lines.append(
+                f"zeekr_ev_api_latency_seconds_bucket"
+                f"{_labels(entry=entry_id, endpoint=endpoint, le='+Inf')} {histogram.count}"
+            )
+            lines.append(
+                f"zeekr_ev_api_latency_seconds_count"
+                f"{_labels(entry=entry_id, endpoint=endpoint)} {histogram.count}"
+            )
+            lines.append(
+                f"zeekr_ev_api_latency_seconds_sum"
+                f"{_labels(entry=entry_id, endpoint=endpoint)} {histogram.total}"
+            )
+
+    family("zeekr_ev_api_timeouts", "counter", "Zeekr API calls that missed their deadline.")
+    for coordinator in coordinators:
+        for endpoint, count in coordinator.request_stats.timeouts.items():
+            lines.append(
+                f"zeekr_ev_api_timeouts_total"
+                f"{_labels(entry=coordinator.entry.entry_id, endpoint=endpoint)} {count}"
+            )
+
+    family("zeekr_ev_up", "gauge", "1 if the last coordinator update succeeded.")
+    per_entry("zeekr_ev_up", lambda c: int(bool(c.last_update_success)))
+    family("zeekr_ev_watchdog_slow_calls", "counter", "Slow calls seen by the debug watchdog.")
+    per_entry("zeekr_ev_watchdog_slow_calls_total", lambda c: c.watchdog.total)
+
+    family("zeekr_ev_vehicle_data_age_seconds", "gauge", "Seconds since vehicle data was last fetched.")
+    for coordinator in coordinators:
+        for vin, updated_at in coordinator.vin_updated_at.items():
+            lines.append(
+                f"zeekr_ev_vehicle_data_age_seconds"
+                f"{_labels(entry=coordinator.entry.entry_id, vin=redact_vin(vin))}"
+                f" {round(now - updated_at, 3)}"
+            )
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class ZeekrMetricsView(HomeAssistantView):
+    """Expose integration metrics to an authenticated scraper."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        coordinators = [
+            value
+            for value in self.hass.data.get(DOMAIN, {}).values()
+            if isinstance(value, ZeekrCoordinator)
+            and value.entry.data.get(CONF_METRICS_ENDPOINT, False)
+        ]
+        if not coordinators:
+            return web.Response(status=404)
+        return web.Response(
+            text=render_metrics(coordinators),
+            content_type=CONTENT_TYPE,
+            charset="utf-8",
+            headers={"X-Content-Type-Options": "nosniff"},
+        )
+
+
+@callback
+def async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the metrics view once; views cannot be unregistered."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get(DATA_METRICS_VIEW):
+        return
+    hass.http.register_view(ZeekrMetricsView(hass))
+    domain_data[DATA_METRICS_VIEW] = True
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import partial
+
 from homeassistant.components.number import NumberEntity, RestoreNumber
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTime
@@ -9,9 +11,10 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CAPABILITY_CHARGING_LIMIT, DOMAIN
 from .coordinator import ZeekrCoordinator
-from .entity import ZeekrEntity
+from .tracing import traced_command
+from .entity import ZeekrEntity, ZeekrSetpointEntity, async_setup_vehicle_entities
 
 
 async def async_setup_entry(
@@ -47,10 +50,17 @@ async def async_setup_entry(
         ),
     ]
 
-    for vehicle in coordinator.vehicles:
-        entities.append(ZeekrChargingLimitNumber(coordinator, vehicle.vin))
-
-    async_add_entities(entities)
+    async_setup_vehicle_entities(
+        hass,
+        entry,
+        async_add_entities,
+        lambda vin: (
+            [ZeekrChargingLimitNumber(coordinator, vin)]
+            if coordinator.supports(vin, CAPABILITY_CHARGING_LIMIT)
+            else []
+        ),
+        entities,
+    )
 
 
 class ZeekrConfigNumber(CoordinatorEntity, RestoreNumber):
@@ -95,7 +105,7 @@ class ZeekrConfigNumber(CoordinatorEntity, RestoreNumber):
         self.async_write_ha_state()
 
 
-class ZeekrChargingLimitNumber(ZeekrEntity, RestoreNumber):
+class ZeekrChargingLimitNumber(ZeekrSetpointEntity, ZeekrEntity, RestoreNumber):
     """Zeekr Charging Limit Number class."""
 
     _attr_has_entity_name = True
@@ -104,6 +114,7 @@ class ZeekrChargingLimitNumber(ZeekrEntity, RestoreNumber):
     _attr_native_step = 5
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_icon = "mdi:battery-charging-high"
+    _capability = CAPABILITY_CHARGING_LIMIT
 
     def __init__(self, coordinator: ZeekrCoordinator, vin: str) -> None:
         """Initialize the charging limit number."""
@@ -115,17 +126,9 @@ class ZeekrChargingLimitNumber(ZeekrEntity, RestoreNumber):
     @property
     def native_value(self) -> float | None:
         """Return the value reported by the coordinator."""
-        try:
-            val = (
-                self.coordinator.data.get(self.vin, {})
-                .get("chargingLimit", {})
-                .get("soc")
-            )
-            if val is not None:
-                # API returns value * 10 (e.g. 800 -> 80.0)
-                return float(val) / 10.0
-        except (ValueError, TypeError, AttributeError):
-            pass
+        snapshot = self.coordinator.get_snapshot(self.vin)
+        if snapshot is not None and snapshot.charging_limit is not None:
+            return snapshot.charging_limit
         return self._attr_native_value
 
     async def async_added_to_hass(self) -> None:
@@ -136,7 +139,19 @@ class ZeekrChargingLimitNumber(ZeekrEntity, RestoreNumber):
             self._attr_native_value = last_state.native_value
 
     async def async_set_native_value(self, value: float) -> None:
-        """Set new value."""
+        """Set new value, sending it once the value stops changing."""
+        if not self.coordinator.get_vehicle_by_vin(self.vin):
+            return
+        self._attr_native_value = value
+        self.coordinator.async_set_optimistic(self.vin, charging_limit=value)
+        self.async_write_ha_state()
+        self.async_schedule_setpoint(
+            partial(self._async_send_charging_limit, value), "charging_limit"
+        )
+
+    @traced_command
+    async def _async_send_charging_limit(self, value: float) -> None:
+        """Send a charging limit to the vehicle."""
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
         if not vehicle:
             return
@@ -164,9 +179,6 @@ class ZeekrChargingLimitNumber(ZeekrEntity, RestoreNumber):
             ]
         }
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_remote_control(
+            vehicle, command, service_id, setting
         )
-        self._attr_native_value = value
-        self.async_write_ha_state()
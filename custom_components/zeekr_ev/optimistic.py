@@ -0,0 +1,84 @@
+"""Optimistic state overlay for remote commands.
+
+After a command is accepted the entity shows the requested state straight
+away, but the car often reports the old state for a while. Instead of
+writing into the fetched snapshot (where the next poll would flip it back),
+optimistic values live in a per-VIN overlay. Each field masks the fetched
+value until a poll reports the same value or its expiry passes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import time
+from typing import Any, Iterable
+
+from .snapshot import VehicleSnapshot
+
+# Seconds an unconfirmed optimistic value masks the fetched one
+DEFAULT_TTL = 120.0
+
+
+class OptimisticOverlay:
+    """Per-VIN optimistic field values laid over the fetched snapshots."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL) -> None:
+        self.ttl = ttl
+        # vin -> snapshot field -> (value, monotonic expiry)
+        self._fields: dict[str, dict[str, tuple[Any, float]]] = {}
+
+    def set(self, vin: str, fields: dict[str, Any], ttl: float | None = None) -> float:
+        """Mask `fields` of a vehicle; return the expiry as a monotonic time."""
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        overlay = self._fields.setdefault(vin, {})
+        for field, value in fields.items():
+            overlay[field] = (value, expires)
+        return expires
+
+    def apply(self, vin: str, snapshot: VehicleSnapshot | None) -> VehicleSnapshot | None:
+        """Return `snapshot` with the live optimistic values of `vin` applied."""
+        if snapshot is None or vin not in self._fields:
+            return snapshot
+        now = time.monotonic()
+        live = {
+            field: value
+            for field, (value, expires) in self._fields[vin].items()
+            if expires > now
+        }
+        if not live:
+            del self._fields[vin]
+            return snapshot
+        return replace(snapshot, **live)
+
+    def discard(self, vin: str, fields: Iterable[str]) -> None:
+        """Drop optimistic values of a vehicle, as after a failed command."""
+        overlay = self._fields.get(vin, {})
+        for field in fields:
+            overlay.pop(field, None)
+        if not overlay:
+            self._fields.pop(vin, None)
+
+    def reconcile(self, data: dict[str, VehicleSnapshot]) -> None:
+        """Drop values the fetched snapshots confirm, and expired values."""
+        now = time.monotonic()
+        for vin in list(self._fields):
+            snapshot = data.get(vin)
+            overlay = {
+                field: (value, expires)
+                for field, (value, expires) in self._fields[vin].items()
+                if expires > now
+                and (snapshot is None or getattr(snapshot, field) != value)
+            }
+            if overlay:
+                self._fields[vin] = overlay
+            else:
+                del self._fields[vin]
+
+    def pending(self, vin: str) -> dict[str, Any]:
+        """Return the unconfirmed optimistic values of a vehicle."""
+        now = time.monotonic()
+        return {
+            field: value
+            for field, (value, expires) in self._fields.get(vin, {}).items()
+            if expires > now
+        }
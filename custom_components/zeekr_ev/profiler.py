@@ -0,0 +1,226 @@
+"""On-demand profiling of coordinator updates and remote commands.
+
+The profiler is armed through the ``zeekr_ev.profile`` service for the next N
+updates or commands. While it is not armed the only cost on the hot paths is
+a single counter check.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+import cProfile
+from datetime import datetime
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_DIR = "zeekr_ev_profiles"
+
+MODE_CPROFILE = "cprofile"
+MODE_SAMPLING = "sampling"
+PROFILE_MODES = [MODE_CPROFILE, MODE_SAMPLING]
+
+TARGET_UPDATE = "update"
+TARGET_COMMAND = "command"
+PROFILE_TARGETS = [TARGET_UPDATE, TARGET_COMMAND]
+
+DEFAULT_TOP = 30
+SAMPLE_INTERVAL = 0.005  # seconds
+
+
+class _StackSampler(threading.Thread):
+    """Wall-clock sampler for the event loop and the threads running our jobs."""
+
+    def __init__(self, thread_ids: set[int], interval: float = SAMPLE_INTERVAL) -> None:
+        super().__init__(name="zeekr_ev_profiler", daemon=True)
+        self._thread_ids = thread_ids
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self.samples: Counter[tuple[str, ...]] = Counter()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            frames = sys._current_frames()  # pylint: disable=protected-access
+            for ident in list(self._thread_ids):
+                frame = frames.get(ident)
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(
+                        f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                    )
+                    frame = frame.f_back
+                if stack:
+                    self.samples[tuple(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        """Ask the sampler to stop; join it to wait for its last sample."""
+        self._stop_event.set()
+
+
+class ProfileSession:
+    """A single profiled update or command."""
+
+    def __init__(
+        self, hass: HomeAssistant, kind: str, label: str, mode: str, top: int
+    ) -> None:
+        self.hass = hass
+        self.kind = kind
+        self.label = label
+        self.mode = mode
+        self.top = top
+        self._started = time.monotonic()
+        self._profiles: list[cProfile.Profile] = []
+        self._loop_profile: cProfile.Profile | None = None
+        self._thread_ids: set[int] = {threading.get_ident()}
+        self._sampler: _StackSampler | None = None
+
+    def start(self) -> None:
+        if self.mode == MODE_SAMPLING:
+            self._sampler = _StackSampler(self._thread_ids)
+            self._sampler.start()
+        elif self.kind == TARGET_UPDATE:
+            # Only updates profile the event loop thread, a command spends
+            # practically all of its time in the executor.
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                _LOGGER.debug("Another profiler is active, skipping event loop profile")
+            else:
+                self._loop_profile = profile
+
+    def wrap(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap an executor job so its thread is profiled as well."""
+
+        def _profiled(*args: Any) -> Any:
+            ident = threading.get_ident()
+            self._thread_ids.add(ident)
+            profile = cProfile.Profile() if self.mode == MODE_CPROFILE else None
+            try:
+                if profile is not None:
+                    profile.enable()
+                return func(*args)
+            finally:
+                if profile is not None:
+                    profile.disable()
+                    self._profiles.append(profile)
+                self._thread_ids.discard(ident)
+
+        return _profiled
+
+    async def async_finish(self) -> None:
+        """Stop profiling and write the results under the config directory."""
+        elapsed = time.monotonic() - self._started
+        if self._loop_profile is not None:
+            self._loop_profile.disable()
+            self._profiles.append(self._loop_profile)
+        if self._sampler is not None:
+            self._sampler.stop()
+            # Up to a sample interval; not on the event loop
+            await self.hass.async_add_executor_job(self._sampler.join)
+        base = self.hass.config.path(
+            PROFILE_DIR,
+            f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{self.kind}_{self.label}",
+        )
+        try:
+            path = await self.hass.async_add_executor_job(self._write, base, elapsed)
+        except OSError as err:
+            _LOGGER.error("Could not write Zeekr profile: %s", err)
+        else:
+            _LOGGER.info("Zeekr %s profile written to %s", self.kind, path)
+
+    def _write(self, base: str, elapsed: float) -> str:
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        header = f"Zeekr {self.kind} '{self.label}' took {elapsed:.3f}s ({self.mode})\n\n"
+
+        if self.mode == MODE_SAMPLING:
+            samples = self._sampler.samples if self._sampler else Counter()
+            with open(f"{base}.folded", "w", encoding="utf-8") as handle:
+                for stack, count in samples.items():
+                    handle.write(f"{';'.join(stack)} {count}\n")
+            summary = header + _sampling_summary(samples, self.top)
+        else:
+            stream = io.StringIO()
+            stats = _merge_profiles(self._profiles, stream)
+            if stats is not None:
+                stats.dump_stats(f"{base}.prof")
+                stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+            summary = header + stream.getvalue()
+
+        with open(f"{base}.txt", "w", encoding="utf-8") as handle:
+            handle.write(summary)
+        return f"{base}.txt"
+
+
+def _merge_profiles(
+    profiles: list[cProfile.Profile], stream: io.StringIO
+) -> pstats.Stats | None:
+    stats: pstats.Stats | None = None
+    for profile in profiles:
+        try:
+            if stats is None:
+                stats = pstats.Stats(profile, stream=stream)
+            else:
+                stats.add(profile)
+        except TypeError:
+            # Raised for a profile that recorded nothing
+            continue
+    return stats
+
+
+def _sampling_summary(samples: Counter[tuple[str, ...]], top: int) -> str:
+    total = sum(samples.values())
+    if not total:
+        return "No samples collected.\n"
+    inclusive: Counter[str] = Counter()
+    own: Counter[str] = Counter()
+    for stack, count in samples.items():
+        for frame in set(stack):
+            inclusive[frame] += count
+        own[stack[-1]] += count
+    lines = [f"{total} samples every {SAMPLE_INTERVAL * 1000:.0f} ms\n", "  incl%   self%  function"]
+    for frame, count in inclusive.most_common(top):
+        lines.append(
+            f"{100 * count / total:6.1f}  {100 * own[frame] / total:6.1f}  {frame}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+class ZeekrProfiler:
+    """Hands out profile sessions while armed."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._remaining = {TARGET_UPDATE: 0, TARGET_COMMAND: 0}
+        self._mode = MODE_CPROFILE
+        self._top = DEFAULT_TOP
+
+    def arm(
+        self, target: str, count: int, mode: str = MODE_CPROFILE, top: int = DEFAULT_TOP
+    ) -> None:
+        """Profile the next `count` updates or commands."""
+        self._remaining[target] = count
+        self._mode = mode
+        self._top = top
+
+    def remaining(self, target: str) -> int:
+        return self._remaining[target]
+
+    def start(self, target: str, label: str) -> ProfileSession | None:
+        """Return a running session if the profiler is armed for `target`."""
+        if not self._remaining[target]:
+            return None
+        self._remaining[target] -= 1
+        session = ProfileSession(self.hass, target, label, self._mode, self._top)
+        session.start()
+        return session
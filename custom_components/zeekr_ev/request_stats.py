@@ -13,6 +13,40 @@ STORAGE_KEY = "zeekr_ev_stats"
 STORAGE_VERSION = 1
 SAVE_DELAY = 5  # seconds
 
+# Upper bounds (seconds) of the per-endpoint latency histogram buckets
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram for a single endpoint (in memory only)."""
+
+    __slots__ = ("count", "total", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        # One counter per bucket plus the +Inf overflow bucket
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        for idx, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.buckets[idx] += 1
+                return
+        self.buckets[-1] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 4),
+            "buckets": {
+                **{str(bound): n for bound, n in zip(LATENCY_BUCKETS, self.buckets)},
+                "+Inf": self.buckets[-1],
+            },
+        }
+
 
 class ZeekrRequestStats:
     def __init__(self, hass: HomeAssistant):
@@ -27,6 +61,9 @@ class ZeekrRequestStats:
         self._dirty = False
         self._save_lock = asyncio.Lock()
         self._cancel_save: Callable[[], Any] | None = None
+        # Latency and timeouts per endpoint are diagnostic data, never persisted
+        self.latency: dict[str, LatencyHistogram] = {}
+        self.timeouts: dict[str, int] = {}
 
     async def async_load(self):
         """Load stats from storage."""
@@ -69,6 +106,23 @@ class ZeekrRequestStats:
         self.api_invokes_total += 1
         self._async_schedule_save()
 
+    def record_latency(self, endpoint: str, seconds: float) -> None:
+        """Record how long a call to an endpoint took."""
+        histogram = self.latency.get(endpoint)
+        if histogram is None:
+            histogram = self.latency[endpoint] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def record_timeout(self, endpoint: str) -> None:
+        """Count a call to an endpoint that missed its deadline."""
+        self.timeouts[endpoint] = self.timeouts.get(endpoint, 0) + 1
+
+    def latency_as_dict(self) -> dict[str, Any]:
+        return {
+            endpoint: histogram.as_dict()
+            for endpoint, histogram in self.latency.items()
+        }
+
     async def _async_check_reset(self):
         today = datetime.now().date()
         if today != self._last_reset:
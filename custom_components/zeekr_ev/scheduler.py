@@ -0,0 +1,349 @@
+"""Shared schedule and call limits of all Zeekr config entries.
+
+Every entry used to poll on its own timer, so with many accounts the polls
+lined up and their API calls competed for the executor at the same moment.
+The scheduler spreads the polls of all entries evenly over the polling
+interval, with a small fixed jitter per entry, and limits how many API calls
+run at once: globally and per account.
+
+Calls waiting for a slot are served by lane: user commands and the polls
+confirming them first, then refreshes on demand, then background polls.
+
+The global limit adapts to how the API copes (AIMD): it grows by one call
+after a full round of fast calls that filled it and halves on timeouts, rate
+limiting or server errors. Each account runs one call at a time, so only
+calls that filled the limit count towards a higher one; otherwise a few
+accounts would raise it to the maximum without ever reaching it, and a
+decrease would not throttle anything until it had dropped below their
+number.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import random
+import re
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Hashable
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+DATA_SCHEDULER = "_scheduler"
+
+# API calls running at once over all accounts: the start and the bounds of
+# the adaptive limit
+INITIAL_CONCURRENT_CALLS = 4
+MIN_CONCURRENT_CALLS = 1
+MAX_CONCURRENT_CALLS = 8
+# Calls slower than this, in seconds, do not count towards a higher limit
+LATENCY_TARGET = 2.0
+# Seconds after a decrease before the limit decreases again, so the calls
+# already in flight when the API struggled do not halve it several times
+DECREASE_COOLDOWN = 10.0
+# Limit changes kept for the diagnostics
+LIMIT_HISTORY = 20
+# API calls running at once per account; its client has a single HTTP session
+ACCOUNT_CONCURRENT_CALLS = 1
+# Upper bound of the fixed random offset of each entry's polls, in seconds
+MAX_JITTER = 15.0
+
+# Lanes, served in this order
+LANE_COMMAND = 0
+LANE_REFRESH = 1
+LANE_POLL = 2
+LANES = {LANE_COMMAND: "command", LANE_REFRESH: "refresh", LANE_POLL: "poll"}
+# Seconds after a command during which a vehicle's polls confirm it
+COMMAND_CONFIRM_WINDOW = 120
+
+# HTTP status of an error response, as the client puts it in its messages
+_STATUS_CODE = re.compile(r"status_code'?\s*[:=]\s*(\d{3})")
+
+
+def _status_code(err: BaseException) -> int | None:
+    for status in (
+        getattr(err, "status_code", None),
+        getattr(getattr(err, "response", None), "status_code", None),
+    ):
+        if isinstance(status, int):
+            return status
+    if match := _STATUS_CODE.search(str(err)):
+        return int(match.group(1))
+    return None
+
+
+def is_overload_error(err: BaseException) -> bool:
+    """Return whether `err` means the API is overloaded.
+
+    Timeouts, dropped connections, rate limiting (429) and server errors
+    (5xx) count; the requests exceptions are matched by name, like the
+    client's own.
+    """
+    if isinstance(err, TimeoutError) or any(
+        cls.__name__ in ("Timeout", "ConnectionError") for cls in type(err).__mro__
+    ):
+        return True
+    status = _status_code(err)
+    return status is not None and (status == 429 or status >= 500)
+
+
+class SlotLease:
+    """A held call slot, which can outlive its block.
+
+    A call given up on at its deadline still runs in its executor thread.
+    Held until that job ends, its slot keeps the next call of the account
+    from running next to it on the same HTTP session.
+    """
+
+    def __init__(self) -> None:
+        self.job: asyncio.Future[Any] | None = None
+
+    def hold_until(self, job: asyncio.Future[Any]) -> None:
+        """Keep the slot until `job` is done, dropping its result."""
+        self.job = job
+        job.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+
+class CallLimiter:
+    """Limit how many calls run at once, serving waiters by lane."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+        # (lane, arrival, future) heap of waiting calls
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._arrivals = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def acquire(
+        self, lane: int = LANE_POLL, lease: SlotLease | None = None
+    ) -> AsyncIterator[None]:
+        """Wait for a free slot and hold it, past the block while `lease` holds it."""
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+        else:
+            waiter = (lane, next(self._arrivals), asyncio.get_running_loop().create_future())
+            heapq.heappush(self._waiters, waiter)
+            try:
+                await waiter[2]
+            except asyncio.CancelledError:
+                if waiter[2].cancelled():
+                    # A release may have popped and skipped it already
+                    if waiter in self._waiters:
+                        self._waiters.remove(waiter)
+                        heapq.heapify(self._waiters)
+                else:
+                    # The slot was handed over already
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            if lease is not None and lease.job is not None and not lease.job.done():
+                lease.job.add_done_callback(lambda _: self._release())
+            else:
+                self._release()
+
+    def set_limit(self, limit: int) -> None:
+        """Change the limit, letting waiters in if it grew."""
+        self.limit = limit
+        while self.active < self.limit and self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                self.active += 1
+
+    def _release(self) -> None:
+        """Hand the slot to the first waiter, or free it.
+
+        Above a lowered limit the slot is freed instead.
+        """
+        while self.active <= self.limit and self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+
+@dataclass
+class LaneWaits:
+    """How long calls of a lane waited for a slot, in seconds."""
+
+    calls: int = 0
+    total: float = 0.0
+    longest: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.calls += 1
+        self.total += seconds
+        self.longest = max(self.longest, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "wait_avg": round(self.total / self.calls, 3) if self.calls else None,
+            "wait_max": round(self.longest, 3),
+        }
+
+
+@dataclass
+class LimitChange:
+    """A change of the adaptive call limit."""
+
+    at: float
+    limit: int
+    reason: str
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"at": self.at, "limit": self.limit, "reason": self.reason}
+
+
+class ZeekrScheduler:
+    """Poll slots and API call limits shared by every Zeekr entry."""
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_CALLS,
+        account_concurrent: int = ACCOUNT_CONCURRENT_CALLS,
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.calls = CallLimiter(min(INITIAL_CONCURRENT_CALLS, max_concurrent))
+        # Fast calls since the last change of the limit
+        self._fast_calls = 0
+        self._decreased_at: float | None = None
+        self.limit_history: deque[LimitChange] = deque(maxlen=LIMIT_HISTORY)
+        self._account_concurrent = account_concurrent
+        self._accounts: dict[Hashable, CallLimiter] = {}
+        # entry_id -> fixed jitter, in registration order
+        self._jitter: dict[str, float] = {}
+        # Calls that had to wait for a free slot
+        self.queued_calls = 0
+        self.lane_waits: dict[int, LaneWaits] = {lane: LaneWaits() for lane in LANES}
+
+    @callback
+    def async_register(self, entry_id: str) -> Callable[[], None]:
+        """Give an entry a poll slot; returns a callback that frees it."""
+        self._jitter[entry_id] = random.uniform(0, MAX_JITTER)
+
+        @callback
+        def _unregister() -> None:
+            self._jitter.pop(entry_id, None)
+
+        return _unregister
+
+    def next_poll(self, entry_id: str, interval: float, now: float) -> float:
+        """Return the loop time of an entry's next poll.
+
+        Registered entries poll at evenly spread phases of the interval, so
+        their polls do not line up. The next poll is at least half an
+        interval away, as after a refresh on demand.
+        """
+        if entry_id not in self._jitter:
+            return now + interval
+        entries = list(self._jitter)
+        phase = interval * entries.index(entry_id) / len(entries) + self._jitter[entry_id]
+        next_poll = now + (phase - now) % interval
+        if next_poll - now < interval / 2:
+            next_poll += interval
+        return next_poll
+
+    @asynccontextmanager
+    async def slot(
+        self, account: Hashable, lane: int = LANE_POLL
+    ) -> AsyncIterator[SlotLease]:
+        """Hold a call slot of the account and of all accounts.
+
+        The slots are freed at the end of the block, or once the job the
+        yielded lease holds them for is done.
+        """
+        limiter = self._accounts.get(account)
+        if limiter is None:
+            limiter = self._accounts[account] = CallLimiter(self._account_concurrent)
+        if (
+            limiter.active >= limiter.limit
+            or limiter.waiting
+            or self.calls.active >= self.calls.limit
+            or self.calls.waiting
+        ):
+            self.queued_calls += 1
+        start = time.monotonic()
+        lease = SlotLease()
+        async with limiter.acquire(lane, lease):
+            async with self.calls.acquire(lane, lease):
+                self.lane_waits[lane].record(time.monotonic() - start)
+                # The call took the last free slot, so the limit held calls back
+                saturated = self.calls.active >= self.calls.limit
+                start = time.monotonic()
+                try:
+                    yield lease
+                except Exception as err:
+                    self.observe(time.monotonic() - start, err)
+                    raise
+                else:
+                    self.observe(time.monotonic() - start, saturated=saturated)
+
+    def observe(
+        self, seconds: float, err: BaseException | None = None, saturated: bool = False
+    ) -> None:
+        """Adapt the call limit to the outcome of a call.
+
+        Only fast calls that ran with the limit `saturated` raise it.
+        """
+        now = time.monotonic()
+        if err is not None and is_overload_error(err):
+            self._fast_calls = 0
+            if (
+                self._decreased_at is not None
+                and now - self._decreased_at < DECREASE_COOLDOWN
+            ):
+                return
+            self._decreased_at = now
+            limit = max(MIN_CONCURRENT_CALLS, self.calls.limit // 2)
+            self._set_limit(limit, type(err).__name__)
+        elif err is None and seconds < LATENCY_TARGET:
+            if not saturated:
+                return
+            self._fast_calls += 1
+            limit = self.calls.limit
+            if self._fast_calls >= limit and limit < self.max_concurrent:
+                self._set_limit(limit + 1, "fast calls")
+        elif err is None:
+            self._fast_calls = 0
+
+    def _set_limit(self, limit: int, reason: str) -> None:
+        self._fast_calls = 0
+        if limit == self.calls.limit:
+            return
+        self.calls.set_limit(limit)
+        self.limit_history.append(LimitChange(time.time(), limit, reason))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._jitter),
+            "call_limit": self.calls.limit,
+            "max_concurrent_calls": self.max_concurrent,
+            "limit_history": [change.as_dict() for change in self.limit_history],
+            "active_calls": self.calls.active,
+            "queued_calls": self.queued_calls,
+            "lanes": {name: self.lane_waits[lane].as_dict() for lane, name in LANES.items()},
+        }
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> ZeekrScheduler:
+    """Return the scheduler shared by all entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := domain_data.get(DATA_SCHEDULER)) is None:
+        scheduler = domain_data[DATA_SCHEDULER] = ZeekrScheduler()
+    return scheduler
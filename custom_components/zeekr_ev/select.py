@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import partial
+from operator import attrgetter
 from typing import Any
 
-from homeassistant.components.select import SelectEntity
+from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CAPABILITY_REAR_SEAT_HEAT, CAPABILITY_SEAT_VENTILATION, DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import (
+    ZeekrEntityDescription,
+    ZeekrSetpointEntity,
+    ZeekrVehicleEntity,
+    async_setup_vehicle_entities,
+    vehicle_descriptions,
+)
+from .tracing import traced, traced_command
 
 OPTION_OFF = "Off"
 OPTION_LEVEL_1 = "Level 1"
@@ -37,6 +47,39 @@ LEVEL_TO_OPTION = {
 }
 
 
+@dataclass(frozen=True, kw_only=True)
+class ZeekrSeatSelectEntityDescription(ZeekrEntityDescription, SelectEntityDescription):
+    """Describes a seat select; the key is also the VehicleSnapshot attribute."""
+
+    service_code: str
+    mode: str  # "heat" or "vent"
+
+
+def _seat(
+    key: str, name: str, service_code: str, mode: str, capability: str | None = None
+) -> ZeekrSeatSelectEntityDescription:
+    return ZeekrSeatSelectEntityDescription(
+        key=key,
+        name=name,
+        icon="mdi:car-seat-heater" if mode == "heat" else "mdi:car-seat-cooler",
+        value_fn=attrgetter(key),
+        service_code=service_code,
+        mode=mode,
+        grouped=True,
+        capability=capability,
+    )
+
+
+SEAT_DESCRIPTIONS: tuple[ZeekrSeatSelectEntityDescription, ...] = (
+    _seat("seat_heat_driver", "Driver Seat Heat", "SH.11", "heat"),
+    _seat("seat_heat_passenger", "Passenger Seat Heat", "SH.19", "heat"),
+    _seat("seat_heat_rear_right", "Rear Right Seat Heat", "SH.29", "heat", CAPABILITY_REAR_SEAT_HEAT),
+    _seat("seat_heat_rear_left", "Rear Left Seat Heat", "SH.21", "heat", CAPABILITY_REAR_SEAT_HEAT),
+    _seat("seat_vent_driver", "Driver Seat Vent", "SV.11", "vent", CAPABILITY_SEAT_VENTILATION),
+    _seat("seat_vent_passenger", "Passenger Seat Vent", "SV.19", "vent", CAPABILITY_SEAT_VENTILATION),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -44,88 +87,24 @@ async def async_setup_entry(
 ) -> None:
     """Set up the select platform."""
     coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
-
-    for vin in coordinator.data:
-        # Heat - Driver
-        entities.append(
-            ZeekrSeatSelect(
-                coordinator,
-                vin,
-                "seat_heat_driver",
-                "Driver Seat Heat",
-                "SH.11",
-                "heat",
-                status_keys=["drvHeatSts"],
-            )
-        )
-        # Heat - Passenger
-        entities.append(
-            ZeekrSeatSelect(
-                coordinator,
-                vin,
-                "seat_heat_passenger",
-                "Passenger Seat Heat",
-                "SH.19",
-                "heat",
-                status_keys=["passHeatingSts"],
-            )
-        )
-        # Heat - Rear Right
-        entities.append(
-            ZeekrSeatSelect(
-                coordinator,
-                vin,
-                "seat_heat_rear_right",
-                "Rear Right Seat Heat",
-                "SH.29",
-                "heat",
-                status_keys=["rrHeatingSts"],
-            )
-        )
-        # Heat - Rear Left
-        entities.append(
-            ZeekrSeatSelect(
-                coordinator,
-                vin,
-                "seat_heat_rear_left",
-                "Rear Left Seat Heat",
-                "SH.21",
-                "heat",
-                status_keys=["rlHeatingSts"],
-            )
-        )
-        # Vent - Driver
-        entities.append(
-            ZeekrSeatSelect(
-                coordinator,
-                vin,
-                "seat_vent_driver",
-                "Driver Seat Vent",
-                "SV.11",
-                "vent",
-                status_keys=["drvVentSts", "drvVentDetail"],
-            )
-        )
-        # Vent - Passenger
-        entities.append(
-            ZeekrSeatSelect(
-                coordinator,
-                vin,
-                "seat_vent_passenger",
-                "Passenger Seat Vent",
-                "SV.19",
-                "vent",
-                status_keys=["passVentSts", "passVentDetail"],
-            )
-        )
+    descriptions = vehicle_descriptions(coordinator, SEAT_DESCRIPTIONS)
 
-    async_add_entities(entities)
+    async_setup_vehicle_entities(
+        hass,
+        entry,
+        async_add_entities,
+        lambda vin: (
+            ZeekrSeatSelect(coordinator, vin, description)
+            for description in descriptions
+            if coordinator.supports(vin, description.capability)
+        ),
+    )
 
 
-class ZeekrSeatSelect(CoordinatorEntity, SelectEntity):
+class ZeekrSeatSelect(ZeekrSetpointEntity, ZeekrVehicleEntity, SelectEntity):
     """Zeekr Seat Select class."""
 
+    entity_description: ZeekrSeatSelectEntityDescription
     _attr_has_entity_name = True
     _attr_options = SEAT_OPTIONS
 
@@ -133,78 +112,38 @@ class ZeekrSeatSelect(CoordinatorEntity, SelectEntity):
         self,
         coordinator: ZeekrCoordinator,
         vin: str,
-        key: str,
-        name: str,
-        service_code: str,
-        mode: str,  # "heat" or "vent"
-        status_keys: list[str],
+        description: ZeekrSeatSelectEntityDescription,
     ) -> None:
         """Initialize the select entity."""
-        super().__init__(coordinator)
-        self.vin = vin
-        self.service_code = service_code
-        self.mode = mode
-        self.status_keys = status_keys
-        self._attr_name = name
-        self._attr_unique_id = f"{vin}_{key}"
-        self._attr_icon = "mdi:car-seat-heater" if mode == "heat" else "mdi:car-seat-cooler"
+        super().__init__(coordinator, vin, description)
+        self.key = description.key
+        self.service_code = description.service_code
+        self.mode = description.mode
 
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
-        data = self.coordinator.data.get(self.vin, {})
-        climate_status = (
-            data.get("additionalVehicleStatus", {})
-            .get("climateStatus", {})
-        )
-
-        level = 0
-
-        if self.mode == "heat":
-            # For heat, the status key usually holds the level directly: 0=Off, 1=L1, 2=L2, 3=L3
-            if self.status_keys:
-                val = climate_status.get(self.status_keys[0])
-                if val is not None:
-                    try:
-                        level = int(val)
-                    except (ValueError, TypeError):
-                        level = 0
-
-        elif self.mode == "vent":
-            # For vent, status key 0 is On/Off (2=Off, 1=On), status key 1 is Detail/Level
-            # Keys: [status_sts, status_detail]
-            if len(self.status_keys) >= 2:
-                sts_val = climate_status.get(self.status_keys[0])
-                detail_val = climate_status.get(self.status_keys[1])
-
-                try:
-                    sts = int(sts_val) if sts_val is not None else 2
-                    detail = int(detail_val) if detail_val is not None else 0
-
-                    if sts == 2:  # Off
-                        level = 0
-                    elif sts == 1:  # On
-                        level = detail
-                        if level == 0:
-                            # Fallback if on but level reported as 0, shouldn't happen based on user logs
-                            # User logs: "passVentSts": 1, "passVentDetail": 2 (Level 2)
-                            pass
-                except (ValueError, TypeError):
-                    level = 0
-
-        # Ensure level is within 0-3
-        if level not in LEVEL_TO_OPTION:
-            level = 0
-
-        return LEVEL_TO_OPTION.get(level, OPTION_OFF)
+        return LEVEL_TO_OPTION.get(self._snapshot_value(), OPTION_OFF)
 
     async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
+        """Change the selected option, sending it once it stops changing."""
+        if not self.coordinator.get_vehicle_by_vin(self.vin):
+            return
+
+        level = OPTION_TO_LEVEL.get(option, 0)
+
+        # Optimistic update
+        self._update_local_state_optimistically(level)
+        self.async_write_ha_state()
+        self.async_schedule_setpoint(partial(self._async_send_level, level), self.key)
+
+    @traced_command
+    async def _async_send_level(self, level: int) -> None:
+        """Send a seat level to the vehicle."""
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
         if not vehicle:
             return
 
-        level = OPTION_TO_LEVEL.get(option, 0)
         duration = getattr(self.coordinator, "seat_duration", 15)
 
         command = "start"
@@ -227,50 +166,14 @@ class ZeekrSeatSelect(CoordinatorEntity, SelectEntity):
 
         setting["serviceParameters"] = params
 
-        await self.coordinator.async_inc_invoke()
-        await self.hass.async_add_executor_job(
-            vehicle.do_remote_control, command, service_id, setting
+        await self.coordinator.async_remote_control(
+            vehicle, command, service_id, setting
         )
 
-        # Optimistic update
-        self._update_local_state_optimistically(level)
-        self.async_write_ha_state()
-
         # Trigger refresh (might revert if API is slow, but that's expected eventually)
         await self.coordinator.async_request_refresh()
 
+    @traced("zeekr.optimistic_write")
     def _update_local_state_optimistically(self, level: int):
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
-            return
-
-        climate_status = (
-            data.setdefault("additionalVehicleStatus", {})
-            .setdefault("climateStatus", {})
-        )
-
-        if self.mode == "heat":
-            if self.status_keys:
-                climate_status[self.status_keys[0]] = level
-
-        elif self.mode == "vent":
-            if len(self.status_keys) >= 2:
-                sts_key = self.status_keys[0]
-                detail_key = self.status_keys[1]
-
-                if level == 0:
-                    climate_status[sts_key] = 2  # Off
-                    climate_status[detail_key] = 0  # Detail 0 (maybe?)
-                else:
-                    climate_status[sts_key] = 1  # On
-                    climate_status[detail_key] = level
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self.vin)},
-            "name": f"Zeekr {self.vin}",
-            "manufacturer": "Zeekr",
-        }
+        """Show the requested level until a poll confirms it."""
+        self.coordinator.async_set_optimistic(self.vin, **{self.key: level})
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from datetime import timedelta
 import importlib
 import logging
+from operator import attrgetter
+import time
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -20,13 +26,22 @@ from homeassistant.const import (
     UnitOfPressure,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import EntityCategory
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CAPABILITY_CHARGING_STATUS, DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import (
+    ZeekrEntityDescription,
+    ZeekrVehicleEntity,
+    async_setup_vehicle_entities,
+    attributes_getter,
+    vehicle_descriptions,
+)
+from .snapshot import POSITIONS, VehicleSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,6 +58,188 @@ except ImportError:
         _LOGGER.error("Could not import zeekr_app_sig. X-VIN generation will be unavailable.")
 
 
+# Noisy sensors still write their state at least this often
+DEFAULT_MAX_SILENCE = timedelta(minutes=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ZeekrSensorEntityDescription(ZeekrEntityDescription, SensorEntityDescription):
+    """Describes a Zeekr vehicle sensor.
+
+    Noisy values can be rounded to `round_digits` and filtered with a
+    deadband: a new value is only written when it moves more than `deadband`
+    (absolute) or `deadband_percent` (of the last written value) away, or
+    when `max_silence` has passed since the last write.
+    """
+
+    state_class: SensorStateClass | str | None = SensorStateClass.MEASUREMENT
+    round_digits: int | None = None
+    deadband: float | None = None
+    deadband_percent: float | None = None
+    max_silence: timedelta = DEFAULT_MAX_SILENCE
+
+
+SENSOR_DESCRIPTIONS: tuple[ZeekrSensorEntityDescription, ...] = (
+    ZeekrSensorEntityDescription(
+        key="battery_level",
+        name="Battery Level",
+        value_fn=attrgetter("battery_level"),
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.BATTERY,
+    ),
+    # Range (Battery Only)
+    ZeekrSensorEntityDescription(
+        key="range",
+        name="Range",
+        value_fn=attrgetter("range_km"),
+        native_unit_of_measurement=UnitOfLength.KILOMETERS,
+        device_class=SensorDeviceClass.DISTANCE,
+    ),
+    ZeekrSensorEntityDescription(
+        key="odometer",
+        name="Odometer",
+        value_fn=attrgetter("odometer"),
+        native_unit_of_measurement=UnitOfLength.KILOMETERS,
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    ZeekrSensorEntityDescription(
+        key="interior_temp",
+        name="Interior Temperature",
+        value_fn=attrgetter("interior_temp"),
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_class=SensorDeviceClass.TEMPERATURE,
+        round_digits=1,
+        deadband=0.3,
+    ),
+    *(
+        description
+        for tire, suffix in POSITIONS.items()
+        for description in (
+            ZeekrSensorEntityDescription(
+                key=f"tire_pressure_{tire.lower()}",
+                name=f"Tire Pressure {tire}",
+                value_fn=attrgetter(f"tyre_pressure_{suffix}"),
+                native_unit_of_measurement=UnitOfPressure.KPA,
+                device_class=SensorDeviceClass.PRESSURE,
+                round_digits=0,
+                deadband=2.0,
+                grouped=True,
+            ),
+            ZeekrSensorEntityDescription(
+                key=f"tire_temperature_{tire.lower()}",
+                name=f"Tire Temperature {tire}",
+                value_fn=attrgetter(f"tyre_temp_{suffix}"),
+                native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                device_class=SensorDeviceClass.TEMPERATURE,
+                round_digits=0,
+                deadband=1.0,
+                grouped=True,
+            ),
+        )
+    ),
+    # When the vehicle last sent its status; the frontend shows its age
+    ZeekrSensorEntityDescription(
+        key="data_age",
+        name="Data Age",
+        value_fn=attrgetter("updated_at"),
+        device_class=SensorDeviceClass.TIMESTAMP,
+        state_class=None,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+)
+
+# Only added while the vehicle reports a charging status
+CHARGING_SENSOR_DESCRIPTIONS: tuple[ZeekrSensorEntityDescription, ...] = (
+    ZeekrSensorEntityDescription(
+        key="charge_voltage",
+        name="Charge Voltage",
+        value_fn=attrgetter("charge_voltage"),
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        round_digits=0,
+        deadband_percent=1.0,
+        capability=CAPABILITY_CHARGING_STATUS,
+    ),
+    ZeekrSensorEntityDescription(
+        key="charge_current",
+        name="Charge Current",
+        value_fn=attrgetter("charge_current"),
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        device_class=SensorDeviceClass.CURRENT,
+        round_digits=1,
+        deadband=0.5,
+        capability=CAPABILITY_CHARGING_STATUS,
+    ),
+    ZeekrSensorEntityDescription(
+        key="charge_power",
+        name="Charge Power",
+        value_fn=attrgetter("charge_power"),
+        native_unit_of_measurement=UnitOfPower.KILO_WATT,
+        device_class=SensorDeviceClass.POWER,
+        capability=CAPABILITY_CHARGING_STATUS,
+    ),
+    ZeekrSensorEntityDescription(
+        key="charge_speed",
+        name="Charge Speed",
+        value_fn=attrgetter("charge_speed"),
+        native_unit_of_measurement="km/h",
+        capability=CAPABILITY_CHARGING_STATUS,
+    ),
+)
+
+
+_tyre_pressures = attrgetter(*(f"tyre_pressure_{suffix}" for suffix in POSITIONS.values()))
+
+SEAT_FIELDS = (
+    "seat_heat_driver",
+    "seat_heat_passenger",
+    "seat_heat_rear_left",
+    "seat_heat_rear_right",
+    "seat_vent_driver",
+    "seat_vent_passenger",
+)
+_seat_levels = attrgetter(*SEAT_FIELDS)
+
+
+def _lowest_tyre_pressure(snapshot: VehicleSnapshot) -> float | None:
+    return min((p for p in _tyre_pressures(snapshot) if p is not None), default=None)
+
+
+def _active_seats(snapshot: VehicleSnapshot) -> int:
+    return sum(1 for level in _seat_levels(snapshot) if level)
+
+
+# Grouped entities only added in compact mode
+COMPACT_SENSOR_DESCRIPTIONS: tuple[ZeekrSensorEntityDescription, ...] = (
+    ZeekrSensorEntityDescription(
+        key="tires",
+        name="Tires",
+        icon="mdi:car-tire-alert",
+        value_fn=_lowest_tyre_pressure,
+        attributes_fn=attributes_getter(
+            {
+                f"{kind}_{suffix}": f"tyre_{kind}_{suffix}"
+                for suffix in POSITIONS.values()
+                for kind in ("pressure", "temp", "pre_warning", "temp_warning")
+            }
+        ),
+        native_unit_of_measurement=UnitOfPressure.KPA,
+        device_class=SensorDeviceClass.PRESSURE,
+        round_digits=0,
+        deadband=2.0,
+    ),
+    ZeekrSensorEntityDescription(
+        key="seats",
+        name="Seats",
+        icon="mdi:car-seat",
+        value_fn=_active_seats,
+        attributes_fn=attributes_getter({field: field for field in SEAT_FIELDS}),
+        state_class=None,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -97,194 +294,97 @@ async def async_setup_entry(
         )
     )
 
-    # coordinator.data might be None or empty on first setup
-    if not coordinator.data:
-        async_add_entities(entities)
-        return
-
-    for vin, data in coordinator.data.items():
-        # Battery Level
-        entities.append(
-            ZeekrSensor(
-                coordinator,
-                vin,
-                "battery_level",
-                "Battery Level",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("chargeLevel"),
-                PERCENTAGE,
-                SensorDeviceClass.BATTERY,
-            )
-        )
-        # Range (Battery Only)
-        entities.append(
-            ZeekrSensor(
-                coordinator,
-                vin,
-                "range",
-                "Range",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("electricVehicleStatus", {})
-                .get("distanceToEmptyOnBatteryOnly"),
-                UnitOfLength.KILOMETERS,
-                SensorDeviceClass.DISTANCE,
-            )
-        )
-        # Odometer
-        entities.append(
-            ZeekrSensor(
-                coordinator,
-                vin,
-                "odometer",
-                "Odometer",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("maintenanceStatus", {})
-                .get("odometer"),
-                UnitOfLength.KILOMETERS,
-                SensorDeviceClass.DISTANCE,
-                SensorStateClass.TOTAL_INCREASING,
-            )
-        )
-        # Interior Temperature
-        entities.append(
-            ZeekrSensor(
-                coordinator,
-                vin,
-                "interior_temp",
-                "Interior Temperature",
-                lambda d: d.get("additionalVehicleStatus", {})
-                .get("climateStatus", {})
-                .get("interiorTemp"),
-                UnitOfTemperature.CELSIUS,
-                SensorDeviceClass.TEMPERATURE,
-            )
-        )
-
-        # Tire Pressures
-        for tire in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    f"tire_pressure_{tire.lower()}",
-                    f"Tire Pressure {tire}",
-                    lambda d, t=tire: d.get("additionalVehicleStatus", {})
-                    .get("maintenanceStatus", {})
-                    .get(f"tyreStatus{t}"),
-                    UnitOfPressure.KPA,
-                    SensorDeviceClass.PRESSURE,
-                )
-            )
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    f"tire_temperature_{tire.lower()}",
-                    f"Tire Temperature {tire}",
-                    lambda d, t=tire: d.get("additionalVehicleStatus", {})
-                    .get("maintenanceStatus", {})
-                    .get(f"tyreTemp{t}"),
-                    UnitOfTemperature.CELSIUS,
-                    SensorDeviceClass.TEMPERATURE,
-                )
-            )
+    entities.append(ZeekrWatchdogSensor(coordinator, entry.entry_id))
 
-        # Charging Status Sensors (only when charging)
-        if data.get("chargingStatus"):
-            # Charge Voltage
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    "charge_voltage",
-                    "Charge Voltage",
-                    lambda d: d.get("chargingStatus", {}).get("chargeVoltage"),
-                    UnitOfElectricPotential.VOLT,
-                    SensorDeviceClass.VOLTAGE,
-                )
-            )
-            # Charge Current
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    "charge_current",
-                    "Charge Current",
-                    lambda d: d.get("chargingStatus", {}).get("chargeCurrent"),
-                    UnitOfElectricCurrent.AMPERE,
-                    SensorDeviceClass.CURRENT,
-                )
-            )
-            # Charge Power
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    "charge_power",
-                    "Charge Power",
-                    lambda d: d.get("chargingStatus", {}).get("chargePower"),
-                    UnitOfPower.KILO_WATT,
-                    SensorDeviceClass.POWER,
-                )
-            )
-            # Charge Speed
-            entities.append(
-                ZeekrSensor(
-                    coordinator,
-                    vin,
-                    "charge_speed",
-                    "Charge Speed",
-                    lambda d: d.get("chargingStatus", {}).get("chargeSpeed"),
-                    "km/h",
-                    None,
-                )
-            )
-
-    async_add_entities(entities)
+    descriptions = vehicle_descriptions(
+        coordinator, SENSOR_DESCRIPTIONS + CHARGING_SENSOR_DESCRIPTIONS
+    )
+    if coordinator.compact_mode:
+        descriptions.extend(COMPACT_SENSOR_DESCRIPTIONS)
+
+    # Charging sensors are added once a vehicle has reported charging data
+    async_setup_vehicle_entities(
+        hass,
+        entry,
+        async_add_entities,
+        lambda vin: (
+            ZeekrSensor(coordinator, vin, description)
+            for description in descriptions
+            if coordinator.supports(vin, description.capability)
+        ),
+        entities,
+    )
 
 
-class ZeekrSensor(CoordinatorEntity, SensorEntity):
+class ZeekrSensor(ZeekrVehicleEntity, SensorEntity):
     """Zeekr Sensor class."""
 
-    def __init__(
-        self,
-        coordinator: ZeekrCoordinator,
-        vin: str,
-        key: str,
-        name: str,
-        value_fn,
-        unit: str | None = None,
-        device_class: SensorDeviceClass | None = None,
-        state_class: SensorStateClass | None = SensorStateClass.MEASUREMENT,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.vin = vin
-        self.key = key
-        self._attr_name = f"Zeekr {vin[-4:] if vin else ''} {name}"
-        self._attr_unique_id = f"{vin}_{key}"
-        self._value_fn = value_fn
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
+    entity_description: ZeekrSensorEntityDescription
+
+    _reported: Any = None
+    _reported_at: float | None = None
+    _reported_available: bool | None = None
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        data = self.coordinator.data.get(self.vin, {})
-        if not data:
-            return None
-        return self._value_fn(data)
+        if self._reported_at is not None:
+            return self._reported
+        return self._filtered_value()
+
+    def _filtered_value(self) -> Any:
+        value = self._snapshot_value()
+        digits = self.entity_description.round_digits
+        if digits is not None and isinstance(value, float):
+            value = round(value, digits)
+        return value
+
+    def _should_report(self, value: Any, available: bool, now: float) -> bool:
+        """Return whether `value` is worth a state write."""
+        description = self.entity_description
+        if self._reported_at is None or available != self._reported_available:
+            return True
+        if description.deadband is None and description.deadband_percent is None:
+            return True
+        if self._silence_passed(now):
+            return True
+        previous = self._reported
+        if not isinstance(value, (int, float)) or not isinstance(previous, (int, float)):
+            return value != previous
+        band = max(
+            description.deadband or 0.0,
+            abs(previous) * (description.deadband_percent or 0.0) / 100,
+        )
+        return abs(value - previous) > band
+
+    def _silence_passed(self, now: float) -> bool:
+        """Return whether a filtered sensor has not written for `max_silence`."""
+        description = self.entity_description
+        if description.deadband is None and description.deadband_percent is None:
+            return False
+        return (
+            self._reported_at is not None
+            and now - self._reported_at >= description.max_silence.total_seconds()
+        )
 
-    @property
-    def device_info(self):
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self.vin)},
-            "name": f"Zeekr {self.vin}",
-            "manufacturer": "Zeekr",
-        }
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state unless the change is inside the deadband.
+
+        An unchanged snapshot is skipped until `max_silence` passed, as it may
+        still hold a value that was held back inside the deadband.
+        """
+        now = time.monotonic()
+        if not self._snapshot_changed() and not self._silence_passed(now):
+            return
+        value = self._filtered_value()
+        available = self.available
+        if not self._should_report(value, available, now):
+            return
+        self._reported = value
+        self._reported_at = now
+        self._reported_available = available
+        self.async_write_ha_state()
 
 
 class ZeekrAPIStatusSensor(CoordinatorEntity, SensorEntity):
@@ -343,8 +443,7 @@ class ZeekrAPIStatusSensor(CoordinatorEntity, SensorEntity):
             if self.coordinator.vehicles and zeekr_app_sig_module:
                 try:
                     x_vins = {}
-                    for vehicle in self.coordinator.vehicles:
-                        vin = vehicle.vin
+                    for vin in self.coordinator.vehicles:
                         encrypted_vin = zeekr_app_sig_module.aes_encrypt(
                             vin, client.vin_key, client.vin_iv
                         )
@@ -389,3 +488,35 @@ class ZeekrAPIStatSensor(CoordinatorEntity, SensorEntity):
             "manufacturer": "Zeekr",
             "model": "API Integration",
         }
+
+
+class ZeekrWatchdogSensor(CoordinatorEntity, SensorEntity):
+    """Number of slow executor jobs and entity updates seen by the debug watchdog."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:timer-alert-outline"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator: ZeekrCoordinator, entry_id: str) -> None:
+        super().__init__(coordinator)
+        self._entry_id = entry_id
+        self._attr_name = "Zeekr Watchdog Slow Calls"
+        self._attr_unique_id = f"{entry_id}_watchdog_slow_calls"
+
+    @property
+    def native_value(self):
+        return self.coordinator.watchdog.total
+
+    @property
+    def extra_state_attributes(self):
+        return self.coordinator.watchdog.as_dict()
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return {
+            "identifiers": {(DOMAIN, self._entry_id)},
+            "name": "Zeekr API",
+            "manufacturer": "Zeekr",
+            "model": "API Integration",
+        }
@@ -0,0 +1,115 @@
+"""Services for Zeekr EV API Integration."""
+
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .capabilities import CAPABILITIES
+from .const import DOMAIN
+from .coordinator import ZeekrCoordinator
+from .profiler import (
+    DEFAULT_TOP,
+    MODE_CPROFILE,
+    PROFILE_MODES,
+    PROFILE_TARGETS,
+    TARGET_UPDATE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+SERVICE_REFRESH_VEHICLES = "refresh_vehicles"
+SERVICE_SET_CAPABILITY = "set_capability"
+
+ATTR_TARGET = "target"
+ATTR_COUNT = "count"
+ATTR_MODE = "mode"
+ATTR_TOP = "top"
+ATTR_VIN = "vin"
+ATTR_CAPABILITY = "capability"
+ATTR_SUPPORTED = "supported"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_TARGET, default=TARGET_UPDATE): vol.In(PROFILE_TARGETS),
+        vol.Optional(ATTR_COUNT, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+        vol.Optional(ATTR_MODE, default=MODE_CPROFILE): vol.In(PROFILE_MODES),
+        vol.Optional(ATTR_TOP, default=DEFAULT_TOP): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=500)
+        ),
+    }
+)
+
+SET_CAPABILITY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_VIN): cv.string,
+        vol.Required(ATTR_CAPABILITY): vol.In(CAPABILITIES),
+        # Omitted to go back to the learned value
+        vol.Optional(ATTR_SUPPORTED): cv.boolean,
+    }
+)
+
+
+def _coordinators(hass: HomeAssistant) -> list[ZeekrCoordinator]:
+    return [
+        value
+        for value in hass.data.get(DOMAIN, {}).values()
+        if isinstance(value, ZeekrCoordinator)
+    ]
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def _async_handle_profile(call: ServiceCall) -> None:
+        for coordinator in _coordinators(hass):
+            coordinator.profiler.arm(
+                call.data[ATTR_TARGET],
+                call.data[ATTR_COUNT],
+                call.data[ATTR_MODE],
+                call.data[ATTR_TOP],
+            )
+        _LOGGER.info(
+            "Profiling the next %d %s(s) with %s",
+            call.data[ATTR_COUNT],
+            call.data[ATTR_TARGET],
+            call.data[ATTR_MODE],
+        )
+
+    async def _async_handle_refresh_vehicles(call: ServiceCall) -> None:
+        for coordinator in _coordinators(hass):
+            await coordinator.async_refresh_vehicles()
+
+    async def _async_handle_set_capability(call: ServiceCall) -> None:
+        vin = call.data[ATTR_VIN]
+        for coordinator in _coordinators(hass):
+            if vin in coordinator.vehicles:
+                coordinator.async_set_capability(
+                    vin, call.data[ATTR_CAPABILITY], call.data.get(ATTR_SUPPORTED)
+                )
+                return
+        raise HomeAssistantError(f"No Zeekr vehicle with VIN {vin}")
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, _async_handle_profile, schema=PROFILE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH_VEHICLES,
+        _async_handle_refresh_vehicles,
+        schema=vol.Schema({}),
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_CAPABILITY,
+        _async_handle_set_capability,
+        schema=SET_CAPABILITY_SCHEMA,
+    )
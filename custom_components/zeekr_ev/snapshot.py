@@ -0,0 +1,299 @@
+"""Typed per-vehicle snapshot parsed once per coordinator update.
+
+The Zeekr API returns deeply nested dicts of strings. Entities used to walk
+that structure and convert values on every state read; the coordinator now
+converts each response once into a ``VehicleSnapshot`` and entities read
+plain attributes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any
+
+# API suffix of per-position fields -> snapshot attribute suffix, in display order
+POSITIONS = {
+    "Driver": "driver",
+    "Passenger": "passenger",
+    "DriverRear": "driver_rear",
+    "PassengerRear": "passenger_rear",
+}
+
+
+def _float(value: Any) -> float | None:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _int(value: Any) -> int | None:
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(float(value))
+        except (TypeError, ValueError):
+            return None
+
+
+def _is(value: Any, *on: str) -> bool | None:
+    """Return whether `value` is one of the `on` codes, None if missing."""
+    if value is None:
+        return None
+    return str(value) in on
+
+
+def _is_not(value: Any, off: str) -> bool | None:
+    if value is None:
+        return None
+    return str(value) != off
+
+
+def _timestamp(value: Any) -> datetime | None:
+    """Parse an epoch timestamp, in milliseconds like the API or in seconds."""
+    seconds = _float(value)
+    if not seconds:
+        return None
+    if seconds > 1e11:
+        seconds /= 1000
+    return datetime.fromtimestamp(seconds, timezone.utc)
+
+
+def status_update_time(data: dict[str, Any]) -> Any:
+    """Return the vehicle-side update time of a ``get_status`` response, as sent."""
+    return data.get("updateTime") or (data.get("basicVehicleStatus") or {}).get("updateTime")
+
+
+def charging_fields(charging: dict[str, Any]) -> dict[str, Any]:
+    """Snapshot fields of a ``chargingStatus`` response."""
+    return {
+        "has_charging_status": bool(charging),
+        "charge_voltage": _float(charging.get("chargeVoltage")),
+        "charge_current": _float(charging.get("chargeCurrent")),
+        "charge_power": _float(charging.get("chargePower")),
+        "charge_speed": _float(charging.get("chargeSpeed")),
+    }
+
+
+def _vent_level(status: Any, detail: Any) -> int:
+    """Seat ventilation reports on/off (1/2) and the level separately."""
+    if _int(status) == 1:
+        return _int(detail) or 0
+    return 0
+
+
+@dataclass(slots=True)
+class VehicleSnapshot:
+    """Pre-converted vehicle status used by every entity platform."""
+
+    # electricVehicleStatus
+    battery_level: float | None = None
+    range_km: float | None = None
+    charger_state: int | None = None
+    plugged_in: bool | None = None
+    charge_lid_closed: bool | None = None
+
+    # maintenanceStatus
+    odometer: float | None = None
+    tyre_pressure_driver: float | None = None
+    tyre_pressure_passenger: float | None = None
+    tyre_pressure_driver_rear: float | None = None
+    tyre_pressure_passenger_rear: float | None = None
+    tyre_temp_driver: float | None = None
+    tyre_temp_passenger: float | None = None
+    tyre_temp_driver_rear: float | None = None
+    tyre_temp_passenger_rear: float | None = None
+    tyre_pre_warning_driver: bool | None = None
+    tyre_pre_warning_passenger: bool | None = None
+    tyre_pre_warning_driver_rear: bool | None = None
+    tyre_pre_warning_passenger_rear: bool | None = None
+    tyre_temp_warning_driver: bool | None = None
+    tyre_temp_warning_passenger: bool | None = None
+    tyre_temp_warning_driver_rear: bool | None = None
+    tyre_temp_warning_passenger_rear: bool | None = None
+
+    # drivingSafetyStatus
+    central_locked: bool | None = None
+    door_locked_driver: bool | None = None
+    door_locked_passenger: bool | None = None
+    door_locked_driver_rear: bool | None = None
+    door_locked_passenger_rear: bool | None = None
+    trunk_locked: bool | None = None
+    park_brake_on: bool | None = None
+    door_open_driver: bool | None = None
+    door_open_passenger: bool | None = None
+    door_open_driver_rear: bool | None = None
+    door_open_passenger_rear: bool | None = None
+    trunk_open: bool | None = None
+    hood_open: bool | None = None
+
+    # climateStatus
+    interior_temp: float | None = None
+    climate_active: bool = False
+    defrost: bool | None = None
+    steering_wheel_heat: bool | None = None
+    sunshade_closed: bool | None = None
+    sunshade_position: int | None = None
+    window_closed_driver: bool | None = None
+    window_closed_passenger: bool | None = None
+    window_closed_driver_rear: bool | None = None
+    window_closed_passenger_rear: bool | None = None
+    window_position_driver: int | None = None
+    window_position_passenger: int | None = None
+    window_position_driver_rear: int | None = None
+    window_position_passenger_rear: int | None = None
+    seat_heat_driver: int = 0
+    seat_heat_passenger: int = 0
+    seat_heat_rear_left: int = 0
+    seat_heat_rear_right: int = 0
+    seat_vent_driver: int = 0
+    seat_vent_passenger: int = 0
+
+    # remoteControlState
+    sentry_mode: bool | None = None
+
+    # basicVehicleStatus.position
+    latitude: float | None = None
+    longitude: float | None = None
+
+    # chargingStatus, only fetched while a charger is connected
+    has_charging_status: bool = False
+    charge_voltage: float | None = None
+    charge_current: float | None = None
+    charge_power: float | None = None
+    charge_speed: float | None = None
+
+    # chargingLimit, in percent
+    charging_limit: float | None = None
+
+    # When the vehicle last sent this data to the cloud
+    updated_at: datetime | None = None
+
+    @property
+    def charging(self) -> bool | None:
+        """Actively charging; "26" means connected but finished."""
+        if self.charger_state is None:
+            return None
+        return self.charger_state == 1
+
+    @property
+    def charger_active(self) -> bool:
+        """Any non-zero charger state, as reported by the charging binary sensor."""
+        return bool(self.charger_state)
+
+    @property
+    def hood_closed(self) -> bool | None:
+        if self.hood_open is None:
+            return None
+        return not self.hood_open
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the fields by name.
+
+        The values are immutable, so unlike ``dataclasses.asdict`` nothing is
+        deep-copied.
+        """
+        return dict(zip(self.__slots__, _field_values(self)))
+
+    @classmethod
+    def from_status(cls, data: dict[str, Any]) -> VehicleSnapshot:
+        """Parse a merged ``get_status`` response."""
+        additional = data.get("additionalVehicleStatus") or {}
+        ev = additional.get("electricVehicleStatus") or {}
+        maintenance = additional.get("maintenanceStatus") or {}
+        safety = additional.get("drivingSafetyStatus") or {}
+        climate = additional.get("climateStatus") or {}
+        remote = additional.get("remoteControlState") or {}
+        position = (data.get("basicVehicleStatus") or {}).get("position") or {}
+        charging = data.get("chargingStatus") or {}
+        soc = _float((data.get("chargingLimit") or {}).get("soc"))
+
+        charge_lid = ev.get("chargeLidDcAcStatus")
+        if charge_lid is not None:
+            charge_lid = {"1": False, "2": True}.get(str(charge_lid))
+
+        return cls(
+            battery_level=_float(ev.get("chargeLevel")),
+            range_km=_float(ev.get("distanceToEmptyOnBatteryOnly")),
+            charger_state=_int(ev.get("chargerState")),
+            plugged_in=(
+                None
+                if (connection := _int(ev.get("statusOfChargerConnection"))) is None
+                else bool(connection)
+            ),
+            charge_lid_closed=charge_lid,
+            odometer=_float(maintenance.get("odometer")),
+            tyre_pressure_driver=_float(maintenance.get("tyreStatusDriver")),
+            tyre_pressure_passenger=_float(maintenance.get("tyreStatusPassenger")),
+            tyre_pressure_driver_rear=_float(maintenance.get("tyreStatusDriverRear")),
+            tyre_pressure_passenger_rear=_float(maintenance.get("tyreStatusPassengerRear")),
+            tyre_temp_driver=_float(maintenance.get("tyreTempDriver")),
+            tyre_temp_passenger=_float(maintenance.get("tyreTempPassenger")),
+            tyre_temp_driver_rear=_float(maintenance.get("tyreTempDriverRear")),
+            tyre_temp_passenger_rear=_float(maintenance.get("tyreTempPassengerRear")),
+            tyre_pre_warning_driver=_is_not(maintenance.get("tyrePreWarningDriver"), "0"),
+            tyre_pre_warning_passenger=_is_not(maintenance.get("tyrePreWarningPassenger"), "0"),
+            tyre_pre_warning_driver_rear=_is_not(maintenance.get("tyrePreWarningDriverRear"), "0"),
+            tyre_pre_warning_passenger_rear=_is_not(
+                maintenance.get("tyrePreWarningPassengerRear"), "0"
+            ),
+            tyre_temp_warning_driver=_is_not(maintenance.get("tyreTempWarningDriver"), "0"),
+            tyre_temp_warning_passenger=_is_not(maintenance.get("tyreTempWarningPassenger"), "0"),
+            tyre_temp_warning_driver_rear=_is_not(
+                maintenance.get("tyreTempWarningDriverRear"), "0"
+            ),
+            tyre_temp_warning_passenger_rear=_is_not(
+                maintenance.get("tyreTempWarningPassengerRear"), "0"
+            ),
+            central_locked=_is(safety.get("centralLockingStatus"), "1"),
+            door_locked_driver=_is(safety.get("doorLockStatusDriver"), "1"),
+            door_locked_passenger=_is(safety.get("doorLockStatusPassenger"), "1"),
+            door_locked_driver_rear=_is(safety.get("doorLockStatusDriverRear"), "1"),
+            door_locked_passenger_rear=_is(safety.get("doorLockStatusPassengerRear"), "1"),
+            trunk_locked=_is(safety.get("trunkLockStatus"), "1"),
+            park_brake_on=_is(safety.get("electricParkBrakeStatus"), "1"),
+            door_open_driver=_is(safety.get("doorOpenStatusDriver"), "1"),
+            door_open_passenger=_is(safety.get("doorOpenStatusPassenger"), "1"),
+            door_open_driver_rear=_is(safety.get("doorOpenStatusDriverRear"), "1"),
+            door_open_passenger_rear=_is(safety.get("doorOpenStatusPassengerRear"), "1"),
+            trunk_open=_is(safety.get("trunkOpenStatus"), "1"),
+            hood_open=_is(safety.get("engineHoodOpenStatus"), "1"),
+            interior_temp=_float(climate.get("interiorTemp")),
+            climate_active=str(climate.get("preClimateActive")).lower() in ("true", "1"),
+            defrost=_is(climate.get("defrost"), "1"),
+            steering_wheel_heat=_is(climate.get("steerWhlHeatingSts"), "1"),
+            sunshade_closed=_is(climate.get("curtainOpenStatus"), "1"),
+            sunshade_position=_int(climate.get("curtainPos")),
+            window_closed_driver=_is(climate.get("winStatusDriver"), "2"),
+            window_closed_passenger=_is(climate.get("winStatusPassenger"), "2"),
+            window_closed_driver_rear=_is(climate.get("winStatusDriverRear"), "2"),
+            window_closed_passenger_rear=_is(climate.get("winStatusPassengerRear"), "2"),
+            window_position_driver=_int(climate.get("winPosDriver")),
+            window_position_passenger=_int(climate.get("winPosPassenger")),
+            window_position_driver_rear=_int(climate.get("winPosDriverRear")),
+            window_position_passenger_rear=_int(climate.get("winPosPassengerRear")),
+            seat_heat_driver=_int(climate.get("drvHeatSts")) or 0,
+            seat_heat_passenger=_int(climate.get("passHeatingSts")) or 0,
+            seat_heat_rear_left=_int(climate.get("rlHeatingSts")) or 0,
+            seat_heat_rear_right=_int(climate.get("rrHeatingSts")) or 0,
+            seat_vent_driver=_vent_level(climate.get("drvVentSts"), climate.get("drvVentDetail")),
+            seat_vent_passenger=_vent_level(
+                climate.get("passVentSts"), climate.get("passVentDetail")
+            ),
+            sentry_mode=_is(remote.get("vstdModeState"), "1", "true", "True"),
+            latitude=_float(position.get("latitude")) or None,
+            longitude=_float(position.get("longitude")) or None,
+            **charging_fields(charging),
+            charging_limit=soc / 10.0 if soc is not None else None,
+            updated_at=_timestamp(status_update_time(data)),
+        )
+
+
+_field_values = attrgetter(*VehicleSnapshot.__slots__)
@@ -3,16 +3,59 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
-from homeassistant.components.switch import SwitchEntity
+from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CAPABILITY_SENTRY_MODE, DOMAIN
 from .coordinator import ZeekrCoordinator
+from .entity import (
+    ZeekrEntityDescription,
+    ZeekrVehicleEntity,
+    async_setup_vehicle_entities,
+)
+from .tracing import get_tracer, traced, traced_command
+
+
+@dataclass(frozen=True, kw_only=True)
+class ZeekrSwitchEntityDescription(ZeekrEntityDescription, SwitchEntityDescription):
+    """Describes a Zeekr switch; the key is also the VehicleSnapshot attribute."""
+
+    icon: str | None = "mdi:toggle-switch"
+
+
+SWITCH_DESCRIPTIONS: dict[str, ZeekrSwitchEntityDescription] = {
+    description.key: description
+    for description in (
+        ZeekrSwitchEntityDescription(
+            key="defrost", name="Defroster", value_fn=attrgetter("defrost")
+        ),
+        ZeekrSwitchEntityDescription(
+            key="charging",
+            name="Charging",
+            icon="mdi:battery-off",
+            value_fn=attrgetter("charging"),
+        ),
+        ZeekrSwitchEntityDescription(
+            key="steering_wheel_heat",
+            name="Steering Wheel Heat",
+            icon="mdi:steering",
+            value_fn=attrgetter("steering_wheel_heat"),
+        ),
+        ZeekrSwitchEntityDescription(
+            key="sentry_mode",
+            name="Sentry Mode",
+            icon="mdi:cctv",
+            value_fn=attrgetter("sentry_mode"),
+            capability=CAPABILITY_SENTRY_MODE,
+        ),
+    )
+}
 
 
 async def async_setup_entry(
@@ -22,97 +65,39 @@ async def async_setup_entry(
 ) -> None:
     """Set up the switch platform."""
     coordinator: ZeekrCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities: list[ZeekrSwitch] = []
-
-    for vin in coordinator.data:
-        entities.append(ZeekrSwitch(coordinator, vin, "defrost", "Defroster"))
-        entities.append(ZeekrSwitch(coordinator, vin, "charging", "Charging"))
-        entities.append(
-            ZeekrSwitch(
-                coordinator,
-                vin,
-                "steering_wheel_heat",
-                "Steering Wheel Heat",
-                status_key="steerWhlHeatingSts",
-            )
-        )
-        entities.append(
-            ZeekrSwitch(
-                coordinator,
-                vin,
-                "sentry_mode",
-                "Sentry Mode",
-                status_key="vstdModeState",
-                status_group="remoteControlState",
-            )
-        )
-
-    async_add_entities(entities)
+    async_setup_vehicle_entities(
+        hass,
+        entry,
+        async_add_entities,
+        lambda vin: (
+            ZeekrSwitch(coordinator, vin, description)
+            for description in SWITCH_DESCRIPTIONS.values()
+            if coordinator.supports(vin, description.capability)
+        ),
+    )
 
 
-class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
+class ZeekrSwitch(ZeekrVehicleEntity, SwitchEntity):
     """Zeekr Switch class."""
 
-    _attr_icon = "mdi:toggle-switch"
+    entity_description: ZeekrSwitchEntityDescription
 
     def __init__(
         self,
         coordinator: ZeekrCoordinator,
         vin: str,
-        field: str,
-        label: str,
-        status_key: str | None = None,
-        status_group: str = "climateStatus",
+        description: ZeekrSwitchEntityDescription,
     ) -> None:
         """Initialize the switch entity."""
-        super().__init__(coordinator)
-        self.vin = vin
-        self.field = field
-        self.status_key = status_key or field
-        self.status_group = status_group
-        self._attr_name = f"Zeekr {vin[-4:] if vin else ''} {label}"
-        self._attr_unique_id = f"{vin}_{field}"
-        if field == "charging":
-            self._attr_icon = "mdi:battery-off"
-        elif field == "steering_wheel_heat":
-            self._attr_icon = "mdi:steering"
-        elif field == "sentry_mode":
-            self._attr_icon = "mdi:cctv"
+        super().__init__(coordinator, vin, description)
+        self.field = description.key
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        try:
-            val = None
-            if self.field == "charging":
-                val = (
-                    self.coordinator.data.get(self.vin, {})
-                    .get("additionalVehicleStatus", {})
-                    .get("electricVehicleStatus", {})
-                    .get("chargerState")
-                )
-                if val is None:
-                    return None
-                # "1" is charging, "26" is connected but finished.
-                return str(val) == "1"
-            else:
-                val = (
-                    self.coordinator.data.get(self.vin, {})
-                    .get("additionalVehicleStatus", {})
-                    .get(self.status_group, {})
-                    .get(self.status_key)
-                )
-                if val is None:
-                    return None
-                if self.field == "sentry_mode":
-                    # vstdModeState: "1" (on), "0" (off)
-                    return str(val) in {"1", "true", "True"}
-                # User: "1" (on), "0" (off), "2" (off)
-                # For defrost and seats, usually "1" is On.
-                return str(val) == "1"
-        except (ValueError, TypeError, AttributeError):
-            return None
+        return self._snapshot_value()
 
+    @traced_command
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         if self.field == "charging":
@@ -171,21 +156,24 @@ class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
             }
 
         if setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
+            await self.coordinator.async_remote_control(
+                vehicle, command, service_id, setting
             )
             self._update_local_state_optimistically(is_on=True)
             self.async_write_ha_state()
             if self.field == "sentry_mode":
                 async def delayed_refresh():
-                    await asyncio.sleep(10)
-                    await self.coordinator.async_request_refresh()
+                    with get_tracer(self.coordinator).start_as_current_span(
+                        "zeekr.delayed_refresh", attributes={"vin": self.vin}
+                    ):
+                        await asyncio.sleep(10)
+                        await self.coordinator.async_request_refresh()
 
                 self.hass.async_create_task(delayed_refresh())
             else:
                 await self.coordinator.async_request_refresh()
 
+    @traced_command
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         vehicle = self.coordinator.get_vehicle_by_vin(self.vin)
@@ -240,56 +228,29 @@ class ZeekrSwitch(CoordinatorEntity[ZeekrCoordinator], SwitchEntity):
             }
 
         if setting:
-            await self.coordinator.async_inc_invoke()
-            await self.hass.async_add_executor_job(
-                vehicle.do_remote_control, command, service_id, setting
+            await self.coordinator.async_remote_control(
+                vehicle, command, service_id, setting
             )
             self._update_local_state_optimistically(is_on=False)
             self.async_write_ha_state()
             if self.field == "sentry_mode":
                 async def delayed_refresh():
-                    await asyncio.sleep(10)
-                    await self.coordinator.async_request_refresh()
+                    with get_tracer(self.coordinator).start_as_current_span(
+                        "zeekr.delayed_refresh", attributes={"vin": self.vin}
+                    ):
+                        await asyncio.sleep(10)
+                        await self.coordinator.async_request_refresh()
 
                 self.hass.async_create_task(delayed_refresh())
             else:
                 await self.coordinator.async_request_refresh()
 
+    @traced("zeekr.optimistic_write")
     def _update_local_state_optimistically(self, is_on: bool) -> None:
-        """Update the coordinator data to reflect the change immediately."""
-        data = self.coordinator.data.get(self.vin)
-        if not data:
-            return
-
+        """Show the requested state until a poll confirms it."""
         if self.field == "charging":
-            ev_status = (
-                data.setdefault("additionalVehicleStatus", {})
-                .setdefault("electricVehicleStatus", {})
-            )
-            # If turning off, set to "0" (or just not "1").
-            # If turning on (not supported), we wouldn't be here or it's optimistic.
+            # Charging can only be stopped; clear the "1" (charging) state
             if not is_on:
-                # Assuming "0" or "2" is stopped. Just setting to "0" to clear "1".
-                ev_status["chargerState"] = "0"
+                self.coordinator.async_set_optimistic(self.vin, charger_state=0)
         else:
-            status_group = (
-                data.setdefault("additionalVehicleStatus", {})
-                .setdefault(self.status_group, {})
-            )
-
-            if self.field == "defrost":
-                status_group[self.field] = "1" if is_on else "0"
-            elif self.field == "steering_wheel_heat":
-                # User says: "steerWhlHeatingSts": "1" when on, "2" when off
-                status_group[self.status_key] = "1" if is_on else "2"
-            elif self.field == "sentry_mode":
-                status_group[self.status_key] = "1" if is_on else "0"
-
-    @property
-    def device_info(self):
-        """Return device info."""
-        return {
-            "identifiers": {(DOMAIN, self.vin)},
-            "name": f"Zeekr {self.vin}",
-            "manufacturer": "Zeekr",
-        }
+            self.coordinator.async_set_optimistic(self.vin, **{self.field: is_on})
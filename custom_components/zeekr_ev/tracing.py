@@ -0,0 +1,234 @@
+"""Lightweight span tracing for API calls and remote commands.
+
+The tracer mirrors the small part of the OpenTelemetry API the integration
+uses (``start_as_current_span``, ``set_attribute``, ``record_exception``), so
+an OpenTelemetry tracer can be dropped in place of ``ZeekrTracer``. The
+default is a no-op tracer that costs one context manager per span.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Iterator
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+TRACE_FILE = "zeekr_ev_traces.jsonl"
+# Size at which the trace file is rotated to TRACE_FILE.1, replacing the
+# previous one
+MAX_TRACE_FILE_SIZE = 10 * 1024 * 1024
+# Traces held back while they have running spans; past this the oldest trace is
+# written as it stands so spans that never end cannot pile up
+MAX_PENDING_TRACES = 100
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+_current_span: ContextVar[Span | None] = ContextVar("zeekr_ev_span", default=None)
+
+
+class NoOpSpan:
+    """Span that records nothing."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Ignore the exception."""
+
+
+class NoOpTracer:
+    """Tracer used when tracing is disabled."""
+
+    _span = NoOpSpan()
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: dict[str, Any] | None = None, root: bool = False
+    ) -> Iterator[NoOpSpan]:
+        yield self._span
+
+
+NOOP_TRACER = NoOpTracer()
+
+
+class Span:
+    """A finished or running span."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "status",
+        "error",
+        "start",
+        "_started",
+        "duration",
+    )
+
+    def __init__(self, name: str, parent: Span | None, attributes: dict[str, Any]) -> None:
+        self.name = name
+        self.span_id = os.urandom(8).hex()
+        self.trace_id: str = parent.trace_id if parent else os.urandom(16).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.status = STATUS_OK
+        self.error: str | None = None
+        self.start = time.time()
+        self._started = time.monotonic()
+        self.duration = 0.0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.error = repr(exception)
+
+    def end(self) -> None:
+        self.duration = time.monotonic() - self._started
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class JsonlSpanExporter:
+    """Append finished spans to a JSON Lines file for offline analysis.
+
+    Spans are written once no span of their trace is running any more. Work a
+    command defers (a delayed refresh, a debounced send) can outlive the
+    command's root span; its spans are then written in a batch of their own
+    under the same trace id. The file is rotated once it reaches `max_size`,
+    keeping one old file.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, path: str, max_size: int = MAX_TRACE_FILE_SIZE
+    ) -> None:
+        self.hass = hass
+        self.path = path
+        self.max_size = max_size
+        # trace_id -> number of spans of the trace that are still running
+        self._running: dict[str, int] = {}
+        # trace_id -> finished spans of traces with spans still running
+        self._pending: dict[str, list[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def start(self, span: Span) -> None:
+        self._running[span.trace_id] = self._running.get(span.trace_id, 0) + 1
+
+    def export(self, span: Span) -> None:
+        trace_id = span.trace_id
+        running = self._running.pop(trace_id, 1) - 1
+        if running > 0:
+            self._running[trace_id] = running
+            if trace_id not in self._pending and len(self._pending) >= MAX_PENDING_TRACES:
+                oldest = next(iter(self._pending))
+                self._running.pop(oldest, None)
+                self.hass.async_add_executor_job(self._write, self._pending.pop(oldest))
+            self._pending.setdefault(trace_id, []).append(span.as_dict())
+            return
+        # Write once per trace rather than per span
+        pending = self._pending.pop(trace_id, [])
+        pending.append(span.as_dict())
+        self.hass.async_add_executor_job(self._write, pending)
+
+    def _write(self, spans: list[dict[str, Any]]) -> None:
+        with self._lock:
+            try:
+                if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_size:
+                    os.replace(self.path, f"{self.path}.1")
+                with open(self.path, "a", encoding="utf-8") as handle:
+                    for span in spans:
+                        handle.write(json.dumps(span, default=str) + "\n")
+            except OSError as err:
+                _LOGGER.error("Could not write Zeekr traces: %s", err)
+
+
+class ZeekrTracer:
+    """Tracer that hands finished spans to an exporter."""
+
+    def __init__(self, exporter: JsonlSpanExporter) -> None:
+        self.exporter = exporter
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: dict[str, Any] | None = None, root: bool = False
+    ) -> Iterator[Span]:
+        """Start a span as a child of the current one, or a new trace if `root`."""
+        parent = None if root else _current_span.get()
+        span = Span(name, parent, dict(attributes or {}))
+        self.exporter.start(span)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as err:
+            span.record_exception(err)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self.exporter.export(span)
+
+
+def get_tracer(coordinator: Any) -> NoOpTracer | ZeekrTracer:
+    """Return the coordinator's tracer, or the no-op tracer."""
+    return getattr(coordinator, "tracer", NOOP_TRACER)
+
+
+def _entity_attributes(entity: Any) -> dict[str, Any]:
+    return {
+        "vin": getattr(entity, "vin", None),
+        "entity_id": getattr(entity, "entity_id", None) or getattr(entity, "unique_id", None),
+    }
+
+
+def traced_command(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Trace an entity command method, normally the root of a command trace."""
+
+    @functools.wraps(func)
+    async def _wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with get_tracer(self.coordinator).start_as_current_span(
+            f"zeekr.command.{type(self).__name__}.{func.__name__}",
+            attributes=_entity_attributes(self),
+        ):
+            return await func(self, *args, **kwargs)
+
+    return _wrapper
+
+
+def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Trace a synchronous entity method as a child span."""
+
+    def _decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def _wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            with get_tracer(self.coordinator).start_as_current_span(
+                name, attributes=_entity_attributes(self)
+            ):
+                return func(self, *args, **kwargs)
+
+        return _wrapper
+
+    return _decorator
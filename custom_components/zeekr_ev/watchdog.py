@@ -0,0 +1,76 @@
+"""Debug watchdog for slow executor jobs and slow entity state writes."""
+
+from __future__ import annotations
+
+from collections import Counter
+import logging
+from typing import Any, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_EXECUTOR_THRESHOLD = 10.0  # seconds
+DEFAULT_ENTITY_THRESHOLD = 50.0  # milliseconds
+
+
+class ZeekrWatchdog:
+    """Count and log Zeekr calls that exceed the configured thresholds."""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        executor_threshold: float = DEFAULT_EXECUTOR_THRESHOLD,
+        entity_threshold_ms: float = DEFAULT_ENTITY_THRESHOLD,
+    ) -> None:
+        self.enabled = enabled
+        self.executor_threshold = executor_threshold
+        self.entity_threshold = entity_threshold_ms / 1000
+        self.slow_executor_jobs = 0
+        self.slow_entity_updates = 0
+        self.slow_calls: Counter[str] = Counter()
+
+    @property
+    def total(self) -> int:
+        return self.slow_executor_jobs + self.slow_entity_updates
+
+    def record_executor_job(self, name: str, vin: str | None, seconds: float) -> None:
+        """Record the duration of an executor job."""
+        if not self.enabled or seconds < self.executor_threshold:
+            return
+        self.slow_executor_jobs += 1
+        self.slow_calls[f"{name} ({vin})" if vin else name] += 1
+        _LOGGER.warning(
+            "Zeekr executor job %s for %s took %.2fs (threshold %.2fs)",
+            name,
+            vin or "account",
+            seconds,
+            self.executor_threshold,
+        )
+
+    def record_entity_update(
+        self, update_callback: Callable[[], Any], seconds: float
+    ) -> None:
+        """Record how long an entity took to evaluate and write its state."""
+        if not self.enabled or seconds < self.entity_threshold:
+            return
+        entity = getattr(update_callback, "__self__", None)
+        name = getattr(entity, "entity_id", None) or type(entity).__name__
+        vin = getattr(entity, "vin", None)
+        self.slow_entity_updates += 1
+        self.slow_calls[name] += 1
+        _LOGGER.warning(
+            "Zeekr entity %s for %s took %.1fms to update (threshold %.1fms)",
+            name,
+            vin or "account",
+            seconds * 1000,
+            self.entity_threshold * 1000,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "executor_threshold": self.executor_threshold,
+            "entity_threshold_ms": self.entity_threshold * 1000,
+            "slow_executor_jobs": self.slow_executor_jobs,
+            "slow_entity_updates": self.slow_entity_updates,
+            "slow_calls": dict(self.slow_calls.most_common(20)),
+        }
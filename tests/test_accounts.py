@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock
+
+from custom_components.zeekr_ev.accounts import (
+    DATA_ACCOUNTS,
+    account_key,
+    async_get_account,
+    async_release_account,
+)
+from custom_components.zeekr_ev.const import DOMAIN
+
+
+def test_account_key_ignores_username_case():
+    assert account_key({"username": "Me@Example.com", "country_code": "AU"}) == (
+        "me@example.com",
+        "AU",
+    )
+    assert account_key({"username": "me@example.com"}) != account_key(
+        {"username": "me@example.com", "country_code": "AU"}
+    )
+
+
+def test_entries_of_an_account_follow_the_first(hass):
+    data = {"username": "me@example.com", "country_code": "AU"}
+    account = async_get_account(hass, data)
+    assert async_get_account(hass, {**data, "username": "ME@example.com"}) is account
+
+    first, second, third = MagicMock(), MagicMock(), MagicMock()
+    account.async_add("entry1", first)
+    account.async_add("entry2", second)
+    account.async_add("entry3", third)
+    first.async_follow.assert_not_called()
+    second.async_follow.assert_called_once_with(first)
+    third.async_follow.assert_called_once_with(first)
+
+    # A follower leaving does not change who polls
+    async_release_account(hass, "entry3")
+    third.async_follow.assert_called_with(None)
+    assert account.feed is first
+
+    # The next entry takes over polling
+    async_release_account(hass, "entry1")
+    assert account.feed is second
+    second.async_follow.assert_called_with(None)
+    second.hass.async_create_task.assert_called_once()
+
+    async_release_account(hass, "entry2")
+    assert hass.data[DOMAIN][DATA_ACCOUNTS] == {}
@@ -1,33 +1,59 @@
-from custom_components.zeekr_ev.binary_sensor import ZeekrBinarySensor
+from operator import attrgetter
+
+from custom_components.zeekr_ev.binary_sensor import (
+    BINARY_SENSOR_DESCRIPTIONS,
+    COMPACT_BINARY_SENSOR_DESCRIPTIONS,
+    ZeekrBinarySensor,
+    ZeekrBinarySensorEntityDescription,
+)
+from custom_components.zeekr_ev.snapshot import POSITIONS, VehicleSnapshot
+
+DESCRIPTIONS = {d.key: d for d in BINARY_SENSOR_DESCRIPTIONS}
 
 
 class DummyCoordinator:
     def __init__(self, data):
-        self.data = data
+        self.data = {vin: VehicleSnapshot.from_status(raw) for vin, raw in data.items()}
+        self.generation = 0
+        self.value_cache_hits = 0
+        self.value_cache_misses = 0
+
+    def get_snapshot(self, vin):
+        return self.data.get(vin)
 
 
 def test_is_on_none_when_no_data():
     coordinator = DummyCoordinator({})
-    bs = ZeekrBinarySensor(coordinator, "VIN1", "charging_status", "Charging Status", lambda d: True)
+    bs = ZeekrBinarySensor(
+        coordinator,
+        "VIN1",
+        ZeekrBinarySensorEntityDescription(key="test", name="Test", value_fn=lambda s: True),
+    )
     assert bs.is_on is None
 
 
 def test_charging_status_true_false():
     data_true = {
-        "VIN1": {"additionalVehicleStatus": {"electricVehicleStatus": {"isCharging": True}}}
+        "VIN1": {"additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "1"}}}
     }
     coordinator = DummyCoordinator(data_true)
-    bs = ZeekrBinarySensor(coordinator, "VIN1", "charging_status", "Charging Status", lambda d: d.get("additionalVehicleStatus", {}).get("electricVehicleStatus", {}).get("isCharging"))
+    bs = ZeekrBinarySensor(coordinator, "VIN1", DESCRIPTIONS["charging_status"])
     assert bs.is_on is True
 
     data_false = {
-        "VIN1": {"additionalVehicleStatus": {"electricVehicleStatus": {"isCharging": False}}}
+        "VIN1": {"additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "0"}}}
     }
     coordinator = DummyCoordinator(data_false)
-    bs = ZeekrBinarySensor(coordinator, "VIN1", "charging_status", "Charging Status", lambda d: d.get("additionalVehicleStatus", {}).get("electricVehicleStatus", {}).get("isCharging"))
+    bs = ZeekrBinarySensor(coordinator, "VIN1", DESCRIPTIONS["charging_status"])
     assert bs.is_on is False
 
 
+def test_plugged_in_missing_is_unknown():
+    coordinator = DummyCoordinator({"VIN1": {}})
+    bs = ZeekrBinarySensor(coordinator, "VIN1", DESCRIPTIONS["plugged_in"])
+    assert bs.is_on is None
+
+
 def test_tire_warning_sensors():
     # Test NO warning
     data_ok = {
@@ -49,29 +75,13 @@ def test_tire_warning_sensors():
     coordinator = DummyCoordinator(data_ok)
 
     # Pre-Warning
-    for tire in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-        bs = ZeekrBinarySensor(
-            coordinator,
-            "VIN1",
-            f"tire_pre_warning_{tire.lower()}",
-            f"Tire Pre-Warning {tire}",
-            lambda d, t=tire: (
-                None if (v := d.get("additionalVehicleStatus", {}).get("maintenanceStatus", {}).get(f"tyrePreWarning{t}")) is None else str(v) != "0"
-            ),
-        )
+    for tire in POSITIONS:
+        bs = ZeekrBinarySensor(coordinator, "VIN1", DESCRIPTIONS[f"tire_pre_warning_{tire.lower()}"])
         assert bs.is_on is False
 
     # Temp Warning
-    for tire in ["Driver", "Passenger", "DriverRear", "PassengerRear"]:
-        bs = ZeekrBinarySensor(
-            coordinator,
-            "VIN1",
-            f"tire_temp_warning_{tire.lower()}",
-            f"Tire Temp Warning {tire}",
-            lambda d, t=tire: (
-                None if (v := d.get("additionalVehicleStatus", {}).get("maintenanceStatus", {}).get(f"tyreTempWarning{t}")) is None else str(v) != "0"
-            ),
-        )
+    for tire in POSITIONS:
+        bs = ZeekrBinarySensor(coordinator, "VIN1", DESCRIPTIONS[f"tire_temp_warning_{tire.lower()}"])
         assert bs.is_on is False
 
     # Test WITH warning (e.g. value "1")
@@ -88,20 +98,43 @@ def test_tire_warning_sensors():
     coordinator = DummyCoordinator(data_warn)
 
     # Check Driver warning active
-    bs_pre = ZeekrBinarySensor(
-        coordinator,
-        "VIN1",
-        "tire_pre_warning_driver",
-        "Tire Pre-Warning Driver",
-        lambda d: (None if (v := d.get("additionalVehicleStatus", {}).get("maintenanceStatus", {}).get("tyrePreWarningDriver")) is None else str(v) != "0"),
-    )
+    bs_pre = ZeekrBinarySensor(coordinator, "VIN1", DESCRIPTIONS["tire_pre_warning_driver"])
     assert bs_pre.is_on is True
 
-    bs_temp = ZeekrBinarySensor(
+    bs_temp = ZeekrBinarySensor(coordinator, "VIN1", DESCRIPTIONS["tire_temp_warning_driver"])
+    assert bs_temp.is_on is True
+
+    # Positions without a reading stay unknown
+    bs_missing = ZeekrBinarySensor(
         coordinator,
         "VIN1",
-        "tire_temp_warning_driver",
-        "Tire Temp Warning Driver",
-        lambda d: (None if (v := d.get("additionalVehicleStatus", {}).get("maintenanceStatus", {}).get("tyreTempWarningDriver")) is None else str(v) != "0"),
+        ZeekrBinarySensorEntityDescription(
+            key="tire_pre_warning_passenger",
+            name="Tire Pre-Warning Passenger",
+            value_fn=attrgetter("tyre_pre_warning_passenger"),
+        ),
     )
-    assert bs_temp.is_on is True
+    assert bs_missing.is_on is None
+
+
+def test_compact_doors_sensor():
+    coordinator = DummyCoordinator(
+        {
+            "VIN1": {
+                "additionalVehicleStatus": {
+                    "drivingSafetyStatus": {
+                        "doorOpenStatusDriver": "0",
+                        "trunkOpenStatus": "1",
+                    }
+                }
+            }
+        }
+    )
+    bs = ZeekrBinarySensor(coordinator, "VIN1", COMPACT_BINARY_SENSOR_DESCRIPTIONS[0])
+    assert bs.is_on is True
+    assert bs.extra_state_attributes["trunk_open"] is True
+    assert bs.extra_state_attributes["door_open_driver"] is False
+    assert bs.extra_state_attributes["hood_open"] is None
+
+    bs = ZeekrBinarySensor(DummyCoordinator({"VIN1": {}}), "VIN1", COMPACT_BINARY_SENSOR_DESCRIPTIONS[0])
+    assert bs.is_on is None
@@ -23,6 +23,10 @@ class MockCoordinator:
                 return v
         return None
 
+    async def async_remote_control(self, vehicle, command, service_id, setting):
+        await self.async_inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
+
 
 class DummyConfig:
     def __init__(self):
@@ -0,0 +1,135 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.zeekr_ev.capabilities import (
+    PROBE_POLLS,
+    REPROBE_INTERVAL,
+    ZeekrCapabilities,
+)
+from custom_components.zeekr_ev.const import (
+    CAPABILITY_CHARGING_LIMIT,
+    CAPABILITY_CHARGING_STATUS,
+    CAPABILITY_REAR_SEAT_HEAT,
+    CAPABILITY_SUNSHADE,
+)
+
+WITH_SUNSHADE = {"additionalVehicleStatus": {"climateStatus": {"curtainPos": "0"}}}
+
+
+@pytest.fixture
+def mock_store(hass):
+    with patch("custom_components.zeekr_ev.capabilities.Store") as mock_store_cls:
+        mock_store_instance = MagicMock()
+        mock_store_instance.async_load = AsyncMock(return_value=None)
+        mock_store_cls.return_value = mock_store_instance
+        yield mock_store_instance
+
+
+def test_probed_capability_assumed_until_responses_lack_it(hass, mock_store):
+    profile = ZeekrCapabilities(hass, "entry1")
+    assert profile.supported("VIN1", CAPABILITY_SUNSHADE)
+
+    for _ in range(PROBE_POLLS - 1):
+        profile.async_learn("VIN1", {})
+    assert profile.supported("VIN1", CAPABILITY_SUNSHADE)
+    mock_store.async_delay_save.assert_not_called()
+
+    profile.async_learn("VIN1", {})
+    assert not profile.supported("VIN1", CAPABILITY_SUNSHADE)
+    assert not profile.supported("VIN1", CAPABILITY_REAR_SEAT_HEAT)
+    mock_store.async_delay_save.assert_called_once()
+
+    # A later response with the data brings it back
+    profile.async_learn("VIN1", WITH_SUNSHADE)
+    assert profile.supported("VIN1", CAPABILITY_SUNSHADE)
+
+
+def test_unprobed_capability_is_not_ruled_out(hass, mock_store):
+    profile = ZeekrCapabilities(hass, "entry1")
+    for _ in range(PROBE_POLLS):
+        profile.async_learn("VIN1", {}, {CAPABILITY_CHARGING_LIMIT})
+    assert profile.supported("VIN1", CAPABILITY_CHARGING_LIMIT)
+    assert not profile.supported("VIN1", CAPABILITY_SUNSHADE)
+
+
+def test_missing_capability_is_probed_again(hass, mock_store):
+    profile = ZeekrCapabilities(hass, "entry1")
+    with patch("custom_components.zeekr_ev.capabilities.time.monotonic", return_value=0):
+        for _ in range(PROBE_POLLS):
+            profile.async_learn("VIN1", {})
+        assert not profile.supported("VIN1", CAPABILITY_CHARGING_LIMIT)
+        assert not profile.probes("VIN1", CAPABILITY_CHARGING_LIMIT)
+
+    with patch(
+        "custom_components.zeekr_ev.capabilities.time.monotonic",
+        return_value=REPROBE_INTERVAL,
+    ):
+        assert profile.probes("VIN1", CAPABILITY_CHARGING_LIMIT)
+        profile.async_learn("VIN1", {"chargingLimit": {"soc": "800"}})
+    assert profile.supported("VIN1", CAPABILITY_CHARGING_LIMIT)
+
+    # An override is never probed
+    profile.async_set_override("VIN1", CAPABILITY_SUNSHADE, False)
+    assert not profile.probes("VIN1", CAPABILITY_SUNSHADE)
+
+
+def test_seen_capability_is_kept(hass, mock_store):
+    profile = ZeekrCapabilities(hass, "entry1")
+    profile.async_learn("VIN1", WITH_SUNSHADE)
+    for _ in range(PROBE_POLLS):
+        profile.async_learn("VIN1", {})
+    assert profile.supported("VIN1", CAPABILITY_SUNSHADE)
+
+
+def test_charging_status_only_after_it_was_seen(hass, mock_store):
+    profile = ZeekrCapabilities(hass, "entry1")
+    for _ in range(PROBE_POLLS + 1):
+        profile.async_learn("VIN1", {})
+    assert not profile.supported("VIN1", CAPABILITY_CHARGING_STATUS)
+    # Not ruled out, a charger may be connected later
+    assert CAPABILITY_CHARGING_STATUS not in profile.learned["VIN1"]
+
+    profile.async_learn("VIN1", {"chargingStatus": {"chargeVoltage": "230"}})
+    assert profile.supported("VIN1", CAPABILITY_CHARGING_STATUS)
+
+
+def test_override_wins_and_can_be_cleared(hass, mock_store):
+    profile = ZeekrCapabilities(hass, "entry1")
+    profile.async_learn("VIN1", WITH_SUNSHADE)
+
+    profile.async_set_override("VIN1", CAPABILITY_SUNSHADE, False)
+    assert not profile.supported("VIN1", CAPABILITY_SUNSHADE)
+    profile.async_set_override("VIN1", CAPABILITY_SUNSHADE, None)
+    assert profile.supported("VIN1", CAPABILITY_SUNSHADE)
+
+
+@pytest.mark.asyncio
+async def test_profile_persisted(hass, mock_store):
+    mock_store.async_load.return_value = {
+        "vehicles": {
+            "VIN1": {
+                "learned": {CAPABILITY_SUNSHADE: False},
+                "overrides": {CAPABILITY_REAR_SEAT_HEAT: False},
+            }
+        }
+    }
+    profile = ZeekrCapabilities(hass, "entry1")
+    await profile.async_load()
+
+    assert not profile.supported("VIN1", CAPABILITY_SUNSHADE)
+    assert not profile.supported("VIN1", CAPABILITY_REAR_SEAT_HEAT)
+    assert profile.supported("VIN2", CAPABILITY_SUNSHADE)
+    # Learned missing before the restart, so probed again
+    assert profile.probes("VIN1", CAPABILITY_SUNSHADE)
+
+    profile.async_learn("VIN2", WITH_SUNSHADE)
+    data_func = mock_store.async_delay_save.call_args[0][0]
+    assert data_func() == {
+        "vehicles": {
+            "VIN1": {
+                "learned": {CAPABILITY_SUNSHADE: False},
+                "overrides": {CAPABILITY_REAR_SEAT_HEAT: False},
+            },
+            "VIN2": {"learned": {CAPABILITY_SUNSHADE: True}, "overrides": {}},
+        }
+    }
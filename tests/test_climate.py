@@ -1,8 +1,10 @@
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 import pytest
 from homeassistant.components.climate import HVACMode
 from custom_components.zeekr_ev.climate import ZeekrClimate, async_setup_entry
 from custom_components.zeekr_ev.const import DOMAIN
+from custom_components.zeekr_ev.optimistic import OptimisticOverlay
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot
 
 
 class MockVehicle:
@@ -15,14 +17,25 @@ class MockVehicle:
 
 class MockCoordinator:
     def __init__(self, data):
-        self.data = data
+        self.data = {vin: VehicleSnapshot.from_status(raw) for vin, raw in data.items()}
+        self.overlay = OptimisticOverlay()
         self.vehicles = {}
         self.async_inc_invoke = AsyncMock()
         self.ac_duration = 15
 
+    def get_snapshot(self, vin):
+        return self.overlay.apply(vin, self.data.get(vin))
+
+    def async_set_optimistic(self, vin, **fields):
+        self.overlay.set(vin, fields)
+
     def get_vehicle_by_vin(self, vin):
         return self.vehicles.get(vin)
 
+    async def async_remote_control(self, vehicle, command, service_id, setting):
+        await self.async_inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
+
     async def async_request_refresh(self):
         pass
 
@@ -36,7 +49,8 @@ class DummyHass:
         return func(*args, **kwargs)
 
     def async_create_task(self, coro):
-        return coro
+        # The delayed refresh is not run; close it so it is not left unawaited
+        coro.close()
 
 
 @pytest.mark.asyncio
@@ -59,8 +73,7 @@ async def test_climate_optimistic_update():
 
     climate = ZeekrClimate(coordinator, vin)
     climate.hass = DummyHass()
-    # Simple mock for async_create_task
-    climate.hass.async_create_task = MagicMock()
+    climate.hass.async_create_task = MagicMock(side_effect=climate.hass.async_create_task)
     climate.async_write_ha_state = MagicMock()
 
     # Test Turn On
@@ -75,8 +88,8 @@ async def test_climate_optimistic_update():
     assert args[2]["serviceParameters"][0]["value"] == "true"
 
     # Verify Optimistic Update
-    climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
-    assert climate_status["preClimateActive"] == "1"
+    assert coordinator.get_snapshot(vin).climate_active is True
+    assert climate.hvac_mode == HVACMode.HEAT_COOL
     climate.async_write_ha_state.assert_called()
 
     # Verify Delayed Refresh Task Created
@@ -100,14 +113,51 @@ async def test_climate_optimistic_update():
     )
 
     # Verify Optimistic Update
-    climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
-    assert climate_status["preClimateActive"] == "0"
+    assert coordinator.get_snapshot(vin).climate_active is False
+    assert climate.hvac_mode == HVACMode.OFF
     climate.async_write_ha_state.assert_called()
 
     # Verify Delayed Refresh Task Created again
     assert climate.hass.async_create_task.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_climate_target_temperature_is_debounced():
+    vin = "VIN1"
+    coordinator = MockCoordinator(
+        {vin: {"additionalVehicleStatus": {"climateStatus": {"preClimateActive": "true"}}}}
+    )
+    vehicle_mock = MagicMock()
+    coordinator.vehicles[vin] = vehicle_mock
+
+    climate = ZeekrClimate(coordinator, vin)
+    climate.hass = DummyHass()
+    climate.hass.async_create_task = MagicMock(side_effect=climate.hass.async_create_task)
+    climate.async_write_ha_state = MagicMock()
+
+    with patch("custom_components.zeekr_ev.entity.async_call_later"):
+        for temperature in range(18, 25):
+            await climate.async_set_temperature(temperature=temperature)
+    vehicle_mock.do_remote_control.assert_not_called()
+    assert climate.target_temperature == 24
+    assert climate.async_write_ha_state.call_count == 7
+
+    await climate.async_flush_setpoint()
+    vehicle_mock.do_remote_control.assert_called_once()
+    args, _ = vehicle_mock.do_remote_control.call_args
+    assert args[2]["serviceParameters"][1] == {"key": "AC.temp", "value": "24"}
+
+    # Turning AC off drops a pending temperature
+    with patch("custom_components.zeekr_ev.entity.async_call_later"):
+        await climate.async_set_temperature(temperature=22)
+    await climate.async_set_hvac_mode(HVACMode.OFF)
+    await climate.async_flush_setpoint()
+    assert vehicle_mock.do_remote_control.call_count == 2
+    assert vehicle_mock.do_remote_control.call_args[0][2]["serviceParameters"] == [
+        {"key": "AC", "value": "false"}
+    ]
+
+
 @pytest.mark.asyncio
 async def test_climate_properties_missing_data(hass):
     coordinator = MockCoordinator({"VIN1": {}})
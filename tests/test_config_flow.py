@@ -1,6 +1,9 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 import custom_components.zeekr_ev.config_flow as config_flow
-from custom_components.zeekr_ev.const import CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL
+from custom_components.zeekr_ev.const import CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL, DOMAIN
 
 
 class FakeClient:
@@ -61,3 +64,38 @@ def test_polling_interval_default():
 def test_polling_interval_config_key():
     """Test that polling interval config key is defined."""
     assert CONF_POLLING_INTERVAL == "polling_interval"
+
+
+@pytest.mark.asyncio
+async def test_reauth_updates_running_client(hass, monkeypatch):
+    entry = SimpleNamespace(entry_id="entry1", data={"username": "user", "password": "old"})
+    coordinator = MagicMock()
+    coordinator.async_reauthenticate = AsyncMock(side_effect=[False, True])
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    hass.config_entries.async_get_entry = MagicMock(return_value=entry)
+    hass.config_entries.async_update_entry = MagicMock()
+    hass.config_entries.async_reload = AsyncMock()
+    hass.config_entries.flow = MagicMock()
+    hass.config_entries.flow.async_progress_by_handler.return_value = []
+
+    flow = config_flow.ZeekrEVAPIFlowHandler()
+    flow.hass = hass
+    flow.context = {"source": "reauth", "entry_id": entry.entry_id}
+    monkeypatch.setattr(
+        "homeassistant.config_entries.persistent_notification.async_dismiss", MagicMock()
+    )
+
+    result = await flow.async_step_reauth(entry.data)
+    assert result["step_id"] == "reauth_confirm"
+
+    result = await flow.async_step_reauth_confirm({"password": "wrong"})
+    assert result["errors"] == {"base": "auth"}
+    hass.config_entries.async_update_entry.assert_not_called()
+
+    result = await flow.async_step_reauth_confirm({"password": "new"})
+    assert result["reason"] == "reauth_successful"
+    hass.config_entries.async_update_entry.assert_called_once_with(
+        entry, data={"username": "user", "password": "new"}
+    )
+    # No reload: entities and data stay
+    hass.config_entries.async_reload.assert_not_called()
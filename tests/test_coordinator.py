@@ -1,8 +1,27 @@
-from unittest.mock import MagicMock, AsyncMock, patch
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock, call, patch
 import pytest
 import asyncio
+import time
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.zeekr_ev.capabilities import PROBE_POLLS
 from custom_components.zeekr_ev.coordinator import ZeekrCoordinator
-from custom_components.zeekr_ev.const import DOMAIN
+from custom_components.zeekr_ev.const import (
+    CAPABILITY_CHARGING_LIMIT,
+    CAPABILITY_SENTRY_MODE,
+    CAPABILITY_SUNSHADE,
+    DOMAIN,
+    VEHICLE_LIST_INTERVAL,
+)
+from custom_components.zeekr_ev.scheduler import (
+    COMMAND_CONFIRM_WINDOW,
+    INITIAL_CONCURRENT_CALLS,
+    LANE_COMMAND,
+)
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot
 
 
 class MockVehicle:
@@ -37,12 +56,21 @@ class DummyHass:
         self.loop = asyncio.get_event_loop()
 
 
+@pytest.fixture(autouse=True)
+def capability_store():
+    """Keep the capability profile off the disk."""
+    with patch("custom_components.zeekr_ev.capabilities.Store") as store:
+        store.return_value.async_load = AsyncMock(return_value=None)
+        yield store.return_value
+
+
 def mock_data_update_coordinator_init(self, hass, logger, name, update_interval=None, update_method=None, request_refresh_debouncer=None):
     """Mock DataUpdateCoordinator.__init__ to set basic attributes."""
     self.hass = hass
     self.logger = logger
     self.name = name
     self.update_interval = update_interval
+    self.data = None
     self._listeners = []
     self._micro_controller = MagicMock()
 
@@ -64,9 +92,11 @@ async def test_coordinator_update_charging_limit():
 
     client = MockClient([vehicle])
     hass = DummyHass()
+    config = DummyConfig()
+    config.data["raw_retention"] = True
 
     with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
-        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+        coordinator = ZeekrCoordinator(hass, client, config)
 
     # Mock stats
     coordinator.request_stats = MagicMock()
@@ -82,8 +112,10 @@ async def test_coordinator_update_charging_limit():
         vehicle.get_charging_limit.assert_called_once()
 
         # Verify data structure
-        assert "chargingLimit" in data[vin]
-        assert data[vin]["chargingLimit"]["soc"] == "800"
+        assert data[vin].charging_limit == 80.0
+        assert data[vin].charger_state == 1
+        # Raw retention keeps the response for diagnostics
+        assert coordinator.raw_data[vin]["chargingLimit"]["soc"] == "800"
     finally:
         if coordinator._unsub_reset:
             coordinator._unsub_reset()
@@ -112,7 +144,745 @@ async def test_coordinator_update_charging_limit_failure():
         data = await coordinator._async_update_data()
 
         # Should not crash, just missing data
-        assert "chargingLimit" not in data[vin]
+        assert data[vin].charging_limit is None
+        # Raw responses are dropped after parsing by default
+        assert coordinator.raw_data == {}
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_watchdog_times_listeners():
+    hass = DummyHass()
+    config = DummyConfig()
+    config.data.update({"debug_watchdog": True, "watchdog_entity_threshold": 0})
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([]), config)
+
+    try:
+        listener = MagicMock()
+        coordinator._listeners = {object(): (listener, None)}
+        coordinator.async_update_listeners()
+
+        listener.assert_called_once()
+        assert coordinator.watchdog.slow_entity_updates == 1
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_optimistic_overlay_reconciled_on_poll():
+    vin = "VIN1"
+    vehicle = MockVehicle(vin)
+    vehicle.get_status.return_value = {
+        "additionalVehicleStatus": {"drivingSafetyStatus": {"centralLockingStatus": "0"}}
+    }
+    vehicle.get_charging_limit.return_value = {}
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        coordinator.data = await coordinator._async_update_data()
+        with patch("custom_components.zeekr_ev.coordinator.event.async_call_later") as call_later:
+            coordinator.async_set_optimistic(vin, central_locked=True)
+        call_later.assert_called_once()
+        assert coordinator.get_snapshot(vin).central_locked is True
+        assert coordinator.data[vin].central_locked is False
+
+        # A stale poll keeps the optimistic value
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.get_snapshot(vin).central_locked is True
+
+        # The car confirms the command
+        vehicle.get_status.return_value = {
+            "additionalVehicleStatus": {"drivingSafetyStatus": {"centralLockingStatus": "1"}}
+        }
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.overlay.pending(vin) == {}
+        assert coordinator.get_snapshot(vin) is coordinator.data[vin]
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_announces_new_vehicles_and_capabilities():
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([]), DummyConfig())
+    coordinator._listeners = {}
+
+    try:
+        with patch("custom_components.zeekr_ev.coordinator.async_dispatcher_send") as send:
+            coordinator.data = {"VIN1": VehicleSnapshot()}
+            coordinator.async_update_listeners()
+            send.assert_called_once_with(hass, "zeekr_ev_new_vehicle_test_entry", "VIN1")
+
+            send.reset_mock()
+            coordinator.capability_profile.async_learn("VIN1", {"chargingStatus": {"chargePower": "7"}})
+            coordinator.data = {"VIN1": VehicleSnapshot(), "VIN2": VehicleSnapshot()}
+            coordinator.async_update_listeners()
+            assert send.call_args_list == [
+                call(hass, "zeekr_ev_capabilities_changed_test_entry", "VIN1"),
+                call(hass, "zeekr_ev_new_vehicle_test_entry", "VIN2"),
+            ]
+
+            # Only changes are announced
+            send.reset_mock()
+            coordinator.async_update_listeners()
+            send.assert_not_called()
+
+            coordinator.async_set_capability("VIN2", CAPABILITY_SUNSHADE, False)
+            send.assert_called_once_with(
+                hass, "zeekr_ev_capabilities_changed_test_entry", "VIN2"
+            )
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_removes_vanished_vehicle_device():
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([]), DummyConfig())
+    coordinator._listeners = {}
+
+    device_registry = MagicMock()
+    device_registry.async_get_device.return_value = MagicMock(id="device_vin2")
+    try:
+        with patch("custom_components.zeekr_ev.coordinator.async_dispatcher_send"), patch(
+            "custom_components.zeekr_ev.coordinator.dr.async_get", return_value=device_registry
+        ):
+            coordinator.data = {"VIN1": VehicleSnapshot(), "VIN2": VehicleSnapshot()}
+            coordinator.async_update_listeners()
+            device_registry.async_update_device.assert_not_called()
+
+            coordinator.data = {"VIN1": VehicleSnapshot()}
+            coordinator.async_update_listeners()
+
+        device_registry.async_get_device.assert_called_once_with(identifiers={(DOMAIN, "VIN2")})
+        device_registry.async_update_device.assert_called_once_with(
+            "device_vin2", remove_config_entry_id="test_entry"
+        )
+        assert coordinator.known_vins == {"VIN1"}
+        assert "VIN2" not in coordinator.capabilities
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_refreshes_vehicle_list_on_its_own_cadence():
+    first, second = MockVehicle("VIN1"), MockVehicle("VIN2")
+    for vehicle in (first, second):
+        vehicle.get_status.return_value = {}
+        vehicle.get_charging_limit.return_value = {}
+    first.data = {"plateNo": "AB123"}
+    renamed = MockVehicle("VIN1")
+    renamed.get_status.return_value = {}
+    renamed.get_charging_limit.return_value = {}
+    renamed.data = {"plateNo": "AB123", "displayOSVersion": "5.1"}
+    client = MockClient([first])
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    device_registry = MagicMock()
+    device_registry.async_get_device.return_value = MagicMock(id="device_vin1")
+    try:
+        with patch("custom_components.zeekr_ev.coordinator.time.monotonic", return_value=1000.0):
+            assert set(await coordinator._async_update_data()) == {"VIN1"}
+            client.get_vehicle_list.return_value = [renamed, second]
+            # Not due yet
+            assert set(await coordinator._async_update_data()) == {"VIN1"}
+        client.get_vehicle_list.assert_called_once()
+
+        with patch(
+            "custom_components.zeekr_ev.coordinator.time.monotonic",
+            return_value=1000.0 + VEHICLE_LIST_INTERVAL,
+        ), patch("custom_components.zeekr_ev.coordinator.dr.async_get", return_value=device_registry):
+            assert set(await coordinator._async_update_data()) == {"VIN1", "VIN2"}
+
+        assert coordinator.get_vehicle_by_vin("VIN1") is renamed
+        device_registry.async_update_device.assert_called_once_with(
+            "device_vin1", model="AB123 (OS Version 5.1)"
+        )
+
+        # The vehicle list is the source of truth for removals
+        client.get_vehicle_list.return_value = [second]
+        coordinator._vehicle_list_fetched = None
+        assert set(await coordinator._async_update_data()) == {"VIN2"}
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_keeps_vehicle_list_when_refresh_fails():
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.return_value = {}
+    vehicle.get_charging_limit.return_value = {}
+    client = MockClient([vehicle])
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        await coordinator._async_update_data()
+
+        client.get_vehicle_list.side_effect = Exception("API down")
+        coordinator._vehicle_list_fetched = None
+        assert set(await coordinator._async_update_data()) == {"VIN1"}
+
+        client.get_vehicle_list.side_effect = None
+        client.get_vehicle_list.return_value = []
+        coordinator._vehicle_list_fetched = None
+        assert set(await coordinator._async_update_data()) == {"VIN1"}
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_skips_endpoints_of_unsupported_capabilities():
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_remote_control_state.return_value = {}
+    vehicle.get_status.return_value = {}
+    vehicle.get_charging_limit.return_value = {}
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        # Probed until PROBE_POLLS responses lacked the data
+        for _ in range(PROBE_POLLS):
+            await coordinator._async_update_data()
+        assert vehicle.get_charging_limit.call_count == PROBE_POLLS
+        assert not coordinator.supports("VIN1", CAPABILITY_CHARGING_LIMIT)
+        assert not coordinator.supports("VIN1", CAPABILITY_SENTRY_MODE)
+
+        await coordinator._async_update_data()
+        assert vehicle.get_charging_limit.call_count == PROBE_POLLS
+        assert vehicle.get_remote_control_state.call_count == PROBE_POLLS
+
+        # An override brings the endpoint back
+        coordinator.capability_profile.async_set_override("VIN1", CAPABILITY_CHARGING_LIMIT, True)
+        await coordinator._async_update_data()
+        assert vehicle.get_charging_limit.call_count == PROBE_POLLS + 1
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_failed_endpoints_do_not_rule_out_capabilities():
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_remote_control_state.side_effect = Exception("Gateway error")
+    vehicle.get_status.return_value = {}
+    vehicle.get_charging_limit.side_effect = Exception("Gateway error")
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        for _ in range(PROBE_POLLS + 1):
+            assert "VIN1" in await coordinator._async_update_data()
+        assert vehicle.get_charging_limit.call_count == PROBE_POLLS + 1
+        assert coordinator.supports("VIN1", CAPABILITY_CHARGING_LIMIT)
+        assert coordinator.supports("VIN1", CAPABILITY_SENTRY_MODE)
     finally:
         if coordinator._unsub_reset:
             coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_skips_endpoints_of_disabled_entities():
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_remote_control_state.return_value = {"vstdModeState": "0"}
+    vehicle.get_status.return_value = {}
+    vehicle.get_charging_limit.return_value = {}
+    hass = DummyHass()
+    hass.bus = MagicMock()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    disabled = SimpleNamespace(unique_id="VIN1_charging_limit", disabled_by="user")
+    try:
+        with patch("custom_components.zeekr_ev.coordinator.er.async_get"), patch(
+            "custom_components.zeekr_ev.coordinator.er.async_entries_for_config_entry",
+            return_value=[disabled],
+        ) as entries:
+            coordinator.async_setup_fetch_plan()
+            registry_updated = hass.bus.async_listen.call_args[0][1]
+
+            # Other registry changes do not rebuild the plan
+            registry_updated(SimpleNamespace(data={"action": "update", "changes": {"name": None}}))
+            assert entries.call_count == 1
+
+        for _ in range(PROBE_POLLS + 1):
+            await coordinator._async_update_data()
+        vehicle.get_charging_limit.assert_not_called()
+        assert vehicle.get_remote_control_state.call_count == PROBE_POLLS + 1
+        # Skipped data is not mistaken for a missing capability
+        assert coordinator.supports("VIN1", CAPABILITY_CHARGING_LIMIT)
+        assert coordinator.fetch_plan.skipped_calls == PROBE_POLLS + 1
+
+        # Enabling the entity brings the endpoint back
+        disabled.disabled_by = None
+        with patch("custom_components.zeekr_ev.coordinator.er.async_get"), patch(
+            "custom_components.zeekr_ev.coordinator.er.async_entries_for_config_entry",
+            return_value=[disabled],
+        ):
+            registry_updated(
+                SimpleNamespace(data={"action": "update", "changes": {"disabled_by": "user"}})
+            )
+        await coordinator._async_update_data()
+        vehicle.get_charging_limit.assert_called_once()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_fetches_endpoints_a_follower_uses():
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_remote_control_state.return_value = {"vstdModeState": "0"}
+    vehicle.get_status.return_value = {"updateTime": "1714564800000"}
+    vehicle.get_charging_limit.return_value = {}
+    hass = DummyHass()
+    hass.bus = MagicMock()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        source = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+        follower = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    for coordinator in (source, follower):
+        coordinator._listeners = {}
+        coordinator._unsub_refresh = None
+        coordinator._debounced_refresh = MagicMock()
+        coordinator.last_update_success = True
+        coordinator.last_exception = None
+    source.request_stats = MagicMock()
+    source.request_stats.async_inc_request = AsyncMock()
+
+    # The source's entry disabled the charging limit, the follower's did not
+    registries = {
+        source: [SimpleNamespace(unique_id="VIN1_charging_limit", disabled_by="user")],
+        follower: [SimpleNamespace(unique_id="VIN1_charging_limit", disabled_by=None)],
+    }
+    try:
+        for coordinator, entries in registries.items():
+            with patch("custom_components.zeekr_ev.coordinator.er.async_get"), patch(
+                "custom_components.zeekr_ev.coordinator.er.async_entries_for_config_entry",
+                return_value=entries,
+            ):
+                coordinator.async_setup_fetch_plan()
+        with patch.object(ZeekrCoordinator, "_schedule_refresh"):
+            follower.async_follow(source)
+
+            source.data = await source._async_update_data()
+            vehicle.get_charging_limit.assert_called_once()
+            # The unchanged-status path keeps fetching it too
+            source.data = await source._async_update_data()
+            assert source.unchanged_polls == 1
+            assert vehicle.get_charging_limit.call_count == 2
+
+            # Once the follower leaves, only the source's plan counts
+            follower.async_follow(None)
+            await source._async_update_data()
+        assert vehicle.get_charging_limit.call_count == 2
+    finally:
+        for coordinator in (source, follower):
+            if coordinator._unsub_reset:
+                coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_reuses_snapshot_of_unchanged_status():
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_remote_control_state.return_value = {"vstdModeState": "0"}
+    vehicle.get_status.return_value = {
+        "updateTime": "1714564800000",
+        "additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "1"}},
+    }
+    vehicle.get_charging_status.return_value = {"chargePower": "7.2"}
+    vehicle.get_charging_limit.return_value = {"soc": "800"}
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        coordinator.data = await coordinator._async_update_data()
+        first = coordinator.data["VIN1"]
+        assert first.charge_power == 7.2
+
+        # Same update time: the status fields are reused, the rest is fetched again
+        vehicle.get_charging_status.return_value = {"chargePower": "11.0"}
+        vehicle.get_remote_control_state.return_value = {"vstdModeState": "1"}
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.unchanged_polls == 1
+        assert coordinator.data["VIN1"].charge_power == 11.0
+        assert coordinator.data["VIN1"].charging_limit == 80.0
+        assert coordinator.data["VIN1"].sentry_mode is True
+        assert vehicle.get_charging_limit.call_count == 2
+        assert vehicle.get_remote_control_state.call_count == 2
+        assert vehicle.get_charging_status.call_count == 2
+
+        # Skipping the charging status too keeps the very same snapshot
+        coordinator.skip_unchanged_charging = True
+        previous = coordinator.data["VIN1"]
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.data["VIN1"] is previous
+        assert vehicle.get_charging_status.call_count == 2
+        assert vehicle.get_charging_limit.call_count == 3
+
+        # A new update time is processed in full
+        vehicle.get_status.return_value["updateTime"] = "1714564860000"
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.unchanged_polls == 2
+        assert vehicle.get_charging_limit.call_count == 4
+        assert vehicle.get_charging_status.call_count == 3
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_polls_commanded_vehicle_first_in_command_lane():
+    vehicles = [MockVehicle("VIN1"), MockVehicle("VIN2")]
+    polled = []
+    for vehicle in vehicles:
+        vehicle.get_status.side_effect = lambda vin=vehicle.vin: polled.append(vin) or {}
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient(vehicles), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+    lanes = coordinator.scheduler.lane_waits
+
+    try:
+        await coordinator._async_update_data()
+        assert polled == ["VIN1", "VIN2"]
+        assert lanes[LANE_COMMAND].calls == 0
+
+        coordinator.commanded_at["VIN2"] = time.monotonic()
+        polled.clear()
+        await coordinator._async_update_data()
+        assert polled == ["VIN2", "VIN1"]
+        assert lanes[LANE_COMMAND].calls > 0
+
+        # A command outside the window is polled like any other vehicle
+        coordinator.commanded_at["VIN2"] -= COMMAND_CONFIRM_WINDOW
+        polled.clear()
+        commands = lanes[LANE_COMMAND].calls
+        await coordinator._async_update_data()
+        assert polled == ["VIN1", "VIN2"]
+        assert lanes[LANE_COMMAND].calls == commands
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_abandons_late_calls():
+    vehicles = [MockVehicle("VIN1"), MockVehicle("VIN2")]
+    for vehicle in vehicles:
+        vehicle.get_status.return_value = {}
+    hass = DummyHass()
+    hanging = set()
+
+    async def executor_job(func, *args):
+        if func in hanging:
+            await asyncio.sleep(1)
+        return func(*args)
+
+    hass.async_add_executor_job = executor_job
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient(vehicles), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+    coordinator.api_timeout = 0.1
+
+    try:
+        coordinator.data = await coordinator._async_update_data()
+        first = coordinator.data["VIN1"]
+
+        # VIN1 hangs: the update completes and VIN1 keeps its snapshot
+        hanging.add(vehicles[0].get_status)
+        coordinator.data = await coordinator._async_update_data()
+        assert coordinator.data["VIN1"] is first
+        assert "VIN2" in coordinator.data
+        coordinator.request_stats.record_timeout.assert_called_once_with("get_status")
+
+        # Nothing answered at all: the update fails
+        coordinator.vehicles.pop("VIN2")
+        with pytest.raises(UpdateFailed, match="get_status timed out"):
+            await coordinator._async_update_data()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_command_deadline():
+    vehicle = MockVehicle("VIN1")
+    vehicle.do_remote_control = MagicMock(return_value=True)
+    hass = DummyHass()
+    finish = asyncio.Event()
+
+    async def executor_job(func, *args):
+        await finish.wait()
+
+    hass.async_add_executor_job = executor_job
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_invoke = AsyncMock()
+    coordinator.command_timeout = 0.01
+    scheduler = coordinator.scheduler
+
+    try:
+        with pytest.raises(HomeAssistantError, match="timed out"):
+            await coordinator.async_remote_control(vehicle, "start", "ZAF", {})
+        coordinator.request_stats.record_timeout.assert_called_once_with(
+            "do_remote_control ZAF"
+        )
+        # The scheduler saw the timeout
+        assert scheduler.calls.limit == INITIAL_CONCURRENT_CALLS // 2
+
+        # The slot is held while the executor thread still runs
+        assert scheduler.calls.active == 1
+        finish.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert scheduler.calls.active == 0
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_finishes_command_profile_after_slot():
+    vehicle = MockVehicle("VIN1")
+    vehicle.do_remote_control = MagicMock(return_value=True)
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_invoke = AsyncMock()
+    active_at_finish = []
+
+    async def finish():
+        active_at_finish.append(coordinator.scheduler.calls.active)
+
+    session = MagicMock(wrap=lambda func: func, async_finish=finish)
+    coordinator.profiler.start = MagicMock(return_value=session)
+
+    try:
+        assert await coordinator.async_remote_control(vehicle, "start", "ZAF", {})
+        # Writing the profile does not hold up the account's next call
+        assert active_at_finish == [0]
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_times_next_poll_at_its_slot():
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([]), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        with patch.object(
+            coordinator.scheduler, "next_poll", side_effect=lambda entry_id, interval, now: now + 450
+        ) as next_poll:
+            await coordinator._async_update_data()
+        assert next_poll.call_args[0][:2] == (coordinator.entry.entry_id, 3600)
+        assert coordinator.update_interval.total_seconds() == pytest.approx(450)
+        assert coordinator.polling_interval == timedelta(minutes=60)
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_applies_options_in_place():
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([]), DummyConfig())
+    coordinator.raw_retention = True
+    coordinator.raw_data = {"VIN1": {"updateTime": "1"}}
+
+    try:
+        listener = MagicMock()
+        coordinator._listeners = {object(): (listener, None)}
+        hass.async_create_task = MagicMock(side_effect=lambda coro: coro.close())
+        coordinator.async_request_refresh = MagicMock()
+        coordinator.async_apply_options(
+            {"polling_interval": 10, "debug_watchdog": True, "skip_unchanged_charging": True}
+        )
+
+        assert coordinator.update_interval == timedelta(minutes=10)
+        # Polling now moves the next polls to the new interval
+        coordinator.async_request_refresh.assert_called_once()
+        hass.async_create_task.assert_called_once()
+        assert coordinator.raw_data == {}
+        assert coordinator.watchdog.enabled
+        assert coordinator.skip_unchanged_charging
+        assert coordinator.entry_data["polling_interval"] == 10
+        listener.assert_called_once()
+
+        # An unchanged interval keeps the scheduled poll
+        coordinator.async_apply_options({"polling_interval": 10})
+        coordinator.async_request_refresh.assert_called_once()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+class AuthException(Exception):
+    """Stand-in for the zeekr_ev_api authentication error."""
+
+
+@pytest.mark.asyncio
+async def test_coordinator_auth_error_starts_reauth():
+    vehicle = MockVehicle("VIN1")
+    vehicle.get_status.side_effect = AuthException("Token expired (retry failed)")
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+
+    try:
+        with pytest.raises(ConfigEntryAuthFailed):
+            await coordinator._async_update_data()
+
+        vehicle.get_status.side_effect = RuntimeError("timeout")
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_reauthenticates_live_client():
+    hass = DummyHass()
+    client = MockClient([])
+    client.password = "old"
+    client.login = MagicMock(side_effect=AuthException("Login failed"))
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        coordinator = ZeekrCoordinator(hass, client, DummyConfig())
+    coordinator.request_stats = MagicMock()
+    coordinator.request_stats.async_inc_request = AsyncMock()
+    coordinator.async_request_refresh = AsyncMock()
+
+    try:
+        assert await coordinator.async_reauthenticate("wrong") is False
+        assert client.password == "old"
+        coordinator.async_request_refresh.assert_not_called()
+
+        client.login.side_effect = None
+        assert await coordinator.async_reauthenticate("new") is True
+        client.login.assert_called_with(True)
+        assert client.password == "new"
+        assert coordinator.entry_data["password"] == "new"
+        coordinator.async_request_refresh.assert_awaited_once()
+    finally:
+        if coordinator._unsub_reset:
+            coordinator._unsub_reset()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_follows_source_of_same_account():
+    vehicle = MockVehicle("VIN1")
+    hass = DummyHass()
+
+    with patch("homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__", side_effect=mock_data_update_coordinator_init, autospec=True):
+        source = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+        follower = ZeekrCoordinator(hass, MockClient([vehicle]), DummyConfig())
+    for coordinator in (source, follower):
+        coordinator._listeners = {}
+        coordinator._unsub_refresh = None
+        coordinator._debounced_refresh = MagicMock()
+        coordinator.last_update_success = True
+        coordinator.last_exception = None
+    source.vehicles = {"VIN1": vehicle}
+    source.data = {"VIN1": VehicleSnapshot(battery_level=80.0)}
+    source.async_request_refresh = AsyncMock()
+
+    try:
+        with patch.object(ZeekrCoordinator, "_schedule_refresh"):
+            follower.async_follow(source)
+            assert follower.update_interval is None
+            assert follower.data is source.data
+            assert follower.vehicles is source.vehicles
+            assert follower.capability_profile is source.capability_profile
+
+            # Polls of the source are passed on
+            source.data = {"VIN1": VehicleSnapshot(battery_level=79.0)}
+            source.async_update_listeners()
+            assert follower.data is source.data
+            assert await follower._async_update_data() is source.data
+
+            source.last_update_success = False
+            source.async_update_listeners()
+            assert not follower.last_update_success
+
+            await follower.async_request_refresh()
+            source.async_request_refresh.assert_awaited_once()
+
+            # The source polls, so it confirms the follower's commands
+            vehicle.do_remote_control = MagicMock(return_value=True)
+            follower.request_stats = MagicMock()
+            follower.request_stats.async_inc_invoke = AsyncMock()
+            await follower.async_remote_control(vehicle, "start", "ZAF", {})
+            assert source.commanded_at["VIN1"] == follower.commanded_at["VIN1"]
+
+            follower.async_follow(None)
+            assert source._listeners == {}
+            assert follower.polling_interval == timedelta(minutes=60)
+            assert follower.capability_profile is not source.capability_profile
+    finally:
+        for coordinator in (source, follower):
+            if coordinator._unsub_reset:
+                coordinator._unsub_reset()
@@ -1,7 +1,15 @@
 from unittest.mock import MagicMock, AsyncMock
 import pytest
-from custom_components.zeekr_ev.cover import ZeekrSunshade, ZeekrWindows, ZeekrWindow, async_setup_entry
+from custom_components.zeekr_ev.cover import (
+    WINDOW_DESCRIPTIONS,
+    ZeekrSunshade,
+    ZeekrWindow,
+    ZeekrWindows,
+    async_setup_entry,
+)
 from custom_components.zeekr_ev.const import DOMAIN
+from custom_components.zeekr_ev.optimistic import OptimisticOverlay
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot
 
 
 class MockVehicle:
@@ -14,15 +22,34 @@ class MockVehicle:
 
 class MockCoordinator:
     def __init__(self, data):
-        self.data = data
+        self.data = {vin: VehicleSnapshot.from_status(raw) for vin, raw in data.items()}
+        self.generation = 0
+        self.value_cache_hits = 0
+        self.value_cache_misses = 0
+        self.overlay = OptimisticOverlay()
+        self.compact_mode = False
         self.vehicles = {}
         self.seat_duration = 15
         self.ac_duration = 15
         self.async_inc_invoke = AsyncMock()
 
+    def supports(self, vin, capability):
+        return True
+
+    def get_snapshot(self, vin):
+        return self.overlay.apply(vin, self.data.get(vin))
+
+    def async_set_optimistic(self, vin, **fields):
+        self.overlay.set(vin, fields)
+        self.generation += 1
+
     def get_vehicle_by_vin(self, vin):
         return self.vehicles.get(vin)
 
+    async def async_remote_control(self, vehicle, command, service_id, setting):
+        await self.async_inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
+
     def inc_invoke(self):
         pass
 
@@ -54,17 +81,17 @@ async def test_sunshade_optimistic_update(hass):
     # Test open
     await sunshade.async_open_cover()
 
-    climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
-    assert climate_status["curtainOpenStatus"] == "2"
-    assert climate_status["curtainPos"] == 100
+    assert coordinator.get_snapshot(vin).sunshade_closed is False
+    assert coordinator.get_snapshot(vin).sunshade_position == 100
+    assert sunshade.is_closed is False
     sunshade.async_write_ha_state.assert_called()
 
     # Test close
     await sunshade.async_close_cover()
 
-    climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
-    assert climate_status["curtainOpenStatus"] == "1"
-    assert climate_status["curtainPos"] == 0
+    assert coordinator.get_snapshot(vin).sunshade_closed is True
+    assert coordinator.get_snapshot(vin).sunshade_position == 0
+    assert sunshade.is_closed is True
     sunshade.async_write_ha_state.assert_called()
 
 
@@ -116,6 +143,29 @@ async def test_cover_async_setup_entry(hass, mock_config_entry):
     assert isinstance(entities[0], ZeekrSunshade)
     assert isinstance(entities[1], ZeekrWindows)
     assert isinstance(entities[2], ZeekrWindow)
+    assert entities[2].entity_registry_enabled_default is True
+
+
+@pytest.mark.asyncio
+async def test_cover_async_setup_entry_compact_mode(hass, mock_config_entry):
+    coordinator = MockCoordinator(
+        {"VIN1": {"additionalVehicleStatus": {"climateStatus": {"winPosDriver": "30"}}}}
+    )
+    coordinator.compact_mode = True
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: coordinator}
+
+    async_add_entities = MagicMock()
+
+    await async_setup_entry(hass, mock_config_entry, async_add_entities)
+
+    entities = async_add_entities.call_args[0][0]
+    # Individual windows are still created but disabled by default
+    assert all(
+        not entity.entity_registry_enabled_default
+        for entity in entities
+        if isinstance(entity, ZeekrWindow)
+    )
+    assert entities[1].extra_state_attributes["position_driver"] == 30
 
 
 @pytest.mark.asyncio
@@ -148,9 +198,8 @@ async def test_windows_optimistic_update(hass):
     # Test Open
     await windows.async_open_cover()
 
-    climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
-    assert climate_status["winStatusDriver"] == "1"
-    assert climate_status["winPosDriver"] == 100
+    assert coordinator.get_snapshot(vin).window_closed_driver is False
+    assert coordinator.get_snapshot(vin).window_position_driver == 100
     assert windows.is_closed is False
     assert windows.current_cover_position == 100
     windows.async_write_ha_state.assert_called()
@@ -158,9 +207,8 @@ async def test_windows_optimistic_update(hass):
     # Test Close
     await windows.async_close_cover()
 
-    climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
-    assert climate_status["winStatusDriver"] == "2"
-    assert climate_status["winPosDriver"] == 0
+    assert coordinator.get_snapshot(vin).window_closed_driver is True
+    assert coordinator.get_snapshot(vin).window_position_driver == 0
     assert windows.is_closed is True
     assert windows.current_cover_position == 0
     windows.async_write_ha_state.assert_called()
@@ -206,15 +254,17 @@ async def test_zeekr_window_readonly(hass):
     }
 
     coordinator = MockCoordinator(initial_data)
-    window = ZeekrWindow(coordinator, vin, "Driver", "Window Driver")
+    window = ZeekrWindow(coordinator, vin, WINDOW_DESCRIPTIONS[0])
+    assert window.unique_id == "VIN1_window_driver"
 
     # Check properties
     assert window.is_closed is True
     assert window.current_cover_position == 0
 
     # Change data
-    coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]["winStatusDriver"] = "1"
-    coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]["winPosDriver"] = 50
+    coordinator.data[vin].window_closed_driver = False
+    coordinator.data[vin].window_position_driver = 50
+    coordinator.generation += 1  # as if polled
 
     assert window.is_closed is False
     assert window.current_cover_position == 50
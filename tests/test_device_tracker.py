@@ -1,9 +1,13 @@
 from custom_components.zeekr_ev.device_tracker import ZeekrDeviceTracker
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot
 
 
 class DummyCoordinator:
     def __init__(self, data):
-        self.data = data
+        self.data = {vin: VehicleSnapshot.from_status(raw) for vin, raw in data.items()}
+
+    def get_snapshot(self, vin):
+        return self.data.get(vin)
 
 
 def test_latitude_longitude_parsing():
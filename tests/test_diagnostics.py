@@ -0,0 +1,139 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+import pytest
+from custom_components.zeekr_ev.const import DOMAIN
+from custom_components.zeekr_ev.diagnostics import (
+    async_get_config_entry_diagnostics,
+    async_get_device_diagnostics,
+)
+from custom_components.zeekr_ev.capabilities import ZeekrCapabilities
+from custom_components.zeekr_ev.fetch_plan import FetchPlan
+from custom_components.zeekr_ev.optimistic import OptimisticOverlay
+from custom_components.zeekr_ev.scheduler import ZeekrScheduler
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot
+from custom_components.zeekr_ev.watchdog import ZeekrWatchdog
+
+
+class MockStats:
+    def as_dict(self):
+        return {"api_requests_today": 3}
+
+    def latency_as_dict(self):
+        return {"get_status": {"count": 1, "sum": 0.5, "buckets": {}}}
+
+    timeouts = {"get_status": 1}
+
+
+class MockVehicle:
+    def __init__(self, vin):
+        self.vin = vin
+        self.data = {"vin": vin, "plateNo": "ABC123", "displayOSVersion": "1.0"}
+
+
+class MockCoordinator:
+    def __init__(self, data, raw_retention=True):
+        self.raw_data = dict(data) if raw_retention else {}
+        self.data = {vin: VehicleSnapshot.from_status(raw) for vin, raw in data.items()}
+        self.generation = 0
+        self.value_cache_hits = 0
+        self.value_cache_misses = 0
+        self.unchanged_polls = 0
+        self.source = None
+        self.scheduler = ZeekrScheduler()
+        self.overlay = OptimisticOverlay()
+        self.vehicles = {vin: MockVehicle(vin) for vin in data}
+        self.capability_profile = ZeekrCapabilities(MagicMock(), "test_entry")
+        self.fetch_plan = FetchPlan()
+        self.client = MagicMock(logged_in=True, auth_token="secret", bearer_token="secret")
+        self.client.get_vehicle_list = MagicMock()
+        self.polling_interval = timedelta(minutes=5)
+        self.last_update_success = True
+        self.last_exception = None
+        self.latest_poll_time = None
+        self.seat_duration = 15
+        self.ac_duration = 15
+        self.steering_wheel_duration = 15
+        self.request_stats = MockStats()
+        self.watchdog = ZeekrWatchdog()
+
+    def get_vehicle_by_vin(self, vin):
+        return self.vehicles.get(vin)
+
+
+class MockEntry:
+    def __init__(self):
+        self.entry_id = "test_entry_id"
+        self.data = {"username": "user@example.com", "password": "hunter2", "polling_interval": 5}
+
+
+@pytest.mark.asyncio
+async def test_config_entry_diagnostics_redacts(hass):
+    vin = "VIN00000000001234"
+    data = {vin: {"basicVehicleStatus": {"position": {"latitude": "1.0", "longitude": "2.0"}}}}
+    coordinator = MockCoordinator(data)
+    entry = MockEntry()
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    coordinator.fetch_plan.skipped = {vin: {"get_charging_limit"}}
+
+    diag = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diag["entry"]["password"] == "**REDACTED**"
+    assert diag["entry"]["polling_interval"] == 5
+    assert diag["client"]["has_auth_token"] is True
+    assert "secret" not in str(diag)
+    assert diag["coordinator"]["update_interval"] == 300
+    assert diag["coordinator"]["value_cache"]["hit_rate"] is None
+    assert diag["coordinator"]["unchanged_polls"] == 0
+    assert diag["coordinator"]["follows_entry"] is None
+    assert diag["scheduler"]["call_limit"] == 4
+    assert diag["coordinator"]["fetch_plan"]["skipped"] == {
+        "**REDACTED**1234": ["get_charging_limit"]
+    }
+    # One skipped endpoint every 5 minutes
+    assert diag["coordinator"]["fetch_plan"]["saved_requests_per_day"] == 288
+    assert diag["request_stats"]["latency"]["get_status"]["count"] == 1
+
+    vehicle = diag["vehicles"]["**REDACTED**1234"]
+    assert vehicle["vehicle"]["plateNo"] == "**REDACTED**"
+    assert vehicle["data"]["basicVehicleStatus"]["position"]["latitude"] == "**REDACTED**"
+    assert vehicle["snapshot"]["latitude"] == "**REDACTED**"
+    # Building diagnostics must never hit the API
+    coordinator.client.get_vehicle_list.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_device_diagnostics(hass):
+    vin = "VIN1"
+    coordinator = MockCoordinator({vin: {"chargingLimit": {"soc": "800"}}})
+    entry = MockEntry()
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    device = MagicMock(identifiers={(DOMAIN, vin)})
+
+    coordinator.overlay.set(vin, {"charging_limit": 90.0})
+    coordinator.capability_profile.overrides[vin] = {"sunshade": False}
+
+    diag = await async_get_device_diagnostics(hass, entry, device)
+
+    assert diag["vehicle"]["data"]["chargingLimit"]["soc"] == "800"
+    assert diag["vehicle"]["optimistic"] == {"charging_limit": 90.0}
+    assert diag["vehicle"]["snapshot"]["charging_limit"] == 80.0
+    assert "sunshade" not in diag["vehicle"]["capabilities"]["supported"]
+    assert diag["vehicle"]["capabilities"]["overrides"] == {"sunshade": False}
+
+    api_device = MagicMock(identifiers={(DOMAIN, entry.entry_id)})
+    diag = await async_get_device_diagnostics(hass, entry, api_device)
+    assert "vehicle" not in diag
+
+
+@pytest.mark.asyncio
+async def test_device_diagnostics_without_raw_retention(hass):
+    vin = "VIN1"
+    coordinator = MockCoordinator({vin: {"chargingLimit": {"soc": "800"}}}, raw_retention=False)
+    entry = MockEntry()
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    device = MagicMock(identifiers={(DOMAIN, vin)})
+
+    diag = await async_get_device_diagnostics(hass, entry, device)
+
+    assert "data" not in diag["vehicle"]
+    assert diag["vehicle"]["snapshot"]["charging_limit"] == 80.0
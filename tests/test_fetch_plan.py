@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from homeassistant.helpers.entity_registry import RegistryEntryDisabler
+
+from custom_components.zeekr_ev.fetch_plan import FetchPlan
+
+
+def _entry(unique_id, disabled=False):
+    return SimpleNamespace(
+        unique_id=unique_id,
+        disabled_by=RegistryEntryDisabler.USER if disabled else None,
+    )
+
+
+def test_endpoint_skipped_when_all_consumers_disabled():
+    plan = FetchPlan()
+    plan.rebuild(
+        [
+            _entry("VIN1_charging_limit", disabled=True),
+            _entry("VIN1_sentry_mode"),
+            _entry("VIN1_battery_level", disabled=True),
+            _entry("VIN2_charging_limit"),
+        ]
+    )
+
+    assert plan.skipped == {"VIN1": {"get_charging_limit"}}
+    assert not plan.fetches("VIN1", "get_charging_limit")
+    assert plan.fetches("VIN1", "get_remote_control_state")
+    assert plan.fetches("VIN2", "get_charging_limit")
+    # Vehicles without registered entities yet are fetched
+    assert plan.fetches("VIN3", "get_charging_limit")
+    assert plan.skipped_calls == 1
+
+
+def test_plan_rebuilt_when_entity_enabled():
+    plan = FetchPlan()
+    plan.rebuild([_entry("VIN1_sentry_mode", disabled=True)])
+    assert not plan.fetches("VIN1", "get_remote_control_state")
+
+    plan.rebuild([_entry("VIN1_sentry_mode")])
+    assert plan.fetches("VIN1", "get_remote_control_state")
+    assert plan.as_dict(polls_per_day=288) == {
+        "skipped": {},
+        "skipped_calls": 1,
+        "saved_requests_per_day": 0,
+    }
+
+
+def test_endpoint_fetched_while_a_follower_uses_it():
+    plan = FetchPlan()
+    plan.rebuild([_entry("VIN1_charging_limit", disabled=True)])
+    follower = FetchPlan()
+    follower.rebuild([_entry("VIN1_charging_limit")])
+    plan.followers.add(follower)
+
+    assert plan.fetches("VIN1", "get_charging_limit")
+    assert plan.as_dict(polls_per_day=288)["skipped"] == {}
+
+    follower.rebuild([_entry("VIN1_charging_limit", disabled=True)])
+    assert not plan.fetches("VIN1", "get_charging_limit")
+    assert plan.as_dict(polls_per_day=288)["skipped"] == {"VIN1": ["get_charging_limit"]}
@@ -1,5 +1,16 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
-from custom_components.zeekr_ev import async_setup_entry
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from custom_components.zeekr_ev import (
+    async_remove_config_entry_device,
+    async_setup_entry,
+    async_update_options,
+)
+from custom_components.zeekr_ev.const import DOMAIN
 
 
 class DummyEntry:
@@ -16,3 +27,65 @@ async def test_async_setup_entry_missing_credentials(hass):
     entry = DummyEntry(data={})
     res = await async_setup_entry(hass, entry)
     assert res is False
+
+
+@pytest.mark.asyncio
+async def test_setup_login_has_a_deadline(hass):
+    entry = DummyEntry(data={"username": "user", "password": "secret", "api_timeout": 0.01})
+    client = MagicMock(logged_in=False)
+
+    async def executor_job(func, *args):
+        if func is client.login:
+            await asyncio.sleep(1)
+        return func(*args)
+
+    hass.async_add_executor_job = executor_job
+    with patch(
+        "custom_components.zeekr_ev.get_zeekr_client_class",
+        return_value=MagicMock(return_value=client),
+    ), patch("custom_components.zeekr_ev.ZeekrRequestStats") as stats:
+        stats.return_value.async_load = AsyncMock()
+        stats.return_value.async_inc_request = AsyncMock()
+        with pytest.raises(ConfigEntryNotReady):
+            await async_setup_entry(hass, entry)
+
+
+@pytest.mark.asyncio
+async def test_remove_device_only_when_vehicle_is_gone(hass):
+    entry = DummyEntry()
+    hass.data[DOMAIN] = {entry.entry_id: SimpleNamespace(data={"VIN1": object()})}
+
+    current = SimpleNamespace(identifiers={(DOMAIN, "VIN1")})
+    gone = SimpleNamespace(identifiers={(DOMAIN, "VIN2")})
+    assert await async_remove_config_entry_device(hass, entry, current) is False
+    assert await async_remove_config_entry_device(hass, entry, gone) is True
+
+
+@pytest.mark.asyncio
+async def test_options_applied_without_reload(hass):
+    entry = DummyEntry(data={"username": "user", "polling_interval": 10})
+    coordinator = MagicMock(entry_data={"username": "user", "polling_interval": 5})
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    hass.config_entries.async_reload = AsyncMock()
+
+    await async_update_options(hass, entry)
+    coordinator.async_apply_options.assert_called_once_with(entry.data)
+    hass.config_entries.async_reload.assert_not_called()
+
+    # A missing option is the same as its default
+    coordinator.entry_data = {"username": "user"}
+    entry.data = {"username": "user", "use_local_api": False, "vin_iv": ""}
+    await async_update_options(hass, entry)
+    hass.config_entries.async_reload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_new_credentials_reload_entry(hass):
+    entry = DummyEntry(data={"username": "other", "polling_interval": 5})
+    coordinator = MagicMock(entry_data={"username": "user", "polling_interval": 5})
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+    hass.config_entries.async_reload = AsyncMock()
+
+    await async_update_options(hass, entry)
+    hass.config_entries.async_reload.assert_awaited_once_with(entry.entry_id)
+    coordinator.async_apply_options.assert_not_called()
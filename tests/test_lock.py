@@ -1,7 +1,9 @@
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 import pytest
-from custom_components.zeekr_ev.lock import ZeekrLock, async_setup_entry
+from custom_components.zeekr_ev.lock import LOCK_DESCRIPTIONS, ZeekrLock, async_setup_entry
 from custom_components.zeekr_ev.const import DOMAIN
+from custom_components.zeekr_ev.optimistic import OptimisticOverlay
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot
 
 
 class MockVehicle:
@@ -14,13 +16,28 @@ class MockVehicle:
 
 class MockCoordinator:
     def __init__(self, data):
-        self.data = data
+        self.data = {vin: VehicleSnapshot.from_status(raw) for vin, raw in data.items()}
+        self.generation = 0
+        self.value_cache_hits = 0
+        self.value_cache_misses = 0
+        self.overlay = OptimisticOverlay()
         self.vehicles = {}
         self.async_inc_invoke = AsyncMock()
 
+    def get_snapshot(self, vin):
+        return self.overlay.apply(vin, self.data.get(vin))
+
+    def async_set_optimistic(self, vin, **fields):
+        self.overlay.set(vin, fields)
+        self.generation += 1
+
     def get_vehicle_by_vin(self, vin):
         return self.vehicles.get(vin)
 
+    async def async_remote_control(self, vehicle, command, service_id, setting):
+        await self.async_inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
+
     def inc_invoke(self):
         pass
 
@@ -52,39 +69,45 @@ class DummyHass:
 
 class DummyCoordinator:
     def __init__(self, data):
-        self.data = data
+        self.data = {vin: VehicleSnapshot.from_status(raw) for vin, raw in data.items()}
+        self.generation = 0
+        self.value_cache_hits = 0
+        self.value_cache_misses = 0
+
+    def get_snapshot(self, vin):
+        return self.data.get(vin)
 
 
 # Keeping existing tests...
 def test_is_locked_none_when_missing():
     data = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {}}}}
     coordinator = DummyCoordinator(data)
-    lk = ZeekrLock(coordinator, "VIN1", "doorLockStatusDriver", "Driver door lock", "drivingSafetyStatus")
+    lk = ZeekrLock(coordinator, "VIN1", LOCK_DESCRIPTIONS["doorLockStatusDriver"])
     assert lk.is_locked is None
 
 
 def test_is_locked_openstatus_logic():
     # For fields ending with OpenStatus: "1" -> open -> locked False
-    data_open = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {"trunkOpenStatus": "1"}}}}
+    data_open = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {"engineHoodOpenStatus": "1"}}}}
     coordinator = DummyCoordinator(data_open)
-    lk = ZeekrLock(coordinator, "VIN1", "trunkOpenStatus", "Trunk open", "drivingSafetyStatus")
+    lk = ZeekrLock(coordinator, "VIN1", LOCK_DESCRIPTIONS["engineHoodOpenStatus"])
     assert lk.is_locked is False
 
-    data_closed = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {"trunkOpenStatus": "0"}}}}
+    data_closed = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {"engineHoodOpenStatus": "0"}}}}
     coordinator = DummyCoordinator(data_closed)
-    lk = ZeekrLock(coordinator, "VIN1", "trunkOpenStatus", "Trunk open", "drivingSafetyStatus")
+    lk = ZeekrLock(coordinator, "VIN1", LOCK_DESCRIPTIONS["engineHoodOpenStatus"])
     assert lk.is_locked is True
 
 
 def test_is_locked_regular_field():
     data_locked = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {"doorLockStatusDriver": "1"}}}}
     coordinator = DummyCoordinator(data_locked)
-    lk = ZeekrLock(coordinator, "VIN1", "doorLockStatusDriver", "Driver door lock", "drivingSafetyStatus")
+    lk = ZeekrLock(coordinator, "VIN1", LOCK_DESCRIPTIONS["doorLockStatusDriver"])
     assert lk.is_locked is True
 
     data_unlocked = {"VIN1": {"additionalVehicleStatus": {"drivingSafetyStatus": {"doorLockStatusDriver": "0"}}}}
     coordinator = DummyCoordinator(data_unlocked)
-    lk = ZeekrLock(coordinator, "VIN1", "doorLockStatusDriver", "Driver door lock", "drivingSafetyStatus")
+    lk = ZeekrLock(coordinator, "VIN1", LOCK_DESCRIPTIONS["doorLockStatusDriver"])
     assert lk.is_locked is False
 
 
@@ -92,12 +115,12 @@ def test_is_locked_charge_lid_logic():
     # "1" = Open (Unlocked), "2" = Closed (Locked)
     data_open = {"VIN1": {"additionalVehicleStatus": {"electricVehicleStatus": {"chargeLidDcAcStatus": "1"}}}}
     coordinator = DummyCoordinator(data_open)
-    lk = ZeekrLock(coordinator, "VIN1", "chargeLidDcAcStatus", "Charge Lid", "electricVehicleStatus")
+    lk = ZeekrLock(coordinator, "VIN1", LOCK_DESCRIPTIONS["chargeLidDcAcStatus"])
     assert lk.is_locked is False
 
     data_closed = {"VIN1": {"additionalVehicleStatus": {"electricVehicleStatus": {"chargeLidDcAcStatus": "2"}}}}
     coordinator = DummyCoordinator(data_closed)
-    lk = ZeekrLock(coordinator, "VIN1", "chargeLidDcAcStatus", "Charge Lid", "electricVehicleStatus")
+    lk = ZeekrLock(coordinator, "VIN1", LOCK_DESCRIPTIONS["chargeLidDcAcStatus"])
     assert lk.is_locked is True
 
 
@@ -118,22 +141,24 @@ async def test_lock_optimistic_update_central_locking():
     coordinator = MockCoordinator(initial_data)
     coordinator.vehicles[vin] = MockVehicle(vin)
 
-    lock = ZeekrLock(coordinator, vin, "centralLockingStatus", "Central locking", "drivingSafetyStatus")
+    lock = ZeekrLock(coordinator, vin, LOCK_DESCRIPTIONS["centralLockingStatus"])
     lock.hass = DummyHass()
     lock.async_write_ha_state = MagicMock()
 
     # Test Lock
     await lock.async_lock()
 
-    status = coordinator.data[vin]["additionalVehicleStatus"]["drivingSafetyStatus"]
-    assert status["centralLockingStatus"] == "1"
+    assert coordinator.get_snapshot(vin).central_locked is True
+    assert lock.is_locked is True
+    # The fetched snapshot is never modified
+    assert coordinator.data[vin].central_locked is False
     lock.async_write_ha_state.assert_called()
 
     # Test Unlock
     await lock.async_unlock()
 
-    status = coordinator.data[vin]["additionalVehicleStatus"]["drivingSafetyStatus"]
-    assert status["centralLockingStatus"] == "0"
+    assert coordinator.get_snapshot(vin).central_locked is False
+    assert lock.is_locked is False
     lock.async_write_ha_state.assert_called()
 
 
@@ -153,29 +178,27 @@ async def test_lock_optimistic_update_charge_lid():
     coordinator = MockCoordinator(initial_data)
     coordinator.vehicles[vin] = MockVehicle(vin)
 
-    lock = ZeekrLock(coordinator, vin, "chargeLidDcAcStatus", "Charge Lid", "electricVehicleStatus")
+    lock = ZeekrLock(coordinator, vin, LOCK_DESCRIPTIONS["chargeLidDcAcStatus"])
     lock.hass = DummyHass()
     lock.async_write_ha_state = MagicMock()
 
     # Test Lock (Close)
     await lock.async_lock()
 
-    status = coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]
-    assert status["chargeLidDcAcStatus"] == "2"  # Closed/Locked
+    assert coordinator.get_snapshot(vin).charge_lid_closed is True  # Closed/Locked
     lock.async_write_ha_state.assert_called()
 
     # Test Unlock (Open)
     await lock.async_unlock()
 
-    status = coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]
-    assert status["chargeLidDcAcStatus"] == "1"  # Open/Unlocked
+    assert coordinator.get_snapshot(vin).charge_lid_closed is False  # Open/Unlocked
     lock.async_write_ha_state.assert_called()
 
 
 @pytest.mark.asyncio
 async def test_lock_no_vehicle(hass):
     coordinator = MockCoordinator({"VIN1": {}})
-    lock = ZeekrLock(coordinator, "VIN1", "centralLockingStatus", "Label", "drivingSafetyStatus")
+    lock = ZeekrLock(coordinator, "VIN1", LOCK_DESCRIPTIONS["centralLockingStatus"])
 
     # Should safely return
     await lock.async_lock()
@@ -185,7 +208,7 @@ async def test_lock_no_vehicle(hass):
 @pytest.mark.asyncio
 async def test_lock_device_info(hass):
     coordinator = MockCoordinator({"VIN1": {}})
-    lock = ZeekrLock(coordinator, "VIN1", "field", "Label", "cat")
+    lock = ZeekrLock(coordinator, "VIN1", LOCK_DESCRIPTIONS["centralLockingStatus"])
     assert lock.device_info["identifiers"] == {(DOMAIN, "VIN1")}
 
 
@@ -201,3 +224,22 @@ async def test_lock_async_setup_entry(hass, mock_config_entry):
     assert async_add_entities.called
     assert len(async_add_entities.call_args[0][0]) > 0
     assert isinstance(async_add_entities.call_args[0][0][0], ZeekrLock)
+
+
+@pytest.mark.asyncio
+async def test_lock_added_for_new_vehicle(hass, mock_config_entry):
+    coordinator = MockCoordinator({"VIN1": {}})
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: coordinator}
+    async_add_entities = MagicMock()
+
+    with patch("custom_components.zeekr_ev.entity.async_dispatcher_connect") as connect:
+        await async_setup_entry(hass, mock_config_entry, async_add_entities)
+
+    signal, add_vehicle = connect.call_args_list[0][0][1:]
+    assert signal == f"zeekr_ev_new_vehicle_{mock_config_entry.entry_id}"
+    assert connect.return_value in mock_config_entry.unload_callbacks
+
+    add_vehicle("VIN2")
+    added = async_add_entities.call_args[0][0]
+    assert {lock.vin for lock in added} == {"VIN2"}
+    assert len(added) == len(LOCK_DESCRIPTIONS)
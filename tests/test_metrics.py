@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock, patch
+import pytest
+from custom_components.zeekr_ev.metrics import render_metrics
+from custom_components.zeekr_ev.request_stats import ZeekrRequestStats
+from custom_components.zeekr_ev.watchdog import ZeekrWatchdog
+
+
+class MockEntry:
+    entry_id = "entry1"
+    data = {"metrics_endpoint": True}
+
+
+class MockCoordinator:
+    def __init__(self, stats):
+        self.entry = MockEntry()
+        self.request_stats = stats
+        self.watchdog = ZeekrWatchdog()
+        self.last_update_success = True
+        self.vin_updated_at = {"L6T7824Z5NE001234": 1000.0}
+
+
+@pytest.fixture
+def stats(hass):
+    with patch("custom_components.zeekr_ev.request_stats.Store", return_value=MagicMock()):
+        yield ZeekrRequestStats(hass)
+
+
+def test_render_metrics(stats):
+    stats.api_requests_total = 12
+    stats.api_invokes_today = 2
+    stats.record_latency("get_status", 0.1)
+    stats.record_latency("get_status", 2.0)
+    stats.record_timeout("get_status")
+
+    text = render_metrics([MockCoordinator(stats)], now=1030.0)
+    lines = text.splitlines()
+
+    assert 'zeekr_ev_api_requests_total{entry="entry1"} 12' in lines
+    assert 'zeekr_ev_api_invokes_today{entry="entry1"} 2' in lines
+    assert 'zeekr_ev_up{entry="entry1"} 1' in lines
+    # Buckets are cumulative
+    assert 'zeekr_ev_api_latency_seconds_bucket{entry="entry1",endpoint="get_status",le="0.25"} 1' in lines
+    assert 'zeekr_ev_api_latency_seconds_bucket{entry="entry1",endpoint="get_status",le="2.5"} 2' in lines
+    assert 'zeekr_ev_api_latency_seconds_bucket{entry="entry1",endpoint="get_status",le="+Inf"} 2' in lines
+    assert 'zeekr_ev_api_latency_seconds_count{entry="entry1",endpoint="get_status"} 2' in lines
+    assert 'zeekr_ev_api_timeouts_total{entry="entry1",endpoint="get_status"} 1' in lines
+    assert 'zeekr_ev_vehicle_data_age_seconds{entry="entry1",vin="**REDACTED**1234"} 30.0' in lines
+    assert "L6T7824Z5NE001234" not in text
+    assert lines[-1] == "# EOF"
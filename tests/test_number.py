@@ -1,6 +1,8 @@
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 import pytest
 from custom_components.zeekr_ev.number import ZeekrChargingLimitNumber, ZeekrConfigNumber
+from custom_components.zeekr_ev.optimistic import OptimisticOverlay
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot
 
 
 class MockVehicle:
@@ -12,17 +14,31 @@ class MockVehicle:
 class MockCoordinator:
     def __init__(self, vehicles):
         self.vehicles = vehicles
-        self.data = {v.vin: {} for v in vehicles}
+        self.data = {v.vin: VehicleSnapshot() for v in vehicles}
+        self.overlay = OptimisticOverlay()
         self.async_inc_invoke = AsyncMock()
         self.async_request_refresh = AsyncMock()
         self.seat_duration = 15
 
+    def supports(self, vin, capability):
+        return True
+
+    def get_snapshot(self, vin):
+        return self.overlay.apply(vin, self.data.get(vin))
+
+    def async_set_optimistic(self, vin, **fields):
+        self.overlay.set(vin, fields)
+
     def get_vehicle_by_vin(self, vin):
         for v in self.vehicles:
             if v.vin == vin:
                 return v
         return None
 
+    async def async_remote_control(self, vehicle, command, service_id, setting):
+        await self.async_inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
+
 
 class DummyConfig:
     def __init__(self):
@@ -51,8 +67,16 @@ async def test_charging_limit_number():
     number_entity.hass = DummyHass()
     number_entity.async_write_ha_state = MagicMock()
 
-    # Test setting value 80%
-    await number_entity.async_set_native_value(80.0)
+    # Dragging the slider: only the last value is sent, after a quiet delay
+    with patch("custom_components.zeekr_ev.entity.async_call_later") as call_later:
+        for value in (60.0, 70.0, 80.0):
+            await number_entity.async_set_native_value(value)
+    assert call_later.call_count == 3
+    assert call_later.return_value.call_count == 2
+    coordinator.async_inc_invoke.assert_not_called()
+    assert number_entity.native_value == 80.0
+
+    await number_entity.async_flush_setpoint()
 
     coordinator.async_inc_invoke.assert_called_once()
     vehicle.do_remote_control.assert_called_with(
@@ -88,11 +112,11 @@ async def test_charging_limit_read_from_coordinator():
     coordinator = MockCoordinator([vehicle])
 
     # Inject data into coordinator
-    coordinator.data[vin] = {
+    coordinator.data[vin] = VehicleSnapshot.from_status({
         "chargingLimit": {
             "soc": "900"
         }
-    }
+    })
 
     number_entity = ZeekrChargingLimitNumber(coordinator, vin)
     number_entity.hass = DummyHass()
@@ -101,7 +125,7 @@ async def test_charging_limit_read_from_coordinator():
     assert number_entity.native_value == 90.0
 
     # Update data
-    coordinator.data[vin]["chargingLimit"]["soc"] = "550"
+    coordinator.data[vin].charging_limit = 55.0
     assert number_entity.native_value == 55.0
 
 
@@ -0,0 +1,48 @@
+from unittest.mock import patch
+from custom_components.zeekr_ev.optimistic import OptimisticOverlay
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot
+
+
+def test_overlay_masks_fetched_value_without_mutating_it():
+    overlay = OptimisticOverlay()
+    fetched = VehicleSnapshot(central_locked=False, battery_level=80.0)
+
+    overlay.set("VIN1", {"central_locked": True})
+    merged = overlay.apply("VIN1", fetched)
+
+    assert merged.central_locked is True
+    assert merged.battery_level == 80.0
+    assert fetched.central_locked is False
+    # Other vehicles are unaffected
+    assert overlay.apply("VIN2", fetched) is fetched
+    assert overlay.apply("VIN1", None) is None
+
+
+def test_overlay_survives_stale_poll_and_clears_on_confirmation():
+    overlay = OptimisticOverlay()
+    overlay.set("VIN1", {"central_locked": True, "defrost": True})
+
+    # The car still reports the pre-command state
+    overlay.reconcile({"VIN1": VehicleSnapshot(central_locked=False, defrost=False)})
+    assert overlay.pending("VIN1") == {"central_locked": True, "defrost": True}
+
+    # Only the confirmed field is dropped
+    overlay.reconcile({"VIN1": VehicleSnapshot(central_locked=True, defrost=False)})
+    assert overlay.pending("VIN1") == {"defrost": True}
+
+    overlay.reconcile({"VIN1": VehicleSnapshot(central_locked=True, defrost=True)})
+    assert overlay.pending("VIN1") == {}
+
+
+def test_overlay_expires():
+    overlay = OptimisticOverlay(ttl=60)
+    fetched = VehicleSnapshot(defrost=False)
+
+    with patch("custom_components.zeekr_ev.optimistic.time.monotonic", return_value=1000.0):
+        overlay.set("VIN1", {"defrost": True})
+        assert overlay.apply("VIN1", fetched).defrost is True
+
+    with patch("custom_components.zeekr_ev.optimistic.time.monotonic", return_value=1061.0):
+        assert overlay.apply("VIN1", fetched) is fetched
+        overlay.reconcile({"VIN1": fetched})
+        assert overlay.pending("VIN1") == {}
@@ -0,0 +1,77 @@
+import os
+import time
+import pytest
+from custom_components.zeekr_ev.profiler import (
+    MODE_SAMPLING,
+    TARGET_COMMAND,
+    TARGET_UPDATE,
+    ZeekrProfiler,
+)
+
+
+class DummyConfig:
+    def __init__(self, config_dir):
+        self.config_dir = config_dir
+
+    def path(self, *args):
+        return os.path.join(self.config_dir, *args)
+
+
+class DummyHass:
+    def __init__(self, config_dir):
+        self.config = DummyConfig(config_dir)
+        self.executor_jobs = []
+
+    async def async_add_executor_job(self, func, *args, **kwargs):
+        self.executor_jobs.append(func)
+        return func(*args, **kwargs)
+
+
+def busy_call(value):
+    return sum(range(value))
+
+
+def test_profiler_disabled_by_default(tmp_path):
+    profiler = ZeekrProfiler(DummyHass(str(tmp_path)))
+    assert profiler.start(TARGET_UPDATE, "poll") is None
+    assert profiler.start(TARGET_COMMAND, "RDL_start") is None
+
+
+@pytest.mark.asyncio
+async def test_profiler_cprofile_writes_files(tmp_path):
+    profiler = ZeekrProfiler(DummyHass(str(tmp_path)))
+    profiler.arm(TARGET_COMMAND, 1, top=5)
+
+    session = profiler.start(TARGET_COMMAND, "RDL_start")
+    assert session is not None
+    assert session.wrap(busy_call)(1000) == sum(range(1000))
+    await session.async_finish()
+
+    # Only armed for a single command
+    assert profiler.start(TARGET_COMMAND, "RDL_start") is None
+    assert profiler.remaining(TARGET_COMMAND) == 0
+
+    files = os.listdir(tmp_path / "zeekr_ev_profiles")
+    assert any(f.endswith("_command_RDL_start.prof") for f in files)
+    summary = next(f for f in files if f.endswith(".txt"))
+    assert "busy_call" in (tmp_path / "zeekr_ev_profiles" / summary).read_text()
+
+
+@pytest.mark.asyncio
+async def test_profiler_sampling_writes_summary(tmp_path):
+    hass = DummyHass(str(tmp_path))
+    profiler = ZeekrProfiler(hass)
+    profiler.arm(TARGET_UPDATE, 1, mode=MODE_SAMPLING)
+
+    session = profiler.start(TARGET_UPDATE, "poll")
+    session.wrap(time.sleep)(0.05)
+    await session.async_finish()
+    # The sampler thread is joined in the executor, not on the event loop
+    sampler = session._sampler
+    assert sampler.join in hass.executor_jobs
+    assert not sampler.is_alive()
+
+    files = os.listdir(tmp_path / "zeekr_ev_profiles")
+    assert any(f.endswith(".folded") for f in files)
+    summary = next(f for f in files if f.endswith(".txt"))
+    assert "samples" in (tmp_path / "zeekr_ev_profiles" / summary).read_text()
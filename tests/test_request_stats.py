@@ -103,3 +103,30 @@ async def test_inc_invoke(hass, mock_store):
     # Now, trigger shutdown and verify save
     await stats.async_shutdown()
     mock_store.async_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_record_latency(hass, mock_store):
+    stats = ZeekrRequestStats(hass)
+    stats.record_latency("get_status", 0.1)
+    stats.record_latency("get_status", 3.0)
+    stats.record_latency("get_status", 120.0)
+
+    latency = stats.latency_as_dict()["get_status"]
+    assert latency["count"] == 3
+    assert latency["buckets"]["0.25"] == 1
+    assert latency["buckets"]["5.0"] == 1
+    assert latency["buckets"]["+Inf"] == 1
+    # Latency is not persisted with the counters
+    assert "latency" not in stats.as_dict()
+
+
+@pytest.mark.asyncio
+async def test_record_timeout(hass, mock_store):
+    stats = ZeekrRequestStats(hass)
+    stats.record_timeout("get_status")
+    stats.record_timeout("get_status")
+    stats.record_timeout("login")
+
+    assert stats.timeouts == {"get_status": 2, "login": 1}
+    assert "timeouts" not in stats.as_dict()
@@ -0,0 +1,258 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.zeekr_ev.scheduler import (
+    CallLimiter,
+    DECREASE_COOLDOWN,
+    INITIAL_CONCURRENT_CALLS,
+    LANE_COMMAND,
+    LANE_POLL,
+    LANE_REFRESH,
+    ZeekrScheduler,
+    async_get_scheduler,
+    is_overload_error,
+)
+
+
+def test_polls_of_entries_are_spread(monkeypatch):
+    monkeypatch.setattr("custom_components.zeekr_ev.scheduler.random.uniform", lambda a, b: 0)
+    scheduler = ZeekrScheduler()
+    for entry_id in ("entry1", "entry2", "entry3", "entry4"):
+        scheduler.async_register(entry_id)
+
+    polls = [
+        scheduler.next_poll(entry_id, 300, 1000) for entry_id in ("entry1", "entry2", "entry3", "entry4")
+    ]
+    assert sorted(poll % 300 for poll in polls) == [0, 75, 150, 225]
+    # At least half an interval away, at most one and a half
+    assert all(1150 <= poll <= 1450 for poll in polls)
+
+    # Polls stay on their slot
+    assert scheduler.next_poll("entry2", 300, polls[1]) == polls[1] + 300
+
+
+def test_unregistered_entry_polls_after_an_interval():
+    scheduler = ZeekrScheduler()
+    unregister = scheduler.async_register("entry1")
+    unregister()
+    assert scheduler.next_poll("entry1", 300, 1000) == 1300
+
+
+def test_scheduler_is_shared(hass):
+    assert async_get_scheduler(hass) is async_get_scheduler(hass)
+
+
+@pytest.mark.asyncio
+async def test_calls_are_limited_globally_and_per_account():
+    scheduler = ZeekrScheduler(max_concurrent=2, account_concurrent=1)
+    running: list[str] = []
+    peak = {"all": 0, "a": 0}
+
+    async def call(account):
+        async with scheduler.slot(account):
+            running.append(account)
+            peak["all"] = max(peak["all"], len(running))
+            peak["a"] = max(peak["a"], running.count("a"))
+            await asyncio.sleep(0.01)
+            running.remove(account)
+
+    await asyncio.gather(*(call(account) for account in ("a", "a", "b", "c", "d")))
+    assert peak == {"all": 2, "a": 1}
+    assert scheduler.queued_calls >= 3
+    assert scheduler.calls.active == 0
+
+
+@pytest.mark.asyncio
+async def test_commands_are_served_before_queued_polls():
+    scheduler = ZeekrScheduler(max_concurrent=1, account_concurrent=1)
+    served: list[str] = []
+
+    async def call(name, lane):
+        async with scheduler.slot("a", lane):
+            served.append(name)
+            await asyncio.sleep(0.01)
+
+    tasks = [asyncio.ensure_future(call("poll1", LANE_POLL))]
+    await asyncio.sleep(0)
+    for name, lane in (("poll2", LANE_POLL), ("refresh", LANE_REFRESH), ("command", LANE_COMMAND)):
+        tasks.append(asyncio.ensure_future(call(name, lane)))
+    await asyncio.gather(*tasks)
+
+    assert served == ["poll1", "command", "refresh", "poll2"]
+    lanes = scheduler.as_dict()["lanes"]
+    assert lanes["command"]["calls"] == 1
+    assert lanes["poll"]["calls"] == 2
+    assert lanes["poll"]["wait_max"] >= lanes["command"]["wait_max"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_up_its_place():
+    scheduler = ZeekrScheduler(max_concurrent=1, account_concurrent=1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.slot("a"):
+            await release.wait()
+
+    holder = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    await holder
+
+    assert scheduler.calls.active == 0
+    assert scheduler.calls.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_waiter_cancelled_after_it_was_popped():
+    limiter = CallLimiter(1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with limiter.acquire():
+            await release.wait()
+
+    holder = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(hold())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    # Pops and skips the cancelled waiter before it handles its cancellation
+    limiter.set_limit(2)
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.active == 1
+    assert limiter.waiting == 0
+    release.set()
+    await holder
+    assert limiter.active == 0
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.response = SimpleNamespace(status_code=status_code)
+
+
+class Timeout(OSError):
+    pass
+
+
+class ReadTimeout(Timeout):
+    pass
+
+
+def test_overload_errors():
+    assert is_overload_error(TimeoutError())
+    assert is_overload_error(ReadTimeout())
+    assert is_overload_error(HTTPError(429))
+    assert is_overload_error(HTTPError(503))
+    assert is_overload_error(Exception("Failed: {'success': False, 'status_code': 502}"))
+    assert not is_overload_error(HTTPError(404))
+    assert not is_overload_error(Exception("Failed to get vehicle list"))
+
+
+def test_call_limit_adapts_to_the_api(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("custom_components.zeekr_ev.scheduler.time.monotonic", lambda: now[0])
+    scheduler = ZeekrScheduler()
+    assert scheduler.calls.limit == INITIAL_CONCURRENT_CALLS
+
+    # Fast calls below the limit do not add one
+    for _ in range(10):
+        scheduler.observe(0.5)
+    assert scheduler.calls.limit == INITIAL_CONCURRENT_CALLS
+
+    # A full round of fast calls that filled it does
+    for _ in range(INITIAL_CONCURRENT_CALLS):
+        scheduler.observe(0.5, saturated=True)
+    assert scheduler.calls.limit == INITIAL_CONCURRENT_CALLS + 1
+
+    # Slow calls do not
+    for _ in range(10):
+        scheduler.observe(5.0, saturated=True)
+    assert scheduler.calls.limit == INITIAL_CONCURRENT_CALLS + 1
+
+    # Rate limiting halves it, once per cooldown
+    scheduler.observe(0.5, HTTPError(429))
+    scheduler.observe(0.5, HTTPError(429))
+    assert scheduler.calls.limit == 2
+    now[0] += DECREASE_COOLDOWN
+    scheduler.observe(30.0, TimeoutError())
+    scheduler.observe(0.5, HTTPError(503))
+    assert scheduler.calls.limit == 1
+
+    # Other errors leave it alone
+    scheduler.observe(0.5, Exception("Failed to get vehicle list"))
+    assert scheduler.calls.limit == 1
+
+    history = scheduler.as_dict()["limit_history"]
+    assert [change["limit"] for change in history] == [5, 2, 1]
+    assert history[-1]["reason"] == "TimeoutError"
+
+
+@pytest.mark.asyncio
+async def test_call_limit_throttles_many_accounts():
+    scheduler = ZeekrScheduler()
+    running = []
+    peak = []
+
+    async def call(account):
+        async with scheduler.slot(account):
+            running.append(account)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(account)
+
+    async def round_of(accounts):
+        peak.clear()
+        await asyncio.gather(*(call(f"account{n}") for n in range(accounts)))
+        return max(peak)
+
+    # Two accounts never fill the limit, so it does not grow
+    for _ in range(10):
+        assert await round_of(2) == 2
+    assert scheduler.calls.limit == INITIAL_CONCURRENT_CALLS
+
+    # Eight accounts are held to the limit, and fill it so it grows
+    assert await round_of(8) == INITIAL_CONCURRENT_CALLS
+    assert scheduler.calls.limit == INITIAL_CONCURRENT_CALLS + 1
+
+    # A decrease throttles them, the limit growing back by one per full round
+    scheduler.observe(30.0, TimeoutError())
+    assert scheduler.calls.limit == 2
+    assert await round_of(8) <= 3
+
+
+@pytest.mark.asyncio
+async def test_raised_limit_lets_waiters_in():
+    scheduler = ZeekrScheduler()
+    scheduler.calls.set_limit(1)
+    release = asyncio.Event()
+    running = []
+
+    async def call(account):
+        async with scheduler.slot(account):
+            running.append(account)
+            await release.wait()
+
+    tasks = [asyncio.ensure_future(call(account)) for account in ("a", "b", "c")]
+    await asyncio.sleep(0)
+    assert running == ["a"]
+    scheduler.calls.set_limit(2)
+    await asyncio.sleep(0)
+    assert running == ["a", "b"]
+
+    # Lowered again, a freed slot is not handed over
+    scheduler.calls.set_limit(1)
+    release.set()
+    await asyncio.gather(*tasks)
+    assert running == ["a", "b", "c"]
+    assert scheduler.calls.active == 0
@@ -0,0 +1,123 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.zeekr_ev.optimistic import OptimisticOverlay
+from custom_components.zeekr_ev.select import (
+    OPTION_LEVEL_1,
+    OPTION_LEVEL_2,
+    OPTION_LEVEL_3,
+    OPTION_OFF,
+    SEAT_DESCRIPTIONS,
+    ZeekrSeatSelect,
+)
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot
+
+DESCRIPTIONS = {description.key: description for description in SEAT_DESCRIPTIONS}
+
+
+class MockCoordinator:
+    def __init__(self, vehicles):
+        self.vehicles = {vehicle.vin: vehicle for vehicle in vehicles}
+        self.data = {vin: VehicleSnapshot() for vin in self.vehicles}
+        self.overlay = OptimisticOverlay()
+        self.generation = 0
+        self.value_cache_hits = 0
+        self.value_cache_misses = 0
+        self.last_update_success = True
+        self.async_inc_invoke = AsyncMock()
+        self.async_request_refresh = AsyncMock()
+        self.seat_duration = 15
+
+    def supports(self, vin, capability):
+        return True
+
+    def get_snapshot(self, vin):
+        return self.overlay.apply(vin, self.data.get(vin))
+
+    def async_set_optimistic(self, vin, **fields):
+        self.overlay.set(vin, fields)
+        self.generation += 1
+
+    def async_clear_optimistic(self, vin, *fields):
+        self.overlay.discard(vin, fields)
+        self.generation += 1
+
+    def get_vehicle_by_vin(self, vin):
+        return self.vehicles.get(vin)
+
+    async def async_remote_control(self, vehicle, command, service_id, setting):
+        await self.async_inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
+
+
+def _select(key="seat_heat_driver"):
+    vehicle = MagicMock(vin="VIN1")
+    coordinator = MockCoordinator([vehicle])
+    select = ZeekrSeatSelect(coordinator, "VIN1", DESCRIPTIONS[key])
+    select.hass = MagicMock()
+    select.entity_id = f"select.zeekr_{key}"
+    select.async_write_ha_state = MagicMock()
+    return select, coordinator, vehicle
+
+
+@pytest.mark.asyncio
+async def test_seat_selections_are_debounced():
+    select, coordinator, vehicle = _select()
+    assert select.current_option == OPTION_OFF
+
+    # Clicking through the levels: only the last one is sent, after a quiet delay
+    with patch("custom_components.zeekr_ev.entity.async_call_later") as call_later:
+        for option in (OPTION_LEVEL_1, OPTION_LEVEL_2, OPTION_LEVEL_3):
+            await select.async_select_option(option)
+    assert call_later.call_count == 3
+    assert call_later.return_value.call_count == 2
+    coordinator.async_inc_invoke.assert_not_called()
+    # Shown optimistically right away
+    assert select.current_option == OPTION_LEVEL_3
+    assert select.async_write_ha_state.call_count == 3
+
+    await select.async_flush_setpoint()
+    vehicle.do_remote_control.assert_called_once_with(
+        "start",
+        "ZAF",
+        {
+            "serviceParameters": [
+                {"key": "SH.11", "value": "true"},
+                {"key": "SH.11.level", "value": "3"},
+                {"key": "SH.11.duration", "value": "15"},
+            ]
+        },
+    )
+    coordinator.async_request_refresh.assert_awaited_once()
+    assert select.current_option == OPTION_LEVEL_3
+
+    # Nothing is left to send
+    await select.async_flush_setpoint()
+    vehicle.do_remote_control.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_seat_off_is_sent_as_false():
+    select, _, vehicle = _select("seat_vent_passenger")
+    with patch("custom_components.zeekr_ev.entity.async_call_later"):
+        await select.async_select_option(OPTION_OFF)
+    await select.async_flush_setpoint()
+    vehicle.do_remote_control.assert_called_once_with(
+        "start", "ZAF", {"serviceParameters": [{"key": "SV.19", "value": "false"}]}
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_seat_send_clears_optimistic_level():
+    select, coordinator, vehicle = _select()
+    coordinator.data["VIN1"] = VehicleSnapshot(seat_heat_driver=1)
+    vehicle.do_remote_control.side_effect = Exception("Command rejected")
+
+    with patch("custom_components.zeekr_ev.entity.async_call_later"):
+        await select.async_select_option(OPTION_LEVEL_3)
+    assert select.current_option == OPTION_LEVEL_3
+
+    await select.async_flush_setpoint()
+    assert coordinator.overlay.pending("VIN1") == {}
+    assert select.current_option == OPTION_LEVEL_1
@@ -1,14 +1,39 @@
-from custom_components.zeekr_ev.sensor import ZeekrSensor
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from operator import attrgetter
+
+from custom_components.zeekr_ev.sensor import (
+    CHARGING_SENSOR_DESCRIPTIONS,
+    COMPACT_SENSOR_DESCRIPTIONS,
+    SENSOR_DESCRIPTIONS,
+    ZeekrSensor,
+    ZeekrSensorEntityDescription,
+)
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot
+
+DESCRIPTIONS = {
+    d.key: d
+    for d in SENSOR_DESCRIPTIONS + CHARGING_SENSOR_DESCRIPTIONS + COMPACT_SENSOR_DESCRIPTIONS
+}
 
 
 class DummyCoordinator:
     def __init__(self, data):
-        self.data = data
+        self.data = {vin: VehicleSnapshot.from_status(raw) for vin, raw in data.items()}
+        self.generation = 0
+        self.value_cache_hits = 0
+        self.value_cache_misses = 0
+
+    def get_snapshot(self, vin):
+        return self.data.get(vin)
+
+    def supports(self, vin, capability):
+        return True
 
 
 def test_native_value_none_when_no_data():
     coordinator = DummyCoordinator({})
-    s = ZeekrSensor(coordinator, "VIN1", "battery_level", "Battery", lambda d: 1, "%")
+    s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["battery_level"])
     assert s.native_value is None
 
 
@@ -19,15 +44,30 @@ def test_native_value_returns_value():
         }
     }
     coordinator = DummyCoordinator(data)
-    s = ZeekrSensor(
-        coordinator,
-        "VIN1",
-        "battery_level",
-        "Battery",
-        lambda d: d.get("additionalVehicleStatus", {}).get("electricVehicleStatus", {}).get("chargeLevel"),
-        "%",
-    )
+    s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["battery_level"])
+    assert s.native_value == 42
+    assert s.unique_id == "VIN1_battery_level"
+    assert s.name == "Zeekr VIN1 Battery Level"
+    assert s.native_unit_of_measurement == "%"
+
+
+def test_native_value_cached_per_generation():
+    data = {
+        "VIN1": {
+            "additionalVehicleStatus": {"electricVehicleStatus": {"chargeLevel": 42}}
+        }
+    }
+    coordinator = DummyCoordinator(data)
+    s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["battery_level"])
     assert s.native_value == 42
+    assert s.native_value == 42
+    assert (coordinator.value_cache_hits, coordinator.value_cache_misses) == (1, 1)
+
+    coordinator.data["VIN1"] = VehicleSnapshot(battery_level=43.0)
+    assert s.native_value == 42
+    coordinator.generation += 1
+    assert s.native_value == 43.0
+    assert coordinator.value_cache_misses == 2
 
 
 def test_charging_voltage_sensor():
@@ -37,15 +77,8 @@ def test_charging_voltage_sensor():
         }
     }
     coordinator = DummyCoordinator(data)
-    s = ZeekrSensor(
-        coordinator,
-        "VIN1",
-        "charge_voltage",
-        "Charge Voltage",
-        lambda d: d.get("chargingStatus", {}).get("chargeVoltage"),
-        "V",
-    )
-    assert s.native_value == "222.0"
+    s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["charge_voltage"])
+    assert s.native_value == 222.0
 
 
 def test_charging_current_sensor():
@@ -55,15 +88,8 @@ def test_charging_current_sensor():
         }
     }
     coordinator = DummyCoordinator(data)
-    s = ZeekrSensor(
-        coordinator,
-        "VIN1",
-        "charge_current",
-        "Charge Current",
-        lambda d: d.get("chargingStatus", {}).get("chargeCurrent"),
-        "A",
-    )
-    assert s.native_value == "9.4"
+    s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["charge_current"])
+    assert s.native_value == 9.4
 
 
 def test_charge_power_sensor():
@@ -73,32 +99,24 @@ def test_charge_power_sensor():
         }
     }
     coordinator = DummyCoordinator(data)
-    s = ZeekrSensor(
-        coordinator,
-        "VIN1",
-        "charge_power",
-        "Charge Power",
-        lambda d: d.get("chargingStatus", {}).get("chargePower"),
-        "kW",
-    )
-    assert s.native_value == "2.1"
+    s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["charge_power"])
+    assert s.native_value == 2.1
 
 
 def test_charger_state_sensor():
     data = {
         "VIN1": {
-            "chargingStatus": {"chargerState": "2"}
+            "additionalVehicleStatus": {"electricVehicleStatus": {"chargerState": "2"}}
         }
     }
     coordinator = DummyCoordinator(data)
-    s = ZeekrSensor(
-        coordinator,
-        "VIN1",
-        "charger_state",
-        "Charger State",
-        lambda d: d.get("chargingStatus", {}).get("chargerState"),
+    description = ZeekrSensorEntityDescription(
+        key="charger_state",
+        name="Charger State",
+        value_fn=attrgetter("charger_state"),
     )
-    assert s.native_value == "2"
+    s = ZeekrSensor(coordinator, "VIN1", description)
+    assert s.native_value == 2
 
 
 def test_tire_temp_sensors():
@@ -117,62 +135,151 @@ def test_tire_temp_sensors():
     coordinator = DummyCoordinator(data)
 
     for tire, val in [("Driver", 20), ("Passenger", 21), ("DriverRear", 22), ("PassengerRear", 23)]:
-        s = ZeekrSensor(
-            coordinator,
-            "VIN1",
-            f"tire_temperature_{tire.lower()}",
-            f"Tire Temperature {tire}",
-            lambda d, t=tire: d.get("additionalVehicleStatus", {})
-            .get("maintenanceStatus", {})
-            .get(f"tyreTemp{t}"),
-            "°C",
-        )
+        s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS[f"tire_temperature_{tire.lower()}"])
         assert s.native_value == val
 
 
-def test_window_sensors():
+def test_descriptions_are_shared_between_vehicles():
     data = {
-        "VIN1": {
-            "additionalVehicleStatus": {
-                "climateStatus": {
-                    "winStatusDriver": "2",
-                    "winStatusPassenger": "2",
-                    "winStatusDriverRear": "2",
-                    "winStatusPassengerRear": "2",
-                    "winPosDriver": "0",
-                    "winPosPassenger": "0",
-                    "winPosDriverRear": "0",
-                    "winPosPassengerRear": "0",
-                }
-            }
-        }
+        "VIN1": {"additionalVehicleStatus": {"maintenanceStatus": {"odometer": "100"}}},
+        "VIN2": {"additionalVehicleStatus": {"maintenanceStatus": {"odometer": "200"}}},
     }
     coordinator = DummyCoordinator(data)
+    first = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["odometer"])
+    second = ZeekrSensor(coordinator, "VIN2", DESCRIPTIONS["odometer"])
+
+    assert first.entity_description is second.entity_description
+    assert first.native_value == 100.0
+    assert second.native_value == 200.0
+
+
+def _poll(coordinator, sensor, snapshot, now):
+    coordinator.data["VIN1"] = snapshot
+    coordinator.generation += 1
+    with patch("custom_components.zeekr_ev.sensor.time.monotonic", return_value=now):
+        sensor._handle_coordinator_update()
+
+
+def test_deadband_suppresses_jitter():
+    coordinator = DummyCoordinator({"VIN1": {}})
+    coordinator.last_update_success = True
+    s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["tire_temperature_driver"])
+    s.async_write_ha_state = MagicMock()
+
+    _poll(coordinator, s, VehicleSnapshot(tyre_temp_driver=20.2), 0)
+    assert s.native_value == 20.0
+    # Within 1 °C of the written value: no state write
+    _poll(coordinator, s, VehicleSnapshot(tyre_temp_driver=20.6), 60)
+    assert s.native_value == 20.0
+    assert s.async_write_ha_state.call_count == 1
+
+    _poll(coordinator, s, VehicleSnapshot(tyre_temp_driver=22.4), 120)
+    assert s.native_value == 22.0
+    assert s.async_write_ha_state.call_count == 2
+
+    # Max silence forces a write even inside the band
+    _poll(coordinator, s, VehicleSnapshot(tyre_temp_driver=22.3), 120 + 30 * 60)
+    assert s.async_write_ha_state.call_count == 3
+
+    # Losing the value is always written
+    _poll(coordinator, s, VehicleSnapshot(), 120 + 31 * 60)
+    assert s.native_value is None
+    assert s.async_write_ha_state.call_count == 4
+
+
+def test_percent_deadband():
+    coordinator = DummyCoordinator({"VIN1": {}})
+    coordinator.last_update_success = True
+    s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["charge_voltage"])
+    s.async_write_ha_state = MagicMock()
+
+    _poll(coordinator, s, VehicleSnapshot(charge_voltage=400.0), 0)
+    _poll(coordinator, s, VehicleSnapshot(charge_voltage=403.0), 60)
+    assert s.native_value == 400.0
+    _poll(coordinator, s, VehicleSnapshot(charge_voltage=405.0), 120)
+    assert s.native_value == 405.0
+    assert s.async_write_ha_state.call_count == 2
+
+
+def test_unfiltered_sensor_always_writes():
+    coordinator = DummyCoordinator({"VIN1": {}})
+    coordinator.last_update_success = True
+    s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["battery_level"])
+    s.async_write_ha_state = MagicMock()
+
+    _poll(coordinator, s, VehicleSnapshot(battery_level=80.0), 0)
+    _poll(coordinator, s, VehicleSnapshot(battery_level=80.0), 60)
+    assert s.async_write_ha_state.call_count == 2
+
+
+def test_unchanged_snapshot_is_not_written():
+    coordinator = DummyCoordinator({"VIN1": {}})
+    coordinator.last_update_success = True
+    s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["battery_level"])
+    s.async_write_ha_state = MagicMock()
+
+    snapshot = VehicleSnapshot(battery_level=80.0)
+    _poll(coordinator, s, snapshot, 0)
+    # The coordinator reuses the snapshot of a vehicle that sent nothing new
+    _poll(coordinator, s, snapshot, 60)
+    assert s.async_write_ha_state.call_count == 1
+
+    coordinator.last_update_success = False
+    _poll(coordinator, s, snapshot, 120)
+    assert s.async_write_ha_state.call_count == 2
+
+
+def test_held_back_value_written_after_max_silence_of_unchanged_snapshot():
+    coordinator = DummyCoordinator({"VIN1": {}})
+    coordinator.last_update_success = True
+    description = DESCRIPTIONS["tire_temperature_driver"]
+    s = ZeekrSensor(coordinator, "VIN1", description)
+    s.async_write_ha_state = MagicMock()
+
+    _poll(coordinator, s, VehicleSnapshot(tyre_temp_driver=20.0), 0)
+    held_back = VehicleSnapshot(tyre_temp_driver=20.8)
+    _poll(coordinator, s, held_back, 60)
+    assert s.native_value == 20.0
+
+    # The vehicle sends nothing new, so the same snapshot comes back
+    silence = description.max_silence.total_seconds()
+    _poll(coordinator, s, held_back, silence - 1)
+    assert s.async_write_ha_state.call_count == 1
+    _poll(coordinator, s, held_back, silence)
+    assert s.native_value == 21.0
+    assert s.async_write_ha_state.call_count == 2
+
+
+def test_data_age_sensor():
+    updated = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    coordinator = DummyCoordinator({"VIN1": {}})
+    coordinator.data["VIN1"] = VehicleSnapshot(updated_at=updated)
+    s = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["data_age"])
+    assert s.native_value == updated
+    assert s.device_class == "timestamp"
+    assert s.state_class is None
+    assert s.entity_category == "diagnostic"
+
+
+def test_compact_tires_and_seats_sensors():
+    coordinator = DummyCoordinator({"VIN1": {}})
+    coordinator.data["VIN1"] = VehicleSnapshot(
+        tyre_pressure_driver=250.0,
+        tyre_pressure_passenger_rear=238.0,
+        tyre_temp_driver=21.0,
+        seat_heat_driver=2,
+        seat_vent_passenger=1,
+    )
+
+    tires = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["tires"])
+    assert tires.native_value == 238.0
+    attributes = tires.extra_state_attributes
+    assert attributes["pressure_driver"] == 250.0
+    assert attributes["temp_driver"] == 21.0
+    assert attributes["pressure_passenger"] is None
+    assert len(attributes) == 16
 
-    # Status
-    for win, status in [("Driver", "2"), ("Passenger", "2"), ("DriverRear", "2"), ("PassengerRear", "2")]:
-        s = ZeekrSensor(
-            coordinator,
-            "VIN1",
-            f"window_status_{win.lower()}",
-            f"Window Status {win}",
-            lambda d, w=win: d.get("additionalVehicleStatus", {})
-            .get("climateStatus", {})
-            .get(f"winStatus{w}"),
-            None,
-        )
-        assert s.native_value == status
-
-    # Position
-    for win, pos in [("Driver", "0"), ("Passenger", "0"), ("DriverRear", "0"), ("PassengerRear", "0")]:
-        s = ZeekrSensor(
-            coordinator,
-            "VIN1",
-            f"window_position_{win.lower()}",
-            f"Window Position {win}",
-            lambda d, w=win: d.get("additionalVehicleStatus", {})
-            .get("climateStatus", {})
-            .get(f"winPos{w}"),
-            "%",
-        )
-        assert s.native_value == pos
+    seats = ZeekrSensor(coordinator, "VIN1", DESCRIPTIONS["seats"])
+    assert seats.native_value == 2
+    assert seats.extra_state_attributes["seat_heat_driver"] == 2
+    assert seats.extra_state_attributes["seat_heat_passenger"] == 0
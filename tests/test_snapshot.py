@@ -0,0 +1,85 @@
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot, status_update_time
+
+
+def test_from_status_converts_types():
+    snapshot = VehicleSnapshot.from_status(
+        {
+            "basicVehicleStatus": {"position": {"latitude": "12.34", "longitude": "56.78"}},
+            "additionalVehicleStatus": {
+                "electricVehicleStatus": {
+                    "chargeLevel": "81",
+                    "chargerState": "26",
+                    "statusOfChargerConnection": "1",
+                    "chargeLidDcAcStatus": "2",
+                },
+                "maintenanceStatus": {"odometer": "12345.6", "tyreStatusDriver": "250"},
+                "drivingSafetyStatus": {"centralLockingStatus": "1", "engineHoodOpenStatus": "0"},
+                "climateStatus": {
+                    "preClimateActive": "true",
+                    "passVentSts": 1,
+                    "passVentDetail": 2,
+                    "drvVentSts": 2,
+                    "drvVentDetail": 3,
+                    "drvHeatSts": "3",
+                },
+                "remoteControlState": {"vstdModeState": "true"},
+            },
+            "chargingStatus": {"chargePower": "7.2"},
+            "chargingLimit": {"soc": "800"},
+        }
+    )
+
+    assert snapshot.battery_level == 81.0
+    assert snapshot.charger_state == 26
+    assert snapshot.charging is False
+    assert snapshot.charger_active is True
+    assert snapshot.plugged_in is True
+    assert snapshot.charge_lid_closed is True
+    assert snapshot.odometer == 12345.6
+    assert snapshot.tyre_pressure_driver == 250.0
+    assert snapshot.tyre_pressure_passenger is None
+    assert snapshot.central_locked is True
+    assert snapshot.hood_closed is True
+    assert snapshot.climate_active is True
+    assert snapshot.seat_vent_passenger == 2
+    assert snapshot.seat_vent_driver == 0
+    assert snapshot.seat_heat_driver == 3
+    assert snapshot.sentry_mode is True
+    assert snapshot.latitude == 12.34
+    assert snapshot.has_charging_status is True
+    assert snapshot.charge_power == 7.2
+    assert snapshot.charging_limit == 80.0
+
+
+def test_from_status_empty_and_invalid():
+    snapshot = VehicleSnapshot.from_status(
+        {"basicVehicleStatus": {"position": {"latitude": "notafloat"}}}
+    )
+
+    assert snapshot.latitude is None
+    assert snapshot.charger_state is None
+    assert snapshot.charging is None
+    assert snapshot.charger_active is False
+    assert snapshot.climate_active is False
+    assert snapshot.seat_heat_driver == 0
+    assert snapshot.has_charging_status is False
+    assert snapshot.updated_at is None
+
+
+def test_from_status_update_time():
+    updated = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    millis = str(int(updated.timestamp() * 1000))
+
+    assert VehicleSnapshot.from_status({"updateTime": millis}).updated_at == updated
+    nested = {"basicVehicleStatus": {"updateTime": int(updated.timestamp())}}
+    assert VehicleSnapshot.from_status(nested).updated_at == updated
+    assert status_update_time(nested) == int(updated.timestamp())
+    assert status_update_time({}) is None
+
+
+def test_as_dict_matches_asdict():
+    snapshot = VehicleSnapshot(battery_level=80.0, seat_heat_driver=2, sentry_mode=True)
+    assert snapshot.as_dict() == asdict(snapshot)
@@ -1,8 +1,10 @@
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 import asyncio
 import pytest
-from custom_components.zeekr_ev.switch import ZeekrSwitch, async_setup_entry
-from custom_components.zeekr_ev.const import DOMAIN
+from custom_components.zeekr_ev.switch import SWITCH_DESCRIPTIONS, ZeekrSwitch, async_setup_entry
+from custom_components.zeekr_ev.const import CAPABILITY_SENTRY_MODE, DOMAIN
+from custom_components.zeekr_ev.optimistic import OptimisticOverlay
+from custom_components.zeekr_ev.snapshot import VehicleSnapshot
 
 
 class MockVehicle:
@@ -15,14 +17,34 @@ class MockVehicle:
 
 class MockCoordinator:
     def __init__(self, data):
-        self.data = data
+        self.data = {vin: VehicleSnapshot.from_status(raw) for vin, raw in data.items()}
+        self.generation = 0
+        self.value_cache_hits = 0
+        self.value_cache_misses = 0
+        self.overlay = OptimisticOverlay()
         self.vehicles = {}
         self.async_inc_invoke = AsyncMock()
         self.steering_wheel_duration = 15
+        self.unsupported = set()
+        self.last_update_success = True
+
+    def supports(self, vin, capability):
+        return capability not in self.unsupported
+
+    def get_snapshot(self, vin):
+        return self.overlay.apply(vin, self.data.get(vin))
+
+    def async_set_optimistic(self, vin, **fields):
+        self.overlay.set(vin, fields)
+        self.generation += 1
 
     def get_vehicle_by_vin(self, vin):
         return self.vehicles.get(vin)
 
+    async def async_remote_control(self, vehicle, command, service_id, setting):
+        await self.async_inc_invoke()
+        return vehicle.do_remote_control(command, service_id, setting)
+
     def inc_invoke(self):
         pass
 
@@ -68,36 +90,34 @@ async def test_switch_optimistic_update():
     coordinator = MockCoordinator(initial_data)
     coordinator.vehicles[vin] = MockVehicle(vin)
 
-    switch = ZeekrSwitch(coordinator, vin, "defrost", "Defroster")
+    switch = ZeekrSwitch(coordinator, vin, SWITCH_DESCRIPTIONS["defrost"])
     switch.hass = DummyHass()
     switch.async_write_ha_state = MagicMock()
 
     # Test Turn On
     await switch.async_turn_on()
 
-    climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
-    assert climate_status["defrost"] == "1"
+    assert coordinator.get_snapshot(vin).defrost is True
     switch.async_write_ha_state.assert_called()
 
     # Test Turn Off
     await switch.async_turn_off()
 
-    climate_status = coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]
-    assert climate_status["defrost"] == "0"
+    assert coordinator.get_snapshot(vin).defrost is False
     switch.async_write_ha_state.assert_called()
 
 
 @pytest.mark.asyncio
 async def test_switch_properties_missing_data(hass):
     coordinator = MockCoordinator({"VIN1": {}})
-    switch = ZeekrSwitch(coordinator, "VIN1", "defrost", "Label")
+    switch = ZeekrSwitch(coordinator, "VIN1", SWITCH_DESCRIPTIONS["defrost"])
     assert switch.is_on is None
 
 
 @pytest.mark.asyncio
 async def test_switch_no_vehicle(hass):
     coordinator = MockCoordinator({"VIN1": {}})
-    switch = ZeekrSwitch(coordinator, "VIN1", "defrost", "Label")
+    switch = ZeekrSwitch(coordinator, "VIN1", SWITCH_DESCRIPTIONS["defrost"])
     # Should safely return
     await switch.async_turn_on()
     await switch.async_turn_off()
@@ -106,7 +126,7 @@ async def test_switch_no_vehicle(hass):
 @pytest.mark.asyncio
 async def test_switch_device_info(hass):
     coordinator = MockCoordinator({"VIN1": {}})
-    switch = ZeekrSwitch(coordinator, "VIN1", "defrost", "Label")
+    switch = ZeekrSwitch(coordinator, "VIN1", SWITCH_DESCRIPTIONS["defrost"])
     assert switch.device_info["identifiers"] == {(DOMAIN, "VIN1")}
 
 
@@ -143,7 +163,7 @@ async def test_charging_switch():
     vehicle_mock = MagicMock()
     coordinator.vehicles[vin] = vehicle_mock
 
-    switch = ZeekrSwitch(coordinator, vin, "charging", "Charging")
+    switch = ZeekrSwitch(coordinator, vin, SWITCH_DESCRIPTIONS["charging"])
     switch.hass = DummyHass()
     switch.async_write_ha_state = MagicMock()
 
@@ -152,23 +172,27 @@ async def test_charging_switch():
     assert switch.is_on is False
 
     # "1" -> True
-    coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]["chargerState"] = "1"
+    coordinator.data[vin].charger_state = 1
+    coordinator.generation += 1  # as if polled
     assert switch.is_on is True
 
     # "26" -> False (Connected but finished)
-    coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]["chargerState"] = "26"
+    coordinator.data[vin].charger_state = 26
+    coordinator.generation += 1  # as if polled
     assert switch.is_on is False
 
     # Test Turn On (should do nothing)
-    coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]["chargerState"] = "0"
+    coordinator.data[vin].charger_state = 0
+    coordinator.generation += 1  # as if polled
     await switch.async_turn_on()
     # Logic says it returns early, so nothing should be called on vehicle
     vehicle_mock.do_remote_control.assert_not_called()
-    assert coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]["chargerState"] == "0"
+    assert coordinator.get_snapshot(vin).charger_state == 0
 
     # Test Turn Off (Stop Charging)
     # We are "charging" so state is "1"
-    coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]["chargerState"] = "1"
+    coordinator.data[vin].charger_state = 1
+    coordinator.generation += 1  # as if polled
 
     await switch.async_turn_off()
 
@@ -185,7 +209,8 @@ async def test_charging_switch():
         }
     )
     # Optimistic update
-    assert coordinator.data[vin]["additionalVehicleStatus"]["electricVehicleStatus"]["chargerState"] == "0"
+    assert coordinator.get_snapshot(vin).charger_state == 0
+    assert switch.is_on is False
     switch.async_write_ha_state.assert_called()
 
 
@@ -206,24 +231,20 @@ async def test_steering_wheel_switch():
     vehicle_mock = MagicMock()
     coordinator.vehicles[vin] = vehicle_mock
 
-    switch = ZeekrSwitch(
-        coordinator,
-        vin,
-        "steering_wheel_heat",
-        "Steering Wheel Heat",
-        status_key="steerWhlHeatingSts"
-    )
+    switch = ZeekrSwitch(coordinator, vin, SWITCH_DESCRIPTIONS["steering_wheel_heat"])
     switch.hass = DummyHass()
     switch.async_write_ha_state = MagicMock()
 
     # Test is_on logic
     assert switch.is_on is False
 
-    coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]["steerWhlHeatingSts"] = "1"
+    coordinator.data[vin].steering_wheel_heat = True
+    coordinator.generation += 1  # as if polled
     assert switch.is_on is True
 
     # Reset
-    coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]["steerWhlHeatingSts"] = "2"
+    coordinator.data[vin].steering_wheel_heat = False
+    coordinator.generation += 1  # as if polled
 
     # Test Turn On
     await switch.async_turn_on()
@@ -249,7 +270,7 @@ async def test_steering_wheel_switch():
         }
     )
     # Optimistic update
-    assert coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]["steerWhlHeatingSts"] == "1"
+    assert coordinator.get_snapshot(vin).steering_wheel_heat is True
     switch.async_write_ha_state.assert_called()
 
     # Test Turn Off
@@ -268,7 +289,7 @@ async def test_steering_wheel_switch():
         }
     )
     # Optimistic update
-    assert coordinator.data[vin]["additionalVehicleStatus"]["climateStatus"]["steerWhlHeatingSts"] == "2"
+    assert coordinator.get_snapshot(vin).steering_wheel_heat is False
     switch.async_write_ha_state.assert_called()
 
 
@@ -289,25 +310,20 @@ async def test_sentry_mode_switch():
     vehicle_mock = MagicMock()
     coordinator.vehicles[vin] = vehicle_mock
 
-    switch = ZeekrSwitch(
-        coordinator,
-        vin,
-        "sentry_mode",
-        "Sentry Mode",
-        status_key="vstdModeState",
-        status_group="remoteControlState",
-    )
+    switch = ZeekrSwitch(coordinator, vin, SWITCH_DESCRIPTIONS["sentry_mode"])
     switch.hass = DummyHass()
     switch.async_write_ha_state = MagicMock()
 
     # Test is_on logic
     assert switch.is_on is False
 
-    coordinator.data[vin]["additionalVehicleStatus"]["remoteControlState"]["vstdModeState"] = "1"
+    coordinator.data[vin].sentry_mode = True
+    coordinator.generation += 1  # as if polled
     assert switch.is_on is True
 
     # Reset
-    coordinator.data[vin]["additionalVehicleStatus"]["remoteControlState"]["vstdModeState"] = "0"
+    coordinator.data[vin].sentry_mode = False
+    coordinator.generation += 1  # as if polled
 
     try:
         # Test Turn On
@@ -325,7 +341,7 @@ async def test_sentry_mode_switch():
             }
         )
         # Optimistic update
-        assert coordinator.data[vin]["additionalVehicleStatus"]["remoteControlState"]["vstdModeState"] == "1"
+        assert coordinator.get_snapshot(vin).sentry_mode is True
         switch.async_write_ha_state.assert_called()
         # Test Turn Off
         await switch.async_turn_off()
@@ -342,10 +358,43 @@ async def test_sentry_mode_switch():
             }
         )
         # Optimistic update
-        assert coordinator.data[vin]["additionalVehicleStatus"]["remoteControlState"]["vstdModeState"] == "0"
+        assert coordinator.get_snapshot(vin).sentry_mode is False
         switch.async_write_ha_state.assert_called()
     finally:
         # Cleanup delayed refresh tasks scheduled during test
         for task in switch.hass._tasks:
             task.cancel()
         await asyncio.gather(*switch.hass._tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_sentry_switch_follows_capability(hass, mock_config_entry):
+    coordinator = MockCoordinator({"VIN1": {}})
+    coordinator.unsupported.add(CAPABILITY_SENTRY_MODE)
+    hass.data[DOMAIN] = {mock_config_entry.entry_id: coordinator}
+    async_add_entities = MagicMock()
+
+    with patch("custom_components.zeekr_ev.entity.async_dispatcher_connect") as connect:
+        await async_setup_entry(hass, mock_config_entry, async_add_entities)
+    keys = [entity.field for entity in async_add_entities.call_args[0][0]]
+    assert "sentry_mode" not in keys and len(keys) == 3
+
+    signal, capabilities_changed = connect.call_args_list[1][0][1:]
+    assert signal == f"zeekr_ev_capabilities_changed_{mock_config_entry.entry_id}"
+
+    coordinator.unsupported.clear()
+    capabilities_changed("VIN1")
+    (sentry,) = async_add_entities.call_args[0][0]
+    assert sentry.unique_id == "VIN1_sentry_mode"
+    assert sentry.available
+
+    # Added once only
+    async_add_entities.reset_mock()
+    capabilities_changed("VIN1")
+    async_add_entities.assert_not_called()
+
+    # Ruled out again, the entity is kept but unavailable
+    coordinator.unsupported.add(CAPABILITY_SENTRY_MODE)
+    capabilities_changed("VIN1")
+    assert not sentry.available
+    async_add_entities.assert_not_called()
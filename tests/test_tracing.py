@@ -0,0 +1,170 @@
+import asyncio
+import json
+import pytest
+from custom_components.zeekr_ev.tracing import (
+    MAX_PENDING_TRACES,
+    NOOP_TRACER,
+    JsonlSpanExporter,
+    ZeekrTracer,
+    get_tracer,
+    traced,
+    traced_command,
+)
+
+
+class DummyHass:
+    def async_add_executor_job(self, func, *args):
+        return func(*args)
+
+
+class MockCoordinator:
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+
+class DummyEntity:
+    def __init__(self, coordinator):
+        self.coordinator = coordinator
+        self.vin = "VIN1"
+        self.entity_id = "lock.zeekr_vin1_central_locking"
+
+    @traced_command
+    async def async_lock(self):
+        self._update_local_state_optimistically()
+
+    @traced("zeekr.optimistic_write")
+    def _update_local_state_optimistically(self):
+        pass
+
+    @traced_command
+    async def async_fail(self):
+        raise ValueError("boom")
+
+
+def read_spans(path):
+    with open(path, encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def test_noop_tracer_is_default():
+    assert get_tracer(object()) is NOOP_TRACER
+    with NOOP_TRACER.start_as_current_span("zeekr.update") as span:
+        span.set_attribute("vin", "VIN1")
+
+
+@pytest.mark.asyncio
+async def test_command_trace_is_exported(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    entity = DummyEntity(MockCoordinator(ZeekrTracer(JsonlSpanExporter(DummyHass(), str(path)))))
+
+    await entity.async_lock()
+
+    child, root = read_spans(path)
+    assert root["name"] == "zeekr.command.DummyEntity.async_lock"
+    assert root["parent_id"] is None
+    assert root["attributes"]["vin"] == "VIN1"
+    assert child["name"] == "zeekr.optimistic_write"
+    assert child["parent_id"] == root["span_id"]
+    assert child["trace_id"] == root["trace_id"]
+
+
+@pytest.mark.asyncio
+async def test_failed_command_records_error(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    entity = DummyEntity(MockCoordinator(ZeekrTracer(JsonlSpanExporter(DummyHass(), str(path)))))
+
+    with pytest.raises(ValueError):
+        await entity.async_fail()
+
+    (span,) = read_spans(path)
+    assert span["status"] == "error"
+    assert "boom" in span["error"]
+
+
+def test_root_span_starts_new_trace(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = ZeekrTracer(JsonlSpanExporter(DummyHass(), str(path)))
+
+    with tracer.start_as_current_span("zeekr.command.test"):
+        with tracer.start_as_current_span("zeekr.update", root=True):
+            pass
+
+    update, command = read_spans(path)
+    assert update["parent_id"] is None
+    assert update["trace_id"] != command["trace_id"]
+
+
+def test_concurrent_traces_are_written_apart(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = JsonlSpanExporter(DummyHass(), str(path))
+    tracer = ZeekrTracer(exporter)
+
+    first = tracer.start_as_current_span("zeekr.update", root=True)
+    first_span = first.__enter__()
+    # A second update runs while the first one is still going
+    with tracer.start_as_current_span("zeekr.update", root=True) as second_span:
+        with tracer.start_as_current_span("zeekr.api.get_status"):
+            pass
+    assert {span["trace_id"] for span in read_spans(path)} == {second_span.trace_id}
+    first.__exit__(None, None, None)
+
+    spans = read_spans(path)
+    assert spans[-1]["trace_id"] == first_span.trace_id
+    assert len(spans) == 3
+    assert exporter._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_deferred_span_is_written_after_its_root(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = JsonlSpanExporter(DummyHass(), str(path))
+    tracer = ZeekrTracer(exporter)
+    refresh_due = asyncio.Event()
+
+    async def delayed_refresh():
+        await refresh_due.wait()
+        with tracer.start_as_current_span("zeekr.delayed_refresh"):
+            pass
+
+    # The command schedules a refresh that starts after the command is done
+    with tracer.start_as_current_span("zeekr.command.test") as command:
+        task = asyncio.ensure_future(delayed_refresh())
+    assert [span["name"] for span in read_spans(path)] == ["zeekr.command.test"]
+    refresh_due.set()
+    await task
+
+    spans = read_spans(path)
+    assert spans[-1]["name"] == "zeekr.delayed_refresh"
+    assert spans[-1]["trace_id"] == command.trace_id
+    assert exporter._pending == {}
+    assert exporter._running == {}
+
+
+def test_pending_traces_are_capped(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = JsonlSpanExporter(DummyHass(), str(path))
+    tracer = ZeekrTracer(exporter)
+
+    # Traces whose root never ends, each with one finished child
+    roots = []
+    for _ in range(MAX_PENDING_TRACES + 1):
+        roots.append(tracer.start_as_current_span("zeekr.update", root=True))
+        roots[-1].__enter__()
+        with tracer.start_as_current_span("zeekr.api.get_status"):
+            pass
+
+    assert len(exporter._pending) == MAX_PENDING_TRACES
+    (written,) = read_spans(path)
+    assert written["name"] == "zeekr.api.get_status"
+
+
+def test_trace_file_is_rotated(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = ZeekrTracer(JsonlSpanExporter(DummyHass(), str(path), max_size=200))
+
+    for _ in range(3):
+        with tracer.start_as_current_span("zeekr.update", root=True):
+            pass
+
+    assert (tmp_path / "traces.jsonl.1").exists()
+    assert len(read_spans(path)) < 3
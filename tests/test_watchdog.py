@@ -0,0 +1,41 @@
+from unittest.mock import MagicMock
+from custom_components.zeekr_ev.watchdog import ZeekrWatchdog
+
+
+class DummyEntity:
+    entity_id = "sensor.zeekr_1234_battery_level"
+    vin = "VIN1"
+
+    def update_callback(self):
+        pass
+
+
+def test_watchdog_disabled_records_nothing():
+    watchdog = ZeekrWatchdog(enabled=False, executor_threshold=0)
+    watchdog.record_executor_job("get_status", "VIN1", 100)
+    watchdog.record_entity_update(DummyEntity().update_callback, 100)
+    assert watchdog.total == 0
+
+
+def test_watchdog_counts_slow_executor_jobs():
+    watchdog = ZeekrWatchdog(enabled=True, executor_threshold=5)
+    watchdog.record_executor_job("get_status", "VIN1", 1)
+    watchdog.record_executor_job("get_status", "VIN1", 6)
+    watchdog.record_executor_job("do_remote_control RDL", "VIN1", 7)
+
+    assert watchdog.slow_executor_jobs == 2
+    assert watchdog.slow_calls["get_status (VIN1)"] == 1
+    assert watchdog.as_dict()["slow_calls"]["do_remote_control RDL (VIN1)"] == 1
+
+
+def test_watchdog_counts_slow_entity_updates():
+    watchdog = ZeekrWatchdog(enabled=True, entity_threshold_ms=10)
+    entity = DummyEntity()
+    watchdog.record_entity_update(entity.update_callback, 0.001)
+    watchdog.record_entity_update(entity.update_callback, 0.02)
+    # Callbacks that are not bound to an entity are still counted
+    watchdog.record_entity_update(MagicMock(), 0.02)
+
+    assert watchdog.slow_entity_updates == 2
+    assert watchdog.slow_calls["sensor.zeekr_1234_battery_level"] == 1
+    assert watchdog.total == 2